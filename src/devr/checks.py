@@ -0,0 +1,701 @@
+"""Typer-free helpers for selecting files and running ``devr check`` stages.
+
+``devr.fastcheck`` builds on this module so the pre-commit hot path never pays
+for importing the full command-line interface.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Iterator
+
+from .config import DevrConfig, _tomllib, load_config
+from .venv import find_venv, venv_package_versions, venv_python, venv_script
+
+_GitStatus = list[tuple[str, str]]
+_CheckStage = tuple[str, str, list[str]]
+_StageRunner = Callable[..., int]
+
+_GIT_CACHE_FILE = "devr-cache.json"
+_GIT_TIMEOUT_SECONDS = 10
+_GIT_READ_SIZE = 64 * 1024
+_DMYPY_STATUS_FILE = ".devr-dmypy.json"
+_XDIST_CACHE_FILE = ".devr-xdist.json"
+_PY_SUFFIXES = (".py", ".pyi")
+
+
+def project_root() -> Path:
+    """Return the resolved nearest ancestor directory that looks like a project root."""
+    return _project_root_for(os.getcwd())
+
+
+@lru_cache(maxsize=None)
+def _project_root_for(cwd: str) -> Path:
+    """Walk up from ``cwd`` to the first directory with ``pyproject.toml`` or ``.git``.
+
+    Memoized per working directory so repeated lookups skip the ancestor walk.
+    """
+    start = Path(cwd).resolve()
+
+    for candidate in (start, *start.parents):
+        if (candidate / "pyproject.toml").exists() or (candidate / ".git").exists():
+            return candidate
+
+    return start
+
+
+def _run_git(root: Path, args: list[str]) -> subprocess.CompletedProcess[bytes] | None:
+    """Run a git command and return the completed process (raw bytes) when successful."""
+    try:
+        proc = subprocess.run(
+            ["git", *args],
+            cwd=str(root),
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            timeout=_GIT_TIMEOUT_SECONDS,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if proc.returncode != 0:
+        return None
+    return proc
+
+
+def _git_records(root: Path, args: list[str]) -> Iterator[bytes]:
+    """Yield NUL-separated records from a git command while its output streams in.
+
+    Raises ``OSError`` or ``subprocess.SubprocessError`` when git cannot start,
+    exits non-zero, or exceeds the git timeout.
+    """
+    cmd = ["git", *args]
+    with subprocess.Popen(
+        cmd,
+        cwd=str(root),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    ) as proc:
+        timed_out = threading.Event()
+
+        def _kill() -> None:
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(_GIT_TIMEOUT_SECONDS, _kill)
+        timer.start()
+        try:
+            stdout = proc.stdout
+            if stdout is None:
+                raise subprocess.SubprocessError("git stdout was not captured")
+            pending = b""
+            for chunk in iter(lambda: stdout.read(_GIT_READ_SIZE), b""):
+                *records, pending = (pending + chunk).split(b"\0")
+                yield from records
+            if pending:
+                yield pending
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, _GIT_TIMEOUT_SECONDS)
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+
+def _is_git_repo(root: Path, cache: dict[str, bool] | None = None) -> bool:
+    """Return whether ``root`` is inside a git work tree, with optional caching."""
+    cache_key = str(root)
+    if cache is not None and cache_key in cache:
+        return cache[cache_key]
+
+    # A ``.git`` entry (directory, or file for worktrees and submodules) at the
+    # root settles the question without spawning git.
+    inside_work_tree = (root / ".git").exists() or (
+        _run_git(root, ["rev-parse", "--is-inside-work-tree"]) is not None
+    )
+    if cache is not None:
+        cache[cache_key] = inside_work_tree
+    return inside_work_tree
+
+
+def _git_status(
+    root: Path, cache: dict[str, _GitStatus | None] | None = None
+) -> _GitStatus | None:
+    """Return ``(XY, path)`` entries from one ``git status`` call, or ``None`` on failure."""
+    cache_key = str(root)
+    if cache is not None and cache_key in cache:
+        return cache[cache_key]
+
+    # Records are parsed as git streams them, and each path is decoded with
+    # ``os.fsdecode`` so non-UTF-8 names round-trip to the filesystem unchanged.
+    entries: _GitStatus | None
+    parsed: _GitStatus = []
+    records = _git_records(
+        root, ["status", "--porcelain=v1", "-z", "--untracked-files=all"]
+    )
+    try:
+        for record in records:
+            if len(record) < 4:
+                continue
+            status = record[:2].decode("ascii", "replace")
+            if "R" in status or "C" in status:
+                # Renames and copies are followed by their original path.
+                next(records, None)
+            parsed.append((status, os.fsdecode(record[3:])))
+        entries = parsed
+    except (OSError, subprocess.SubprocessError):
+        entries = None
+
+    if cache is not None:
+        cache[cache_key] = entries
+    return entries
+
+
+def _git_state_key(git_dir: Path) -> list[object] | None:
+    """Fingerprint the git index and HEAD so cached listings can be invalidated."""
+    try:
+        index = (git_dir / "index").stat()
+        head = (git_dir / "HEAD").read_bytes().strip()
+    except OSError:
+        return None
+
+    key: list[object] = [index.st_mtime_ns, index.st_size, os.fsdecode(head)]
+    if head.startswith(b"ref: "):
+        # Commits move the branch ref without touching HEAD itself.
+        ref = git_dir / os.fsdecode(head[5:])
+        try:
+            key.append(os.fsdecode(ref.read_bytes().strip()))
+        except OSError:
+            try:
+                key.append((git_dir / "packed-refs").stat().st_mtime_ns)
+            except OSError:
+                key.append(None)
+    return key
+
+
+def _cached_git_files(
+    root: Path,
+    kind: str,
+    compute: Callable[[], list[str] | None],
+) -> list[str] | None:
+    """Return a git file listing from ``.git/devr-cache.json`` or compute and store it.
+
+    Entries are keyed on the index and HEAD state, so only listings that depend
+    solely on those (such as staged files) may be cached here.
+    """
+    git_dir = root / ".git"
+    state = _git_state_key(git_dir) if git_dir.is_dir() else None
+    if state is None:
+        return compute()
+
+    import json  # Deferred: only the staged-files cache needs it.
+
+    cache_path = git_dir / _GIT_CACHE_FILE
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cached = {}
+    if not isinstance(cached, dict):
+        cached = {}
+
+    entry = cached.get(kind)
+    if (
+        isinstance(entry, dict)
+        and entry.get("key") == state
+        and isinstance(entry.get("files"), list)
+    ):
+        return [str(path) for path in entry["files"]]
+
+    files = compute()
+    if files is None or _git_state_key(git_dir) != state:
+        # Skip storing when git rewrote the index underneath us (e.g. a refresh).
+        return files
+
+    cached[kind] = {"key": state, "files": files}
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(cached), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # The cache is an optimisation only; never fail a run over it.
+        tmp_path.unlink(missing_ok=True)
+    return files
+
+
+def _staged_files(
+    root: Path, status_cache: dict[str, _GitStatus | None] | None = None
+) -> list[str]:
+    """Return staged file paths from git, or an empty list on command failure."""
+
+    def _from_status() -> list[str] | None:
+        entries = _git_status(root, status_cache)
+        if entries is None:
+            return None
+        return list(
+            dict.fromkeys(path for status, path in entries if status[0] not in " ?!")
+        )
+
+    return _cached_git_files(root, "staged", _from_status) or []
+
+
+def _changed_files(
+    root: Path, status_cache: dict[str, _GitStatus | None] | None = None
+) -> list[str]:
+    """Return changed and untracked file paths from git, or an empty list on failure."""
+    entries = _git_status(root, status_cache)
+    if entries is None:
+        return []
+    return list(dict.fromkeys(path for status, path in entries if status != "!!"))
+
+
+def _filter_py(files: list[str]) -> list[str]:
+    """Filter file paths down to Python source and typing stub files."""
+    return [f for f in files if f.endswith(_PY_SUFFIXES)]
+
+
+def _existing_files(root: Path, files: list[str]) -> list[str]:
+    """Return only file paths that currently exist under ``root``.
+
+    Paths that resolve outside ``root`` through a symlinked file or directory
+    are rejected. Each distinct parent directory is resolved once, so only
+    files that are themselves symlinks pay for their own ``realpath``.
+    """
+    root_str = str(root.resolve())
+    prefix = root_str.rstrip(os.sep) + os.sep
+    resolved_dirs: dict[str, str] = {}
+    existing: list[str] = []
+    for file in files:
+        path = os.path.normpath(os.path.join(root_str, file))
+        parent, name = os.path.split(path)
+        real_parent = resolved_dirs.get(parent)
+        if real_parent is None:
+            real_parent = resolved_dirs[parent] = os.path.realpath(parent)
+        if os.path.islink(path):
+            path = os.path.realpath(path)
+        else:
+            path = os.path.join(real_parent, name)
+        if not path.startswith(prefix):
+            continue
+
+        if os.path.isfile(path):
+            existing.append(file)
+    return existing
+
+
+def _canonical_py_files(root: Path, files: list[str]) -> list[str]:
+    """Return existing Python files from ``files``, deduplicated and sorted once.
+
+    Every stage receives the same canonical list, so tools do no redundant
+    path work and output ordering is stable between runs.
+    """
+    return sorted(set(_existing_files(root, _filter_py(files))))
+
+
+def _command_summary(module: str, args: list[str]) -> str:
+    """Return a printable ``Running:`` line for a tool invocation.
+
+    Paths from git may hold surrogate escapes for non-UTF-8 bytes; those are
+    shown as replacement characters rather than failing to print.
+    """
+    line = f"Running: {module} {' '.join(args)}"
+    return line.encode("utf-8", "surrogateescape").decode("utf-8", "replace")
+
+
+def _stage_header(stage_name: str, module: str, args: list[str]) -> str:
+    """Return the ``Stage:`` and ``Running:`` lines for a stage as one write."""
+    return f"Stage: {stage_name}\n{_command_summary(module, args)}"
+
+
+def _typecheck_targets(scoped: bool, files: list[str]) -> list[str]:
+    """Return type-check targets, scoping to the selected files when requested."""
+    if not scoped:
+        return ["."]
+    return files
+
+
+def _coverage_targets(root: Path, targets: tuple[str, ...]) -> list[str]:
+    """Return coverage source targets, preferring ``src/`` over the whole tree."""
+    if targets:
+        return list(targets)
+    return ["src"] if (root / "src").is_dir() else ["."]
+
+
+def _mypy_follow_imports(root: Path) -> str | None:
+    """Return the global ``follow_imports`` setting from the project's mypy config.
+
+    Config files are consulted in mypy's own precedence order and only the
+    first one that carries a mypy section counts.
+    """
+    import configparser  # Deferred: only opt-in daemon runs read mypy config.
+
+    for name in ("mypy.ini", ".mypy.ini", "pyproject.toml", "setup.cfg"):
+        path = root / name
+        if not path.is_file():
+            continue
+        if name == "pyproject.toml":
+            try:
+                data = _tomllib().loads(path.read_text(encoding="utf-8"))
+            except (OSError, UnicodeDecodeError, ValueError):
+                continue
+            tool = data.get("tool")
+            section = tool.get("mypy") if isinstance(tool, dict) else None
+            if not isinstance(section, dict):
+                continue
+            value = section.get("follow_imports")
+            return value if isinstance(value, str) else None
+        parser = configparser.ConfigParser()
+        try:
+            parser.read(path, encoding="utf-8")
+        except (configparser.Error, UnicodeDecodeError):
+            continue
+        if parser.has_section("mypy"):
+            return parser.get("mypy", "follow_imports", fallback=None)
+    return None
+
+
+def _mypy_daemon_status_file(root: Path, venv_dir: Path) -> Path | None:
+    """Return the dmypy status file for ``venv_dir``, or ``None`` to use plain mypy.
+
+    ``dmypy`` refuses to start with ``follow_imports = silent``, so projects
+    that configure it keep running plain mypy.
+    """
+    if not venv_script(venv_dir, "dmypy").exists():
+        return None
+    follow_imports = _mypy_follow_imports(root)
+    if follow_imports is not None and follow_imports.strip() == "silent":
+        return None
+    return venv_dir / _DMYPY_STATUS_FILE
+
+
+def _check_stages(
+    cfg: DevrConfig,
+    files: list[str],
+    scoped: bool,
+    fix: bool,
+    mypy_daemon: Path | None = None,
+) -> list[_CheckStage]:
+    """Plan the lint, format, and type-check stages for a ``check`` run.
+
+    Full-tree mypy runs go through the ``dmypy`` daemon tracked by the
+    ``mypy_daemon`` status file when one is given. Raises ``ValueError`` when
+    the configured formatter or typechecker is unknown.
+    """
+    stages: list[_CheckStage] = []
+    lint_target = files if scoped else ["."]
+    if cfg.formatter == "ruff":
+        if fix:
+            stages.append(
+                ("ruff check --fix", "ruff", ["check", "--fix", *lint_target])
+            )
+            stages.append(("ruff format", "ruff", ["format", *lint_target]))
+        else:
+            stages.append(("ruff check", "ruff", ["check", *lint_target]))
+            stages.append(
+                ("ruff format --check", "ruff", ["format", "--check", *lint_target])
+            )
+    elif cfg.formatter == "black":
+        # Keep ruff lint, but black for formatting
+        stages.append(("ruff check", "ruff", ["check", *lint_target]))
+        black_args = ["-q"]
+        if not fix:
+            black_args.append("--check")
+        stage_name = "black" if fix else "black --check"
+        stages.append((stage_name, "black", [*black_args, *lint_target]))
+    else:
+        raise ValueError(f"Unknown formatter: {cfg.formatter} (expected ruff or black)")
+
+    typecheck_target = _typecheck_targets(scoped, files)
+    if cfg.typechecker == "mypy" and mypy_daemon is not None and not scoped:
+        # The daemon keeps the module graph warm between runs and starts itself
+        # on first use. It cannot silence followed imports, so scoped runs
+        # below keep using plain mypy.
+        daemon_args = ["--status-file", str(mypy_daemon), "run", "--", "."]
+        stages.append(("dmypy run", "mypy.dmypy", daemon_args))
+    elif cfg.typechecker == "mypy":
+        # Keep scoped runs from reporting errors in unchanged imported modules.
+        mypy_args = ["--follow-imports=silent"] if scoped else []
+        stages.append(("mypy", "mypy", [*mypy_args, *typecheck_target]))
+    elif cfg.typechecker == "pyright":
+        stages.append(("pyright", "pyright", typecheck_target))
+    else:
+        raise ValueError(
+            f"Unknown typechecker: {cfg.typechecker} (expected mypy or pyright)"
+        )
+    return stages
+
+
+def _resolve_configured_venv_path(root: Path, configured_venv_path: str) -> Path:
+    """Resolve the configured venv path relative to ``root`` when needed."""
+    configured_path = Path(configured_venv_path).expanduser()
+    if configured_path.is_absolute():
+        return configured_path.resolve()
+    return (root / configured_path).resolve()
+
+
+@lru_cache(maxsize=4)
+def _venv_path_outside_root_warning(root: str, configured_venv_path: str) -> str | None:
+    """Return the outside-root warning for ``configured_venv_path``, if any."""
+    resolved = _resolve_configured_venv_path(Path(root), configured_venv_path)
+    try:
+        resolved.relative_to(root)
+    except ValueError:
+        return (
+            f"Warning: configured venv_path '{configured_venv_path}' resolves "
+            f"outside project root ({root})."
+        )
+    return None
+
+
+def _venv_install_state(venv_dir: Path) -> list[int] | None:
+    """Fingerprint the venv interpreter and site-packages so installs invalidate it."""
+    try:
+        stamps = [venv_python(venv_dir).stat().st_mtime_ns]
+        for pattern in ("lib/python*/site-packages", "Lib/site-packages"):
+            stamps.extend(
+                sorted(path.stat().st_mtime_ns for path in venv_dir.glob(pattern))
+            )
+    except OSError:
+        return None
+    return stamps
+
+
+def _xdist_available(venv_dir: Path, cfg: DevrConfig) -> bool:
+    """Return whether tests should run in parallel via pytest-xdist in ``venv_dir``.
+
+    The answer is cached in ``<venv>/.devr-xdist.json`` until the interpreter or
+    site-packages changes, so repeated runs skip the venv interpreter probe.
+    """
+    if not cfg.parallel_tests:
+        return False
+
+    state = _venv_install_state(venv_dir)
+    if state is None:
+        versions = venv_package_versions(venv_dir, ["pytest-xdist"])
+        return bool(versions and versions["pytest-xdist"])
+
+    import json  # Deferred: only the xdist probe cache needs it.
+
+    cache_path = venv_dir / _XDIST_CACHE_FILE
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cached = None
+    if (
+        isinstance(cached, dict)
+        and cached.get("key") == state
+        and isinstance(cached.get("available"), bool)
+    ):
+        return cached["available"]
+
+    versions = venv_package_versions(venv_dir, ["pytest-xdist"])
+    if versions is None:
+        return False
+    available = bool(versions["pytest-xdist"])
+
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(
+            json.dumps({"key": state, "available": available}), encoding="utf-8"
+        )
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # The cache is an optimisation only; never fail a run over it.
+        tmp_path.unlink(missing_ok=True)
+    return available
+
+
+def _pytest_args(root: Path, cfg: DevrConfig, parallel: bool = False) -> list[str]:
+    """Return pytest arguments that enforce the configured coverage threshold.
+
+    ``parallel`` spreads tests across CPU cores with pytest-xdist; pytest-cov
+    combines the per-worker coverage data before reporting.
+    """
+    cov_args = [
+        *(
+            f"--cov={target}"
+            for target in _coverage_targets(root, cfg.coverage_targets)
+        ),
+        "--cov-report=term-missing",
+        f"--cov-fail-under={cfg.coverage_min}",
+    ]
+    if cfg.coverage_branch:
+        cov_args.insert(-2, "--cov-branch")
+    if parallel:
+        cov_args[:0] = ["-n", "auto"]
+    return cov_args
+
+
+def _run_stages(
+    venv_dir: Path,
+    stages: list[_CheckStage],
+    root: Path,
+    *,
+    run: _StageRunner,
+    echo: Callable[..., None],
+    concurrent: bool = True,
+) -> int:
+    """Run check stages and report them in plan order.
+
+    Concurrent runs report the first failing stage (in plan order); serial
+    runs stop at the first failure.
+    """
+    if concurrent and len(stages) > 1:
+        codes = _run_concurrently(venv_dir, stages, root, run=run, echo=echo)
+        return next((code for code in codes if code != 0), 0)
+
+    for stage_name, module, args in stages:
+        echo(_stage_header(stage_name, module, args))
+        code = run(venv_dir, module, args, cwd=root)
+        if code != 0:
+            return code
+    return 0
+
+
+def _run_concurrently(
+    venv_dir: Path,
+    stages: list[_CheckStage],
+    root: Path,
+    *,
+    run: _StageRunner,
+    echo: Callable[..., None],
+) -> list[int]:
+    """Run independent stages in parallel and return their exit codes in plan order.
+
+    Each stage writes into its own temporary file so tool output is never
+    interleaved; buffered output is replayed in plan order.
+    """
+    with ExitStack() as stack:
+        outputs = [stack.enter_context(tempfile.TemporaryFile()) for _ in stages]
+        pool = stack.enter_context(ThreadPoolExecutor(max_workers=len(stages)))
+        futures = [
+            pool.submit(run, venv_dir, module, args, cwd=root, output=output)
+            for (_, module, args), output in zip(stages, outputs)
+        ]
+
+        codes: list[int] = []
+        for (stage_name, module, args), future, output in zip(stages, futures, outputs):
+            codes.append(future.result())
+            echo(_stage_header(stage_name, module, args))
+            output.seek(0)
+            captured = output.read()
+            if captured:
+                echo(captured.decode(errors="replace"), nl=False)
+    return codes
+
+
+def run_check(
+    root: Path,
+    *,
+    changed: bool,
+    staged: bool,
+    fast: bool,
+    no_tests: bool,
+    fix: bool,
+    all_files: bool,
+    no_daemon: bool,
+    run: _StageRunner,
+    echo: Callable[..., None],
+) -> int:
+    """Run the ``devr check`` gate for ``root`` and return its exit code.
+
+    Shared by the Typer ``check`` command and the ``devr-fastcheck`` hook entry
+    point; ``run`` launches tools and ``echo`` writes user-facing output.
+    """
+    full_tree = all_files or os.environ.get("DEVR_FULL") == "1"
+    if full_tree and changed:
+        echo("Warning: --changed is ignored when --all or DEVR_FULL=1 is set.")
+        changed = False
+
+    if staged and not changed:
+        echo("Warning: --staged has no effect without --changed.")
+
+    git_repo_cache: dict[str, bool] = {}
+    git_status_cache: dict[str, _GitStatus | None] = {}
+
+    files: list[str] = []
+    if changed:
+        # Changed mode only needs git, so settle it before config and venv lookup.
+        changed_candidates = (
+            _staged_files(root, git_status_cache)
+            if staged
+            else _changed_files(root, git_status_cache)
+        )
+        files = _canonical_py_files(root, changed_candidates)
+        if not changed_candidates and not _is_git_repo(root, git_repo_cache):
+            echo(
+                "Warning: unable to read git state; --changed mode found no file targets."
+            )
+        if not files:
+            # Nothing Python-related changed, so every later stage would be moot.
+            echo(
+                "No changed Python files detected; "
+                "skipping lint/format, type checks, and tests."
+            )
+            return 0
+
+    cfg = load_config(root)
+    warning = _venv_path_outside_root_warning(str(root), cfg.venv_path)
+    if warning is not None:
+        echo(warning)
+
+    if not changed and cfg.changed_only and not full_tree:
+        files = _canonical_py_files(root, _changed_files(root, git_status_cache))
+        if files:
+            echo(
+                f"Scoping checks to {len(files)} changed Python file(s); "
+                "use --all for a full run."
+            )
+
+    venv_dir = find_venv(root, cfg.venv_path)
+    if venv_dir is None:
+        echo("No venv found. Run: devr init")
+        return 2
+
+    echo(f"Using venv: {venv_dir}")
+
+    # Scoped runs only check the selected files; otherwise the whole tree.
+    scoped = changed or bool(files)
+
+    # 1) Format / lint, 2) Type checking
+    mypy_daemon = None
+    if cfg.mypy_daemon and not no_daemon and not scoped:
+        mypy_daemon = _mypy_daemon_status_file(root, venv_dir)
+    try:
+        stages = _check_stages(cfg, files, scoped, fix, mypy_daemon)
+    except ValueError as exc:
+        echo(str(exc))
+        return 2
+
+    # Fixes rewrite files that later stages read, so only read-only runs overlap.
+    code = _run_stages(venv_dir, stages, root, run=run, echo=echo, concurrent=not fix)
+    if code != 0:
+        return code
+
+    # 3) Tests + coverage
+    if cfg.run_tests and not fast and not no_tests:
+        pytest_args = _pytest_args(root, cfg, _xdist_available(venv_dir, cfg))
+        code = _run_stages(
+            venv_dir,
+            [("pytest", "pytest", pytest_args)],
+            root,
+            run=run,
+            echo=echo,
+            concurrent=False,
+        )
+        if code != 0:
+            return code
+    elif no_tests:
+        echo("Skipping tests (--no-tests).")
+    elif fast:
+        echo("Skipping tests (--fast).")
+
+    echo("✅ devr check passed")
+    return 0
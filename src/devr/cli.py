@@ -2,17 +2,69 @@
 
 from __future__ import annotations
 
-import subprocess
+import hashlib
+import os
+import re
+import shlex
+import shutil
 import sys
-from importlib.metadata import PackageNotFoundError, version
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import typer
 
-from .config import load_config
-from .templates import DEFAULT_TOOLCHAIN, PRECOMMIT_LOCAL_HOOK_YAML
-from .venv import create_venv, find_venv, is_inside_venv, run_module, venv_python
+from .checks import (
+    _command_summary,
+    _filter_py,
+    _git_status,
+    _is_git_repo,
+    _resolve_configured_venv_path,
+    _run_concurrently,
+    _run_git,
+    _venv_path_outside_root_warning,
+    project_root,
+    run_check,
+)
+from .config import DevrConfig, load_config
+from .templates import (
+    BOOTSTRAP_MIN_VERSIONS,
+    DEFAULT_TOOLCHAIN,
+    PRECOMMIT_LOCAL_HOOK_YAML,
+)
+from .venv import (
+    create_venv,
+    find_venv,
+    is_inside_venv,
+    run_module,
+    uv_pip_install,
+    venv_package_versions,
+    venv_python,
+)
+
+_TOOLCHAIN_STAMP = ".devr-toolchain.stamp"
+_TOOLCHAIN_STAMP_TTL_SECONDS = 24 * 60 * 60
+_SECURITY_CACHE_FILE = ".devr-security.json"
+# Advisory databases change independently of the project, so clean
+# pip-audit results are only trusted for a day.
+_PIP_AUDIT_CACHE_TTL_SECONDS = 24 * 60 * 60
+_PRECOMMIT_HOOK_MARKER = "# File generated by pre-commit: https://pre-commit.com"
+_PIP_QUIET_ARGS = ["--disable-pip-version-check", "--no-input"]
+_BANDIT_EXCLUDES = (
+    ".venv",
+    "venv",
+    "env",
+    ".git",
+    "__pycache__",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+    ".tox",
+    ".nox",
+    "build",
+    "dist",
+)
 
 app = typer.Typer(
     add_completion=False,
@@ -20,20 +72,27 @@ app = typer.Typer(
 )
 
 
-def _echo_with_fallback(primary: str, fallback: str | None = None) -> None:
+def _echo_with_fallback(
+    primary: str, fallback: str | None = None, nl: bool = True
+) -> None:
     """Echo ``primary`` and gracefully fall back when the terminal cannot encode it."""
     try:
-        typer.echo(primary)
+        typer.echo(primary, nl=nl)
     except UnicodeEncodeError:
         typer.echo(
             fallback
             if fallback is not None
-            else primary.encode("ascii", "replace").decode("ascii")
+            else primary.encode("ascii", "replace").decode("ascii"),
+            nl=nl,
         )
 
 
+@lru_cache(maxsize=None)
 def _devr_version() -> str:
     """Return the installed package version or a local fallback version."""
+    # Deferred: scanning dist-info metadata is only needed for ``--version``.
+    from importlib.metadata import PackageNotFoundError, version
+
     try:
         return version("devr")
     except PackageNotFoundError:
@@ -61,39 +120,19 @@ def main(
     del version_flag
 
 
-def project_root() -> Path:
-    """Return the nearest ancestor directory that looks like a project root."""
-    cwd = Path.cwd().resolve()
-
-    for candidate in (cwd, *cwd.parents):
-        if (candidate / "pyproject.toml").exists() or (candidate / ".git").exists():
-            return candidate
-
-    return cwd
+def _load_project() -> tuple[Path, DevrConfig]:
+    """Return the resolved project root and its config, warning about odd venv paths."""
+    root = project_root()
+    cfg = load_config(root)
+    _warn_if_venv_path_outside_root(root, cfg.venv_path)
+    return root, cfg
 
 
 def _warn_if_venv_path_outside_root(root: Path, configured_venv_path: str) -> None:
-    """Warn when configured venv path resolves outside the current project root."""
-    configured_path = Path(configured_venv_path).expanduser()
-    resolved = (
-        configured_path.resolve()
-        if configured_path.is_absolute()
-        else (root / configured_path).resolve()
-    )
-    try:
-        resolved.relative_to(root.resolve())
-    except ValueError:
-        typer.echo(
-            f"Warning: configured venv_path '{configured_venv_path}' resolves outside project root ({root})."
-        )
-
-
-def _resolve_configured_venv_path(root: Path, configured_venv_path: str) -> Path:
-    """Resolve the configured venv path relative to ``root`` when needed."""
-    configured_path = Path(configured_venv_path).expanduser()
-    if configured_path.is_absolute():
-        return configured_path.resolve()
-    return (root / configured_path).resolve()
+    """Warn when configured venv path resolves outside the (resolved) project root."""
+    warning = _venv_path_outside_root_warning(str(root), configured_venv_path)
+    if warning is not None:
+        typer.echo(warning)
 
 
 def _detect_venv_resolution(
@@ -117,18 +156,109 @@ def _detect_venv_resolution(
     return None, "none"
 
 
+def _version_tuple(value: str) -> tuple[int, ...]:
+    """Return the leading numeric release components of a version string."""
+    match = re.match(r"\d+(?:\.\d+)*", value)
+    return tuple(int(part) for part in match.group().split(".")) if match else ()
+
+
+def _toolchain_digest() -> str:
+    """Fingerprint the toolchain and packaging-tool requirements devr installs."""
+    spec = "\n".join(
+        [*DEFAULT_TOOLCHAIN, *map("=".join, BOOTSTRAP_MIN_VERSIONS.items())]
+    )
+    return hashlib.sha256(spec.encode("utf-8")).hexdigest()
+
+
+def _toolchain_names() -> list[str]:
+    """Return the distribution names of the requirements in ``DEFAULT_TOOLCHAIN``."""
+    return [re.split(r"[\s<>=!~\[;]", req, maxsplit=1)[0] for req in DEFAULT_TOOLCHAIN]
+
+
+def _toolchain_stamp_is_current(venv_dir: Path) -> bool:
+    """Return whether this toolchain was installed within a day and is still present.
+
+    The stamp alone cannot tell when a tool was uninstalled since, so every
+    toolchain distribution must also still be installed in ``venv_dir``.
+    """
+    stamp = venv_dir / _TOOLCHAIN_STAMP
+    try:
+        fresh = time.time() - stamp.stat().st_mtime < _TOOLCHAIN_STAMP_TTL_SECONDS
+        if not fresh or stamp.read_text(encoding="utf-8") != _toolchain_digest():
+            return False
+    except OSError:
+        return False
+    names = _toolchain_names()
+    versions = venv_package_versions(venv_dir, names)
+    return versions is not None and all(versions.get(name) for name in names)
+
+
+def _bootstrap_is_current(venv_dir: Path) -> bool:
+    """Return whether pip/setuptools/wheel in ``venv_dir`` meet the minimum versions."""
+    versions = venv_package_versions(venv_dir, list(BOOTSTRAP_MIN_VERSIONS))
+    if versions is None:
+        return False
+    return all(
+        versions.get(name) and _version_tuple(versions[name]) >= _version_tuple(floor)
+        for name, floor in BOOTSTRAP_MIN_VERSIONS.items()
+    )
+
+
+def _write_toolchain_stamp(venv_dir: Path) -> None:
+    """Record that the current toolchain was just installed into ``venv_dir``."""
+    try:
+        (venv_dir / _TOOLCHAIN_STAMP).write_text(_toolchain_digest(), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def _uv_executable() -> Optional[str]:
+    """Return the ``uv`` executable on ``PATH`` unless ``DEVR_NO_UV=1`` is set."""
+    if os.environ.get("DEVR_NO_UV") == "1":
+        return None
+    return shutil.which("uv")
+
+
+def _pip_install(venv_dir: Path, args: list[str], root: Path) -> int:
+    """Install packages into ``venv_dir``, preferring ``uv pip`` when available.
+
+    uv resolves, downloads, and installs in parallel without importing pip.
+    """
+    uv = _uv_executable()
+    if uv is not None:
+        return uv_pip_install(venv_dir, uv, args, cwd=root)
+    return run_module(venv_dir, "pip", ["install", *_PIP_QUIET_ARGS, *args], cwd=root)
+
+
 def ensure_toolchain(venv_dir: Path, root: Path) -> None:
     """Install and/or upgrade required development tools inside ``venv_dir``."""
-    # Upgrade pip basics
-    code = run_module(
-        venv_dir, "pip", ["install", "-U", "pip", "setuptools", "wheel"], cwd=root
-    )
-    if code != 0:
-        raise typer.Exit(code=code)
-    # Install toolchain
-    code = run_module(venv_dir, "pip", ["install", *DEFAULT_TOOLCHAIN], cwd=root)
+    # Packaging tools and the toolchain go through a single resolver pass.
+    install_args: list[str] = []
+    bootstrap: list[str] = []
+    if os.environ.get("DEVR_REFRESH_TOOLCHAIN") == "1":
+        install_args.append("-U")
+        bootstrap = list(BOOTSTRAP_MIN_VERSIONS)
+    elif _toolchain_stamp_is_current(venv_dir):
+        typer.echo("Dev toolchain was installed recently; skipping install.")
+        return
+    elif _bootstrap_is_current(venv_dir):
+        typer.echo("pip, setuptools, and wheel are up to date; skipping upgrade.")
+    else:
+        bootstrap = [
+            f"{name}>={floor}" for name, floor in BOOTSTRAP_MIN_VERSIONS.items()
+        ]
+
+    code = _pip_install(venv_dir, [*install_args, *bootstrap, *DEFAULT_TOOLCHAIN], root)
+    if code != 0 and bootstrap:
+        # pip can fail to replace itself mid-install (notably on Windows);
+        # retry with the packaging tools upgraded on their own first.
+        typer.echo("Combined install failed; retrying packaging tools separately.")
+        code = _pip_install(venv_dir, [*install_args, *bootstrap], root)
+        if code == 0:
+            code = _pip_install(venv_dir, [*install_args, *DEFAULT_TOOLCHAIN], root)
     if code != 0:
         raise typer.Exit(code=code)
+    _write_toolchain_stamp(venv_dir)
 
 
 def install_project(venv_dir: Path, root: Path) -> None:
@@ -138,12 +268,12 @@ def install_project(venv_dir: Path, root: Path) -> None:
 
     if pyproject.exists():
         # Best default: editable install. If it fails, fall back to non-editable.
-        code = run_module(venv_dir, "pip", ["install", "-e", "."], cwd=root)
+        code = _pip_install(venv_dir, ["-e", "."], root)
         if code != 0:
             typer.echo(
                 "Editable install failed; trying non-editable install (pip install .)"
             )
-            fallback_code = run_module(venv_dir, "pip", ["install", "."], cwd=root)
+            fallback_code = _pip_install(venv_dir, ["."], root)
             if fallback_code != 0:
                 typer.echo(
                     "Warning: project install failed; continuing without installed project dependencies."
@@ -151,9 +281,7 @@ def install_project(venv_dir: Path, root: Path) -> None:
         return
 
     if reqs.exists():
-        code = run_module(
-            venv_dir, "pip", ["install", "-r", "requirements.txt"], cwd=root
-        )
+        code = _pip_install(venv_dir, ["-r", "requirements.txt"], root)
         if code != 0:
             typer.echo(
                 "Warning: requirements install failed; continuing without installed project dependencies."
@@ -170,13 +298,43 @@ def write_precommit(root: Path) -> None:
     path = root / ".pre-commit-config.yaml"
     if path.exists():
         typer.echo(".pre-commit-config.yaml already exists; leaving it unchanged.")
-        typer.echo("Tip: add a local hook that runs: devr check --staged --changed")
+        typer.echo("Tip: add a local hook that runs: devr-fastcheck --staged --changed")
         return
     path.write_text(PRECOMMIT_LOCAL_HOOK_YAML, encoding="utf-8")
 
 
+def _precommit_hook_is_current(venv_dir: Path, root: Path) -> bool:
+    """Return whether the git hook was installed by pre-commit from ``venv_dir``."""
+    hook = root / ".git" / "hooks" / "pre-commit"
+    try:
+        content = hook.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return False
+    if _PRECOMMIT_HOOK_MARKER not in content:
+        return False
+
+    for line in content.splitlines():
+        if line.startswith("INSTALL_PYTHON="):
+            try:
+                install_python = shlex.split(line[len("INSTALL_PYTHON=") :])
+            except ValueError:
+                return False
+            if len(install_python) != 1:
+                return False
+            # pre-commit records ``sys.executable``, which may be python3.X.
+            installed = Path(install_python[0])
+            return (
+                installed.parent == venv_python(venv_dir).parent and installed.exists()
+            )
+    return False
+
+
 def install_precommit_hook(venv_dir: Path, root: Path) -> None:
     """Install the local git pre-commit hook via ``pre_commit install``."""
+    if _precommit_hook_is_current(venv_dir, root):
+        typer.echo("pre-commit hook is already installed; skipping.")
+        return
+
     if _run_git(root, ["rev-parse", "--is-inside-work-tree"]) is None:
         typer.echo("No git repository found; skipping pre-commit hook install.")
         return
@@ -202,9 +360,7 @@ def init(
     - install project deps (pip install -e . when pyproject.toml exists)
     - generate pre-commit config (if missing) + install hook
     """
-    root = project_root()
-    cfg = load_config(root)
-    _warn_if_venv_path_outside_root(root, cfg.venv_path)
+    root, cfg = _load_project()
 
     venv_dir = find_venv(root, cfg.venv_path)
     if venv_dir is None:
@@ -231,102 +387,6 @@ def init(
     typer.echo("Done. Try: devr check")
 
 
-def _staged_files(root: Path) -> list[str]:
-    """Return staged file paths from git, or an empty list on command failure."""
-    proc = _run_git(root, ["diff", "--name-only", "--cached"])
-    if proc is None:
-        return []
-    return [line.strip() for line in proc.stdout.splitlines() if line.strip()]
-
-
-def _run_git(root: Path, args: list[str]) -> subprocess.CompletedProcess[str] | None:
-    """Run a git command and return the completed process when successful."""
-    try:
-        proc = subprocess.run(
-            ["git", *args],
-            cwd=str(root),
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-    except (OSError, subprocess.TimeoutExpired):
-        return None
-    if proc.returncode != 0:
-        return None
-    return proc
-
-
-def _is_git_repo(root: Path, cache: Optional[dict[str, bool]] = None) -> bool:
-    """Return whether ``root`` is inside a git work tree, with optional caching."""
-    cache_key = str(root.resolve())
-    if cache is not None and cache_key in cache:
-        return cache[cache_key]
-
-    inside_work_tree = (
-        _run_git(root, ["rev-parse", "--is-inside-work-tree"]) is not None
-    )
-    if cache is not None:
-        cache[cache_key] = inside_work_tree
-    return inside_work_tree
-
-
-def _changed_files(
-    root: Path, git_repo_cache: Optional[dict[str, bool]] = None
-) -> list[str]:
-    """Return changed and untracked file paths from git, or an empty list on failure."""
-    tracked = _run_git(root, ["diff", "--name-only", "HEAD"])
-    if tracked is None:
-        unstaged = _run_git(root, ["diff", "--name-only"])
-        staged = _run_git(root, ["diff", "--name-only", "--cached"])
-        if unstaged is None and staged is None:
-            return []
-        fallback_lines = []
-        if unstaged is not None:
-            fallback_lines.extend(unstaged.stdout.splitlines())
-        if staged is not None:
-            fallback_lines.extend(staged.stdout.splitlines())
-        tracked_lines = [line.strip() for line in fallback_lines if line.strip()]
-    else:
-        tracked_lines = tracked.stdout.splitlines()
-
-    if not tracked_lines and not _is_git_repo(root, git_repo_cache):
-        return []
-
-    untracked = _run_git(root, ["ls-files", "--others", "--exclude-standard"])
-    if untracked is None:
-        untracked_lines: list[str] = []
-    else:
-        untracked_lines = untracked.stdout.splitlines()
-
-    combined = [
-        line.strip() for line in [*tracked_lines, *untracked_lines] if line.strip()
-    ]
-    return list(dict.fromkeys(combined))
-
-
-def _filter_py(files: list[str]) -> list[str]:
-    """Filter file paths down to Python source and typing stub files."""
-    return [f for f in files if f.endswith(".py") or f.endswith(".pyi")]
-
-
-def _existing_files(root: Path, files: list[str]) -> list[str]:
-    """Return only file paths that currently exist under ``root``."""
-    root_resolved = root.resolve()
-    existing: list[str] = []
-    for file in files:
-        candidate = Path(file)
-        path = candidate if candidate.is_absolute() else root / candidate
-        try:
-            resolved = path.resolve()
-            resolved.relative_to(root_resolved)
-        except ValueError:
-            continue
-
-        if resolved.is_file():
-            existing.append(file)
-    return existing
-
-
 def _run_or_exit(venv_dir: Path, module: str, args: list[str], root: Path) -> None:
     """Run a module command and exit with its code when the command fails."""
     code = _run_with_summary(venv_dir, module, args, root)
@@ -336,29 +396,10 @@ def _run_or_exit(venv_dir: Path, module: str, args: list[str], root: Path) -> No
 
 def _run_with_summary(venv_dir: Path, module: str, args: list[str], root: Path) -> int:
     """Print a short command summary and execute the module."""
-    typer.echo(f"Running: {module} {' '.join(args)}")
+    typer.echo(_command_summary(module, args))
     return run_module(venv_dir, module, args, cwd=root)
 
 
-def _run_check_stage(
-    venv_dir: Path,
-    module: str,
-    args: list[str],
-    root: Path,
-    stage_name: str,
-) -> int:
-    """Print a check-stage header, then execute the command."""
-    typer.echo(f"Stage: {stage_name}")
-    return _run_with_summary(venv_dir, module, args, root)
-
-
-def _typecheck_targets(changed: bool, files: list[str]) -> list[str]:
-    """Return type-check targets, scoping to changed files when requested."""
-    if not changed:
-        return ["."]
-    return files
-
-
 def _bandit_excludes(root: Path, configured_venv_path: str, venv_dir: Path) -> str:
     """Build a comma-separated exclusion list for bandit scans."""
 
@@ -369,23 +410,9 @@ def _bandit_excludes(root: Path, configured_venv_path: str, venv_dir: Path) -> s
             normalized = normalized[2:]
         return normalized.rstrip("/")
 
-    excludes: list[str] = [
-        _normalize_exclude_path(configured_venv_path),
-        ".venv",
-        "venv",
-        "env",
-        ".git",
-        "__pycache__",
-        ".mypy_cache",
-        ".pytest_cache",
-        ".ruff_cache",
-        ".tox",
-        ".nox",
-        "build",
-        "dist",
-    ]
+    excludes = [_normalize_exclude_path(configured_venv_path), *_BANDIT_EXCLUDES]
     try:
-        rel_venv = venv_dir.resolve().relative_to(root.resolve())
+        rel_venv = venv_dir.resolve().relative_to(root)
         excludes.append(_normalize_exclude_path(rel_venv.as_posix()))
     except ValueError:
         # Active environment can be outside the project root; keep default exclusions.
@@ -413,184 +440,39 @@ def check(
     no_tests: bool = typer.Option(
         False, "--no-tests", help="Skip running tests regardless of config settings."
     ),
+    all_files: bool = typer.Option(
+        False,
+        "--all",
+        help="Check the full tree, ignoring --changed and changed_only scoping.",
+    ),
+    no_daemon: bool = typer.Option(
+        False, "--no-daemon", help="Run plain mypy even when mypy_daemon is enabled."
+    ),
 ) -> None:
     """
     Run the full preflight gate inside the project venv:
     ruff lint + format check + typecheck + pytest + coverage threshold.
     """
-    root = project_root()
-    cfg = load_config(root)
-    _warn_if_venv_path_outside_root(root, cfg.venv_path)
-
-    if staged and not changed:
-        typer.echo("Warning: --staged has no effect without --changed.")
-
-    venv_dir = find_venv(root, cfg.venv_path)
-    if venv_dir is None:
-        typer.echo("No venv found. Run: devr init")
-        raise typer.Exit(code=2)
-
-    typer.echo(f"Using venv: {venv_dir}")
-
-    git_repo_cache: dict[str, bool] = {}
-
-    files: list[str] = []
-    if changed:
-        changed_candidates = (
-            _staged_files(root) if staged else _changed_files(root, git_repo_cache)
-        )
-        files = _existing_files(root, _filter_py(changed_candidates))
-        if not changed_candidates and not _is_git_repo(root, git_repo_cache):
-            typer.echo(
-                "Warning: unable to read git state; --changed mode found no file targets."
-            )
-
-    # 1) Format / lint
-    if cfg.formatter == "ruff":
-        if fix:
-            fix_target = files if changed else ["."]
-            if fix_target:
-                code = _run_check_stage(
-                    venv_dir,
-                    "ruff",
-                    ["check", "--fix", *fix_target],
-                    root,
-                    "ruff check --fix",
-                )
-                if code != 0:
-                    raise typer.Exit(code=code)
-
-                code = _run_check_stage(
-                    venv_dir,
-                    "ruff",
-                    ["format", *fix_target],
-                    root,
-                    "ruff format",
-                )
-                if code != 0:
-                    raise typer.Exit(code=code)
-            else:
-                typer.echo("No changed Python files detected; skipping lint/format.")
-        else:
-            # Lint (optionally scoped)
-            lint_target = files if changed else ["."]
-            if lint_target:
-                code = _run_check_stage(
-                    venv_dir,
-                    "ruff",
-                    ["check", *lint_target],
-                    root,
-                    "ruff check",
-                )
-                if code != 0:
-                    raise typer.Exit(code=code)
-                # Format check
-                code = _run_check_stage(
-                    venv_dir,
-                    "ruff",
-                    ["format", "--check", *lint_target],
-                    root,
-                    "ruff format --check",
-                )
-                if code != 0:
-                    raise typer.Exit(code=code)
-            else:
-                typer.echo("No changed Python files detected; skipping lint/format.")
-    elif cfg.formatter == "black":
-        # Keep ruff lint, but black for formatting
-        lint_target = files if changed else ["."]
-        if lint_target:
-            code = _run_check_stage(
-                venv_dir,
-                "ruff",
-                ["check", *lint_target],
-                root,
-                "ruff check",
-            )
-            if code != 0:
-                raise typer.Exit(code=code)
-            black_args = ["-q"]
-            if not fix:
-                black_args.append("--check")
-            stage_name = "black" if fix else "black --check"
-            code = _run_check_stage(
-                venv_dir,
-                "black",
-                [*black_args, *lint_target],
-                root,
-                stage_name,
-            )
-            if code != 0:
-                raise typer.Exit(code=code)
-        else:
-            typer.echo("No changed Python files detected; skipping lint/format.")
-    else:
-        typer.echo(f"Unknown formatter: {cfg.formatter} (expected ruff or black)")
-        raise typer.Exit(code=2)
-
-    # 2) Type checking
-    typecheck_target = _typecheck_targets(changed, files)
-    if not typecheck_target:
-        typer.echo("No changed Python files detected; skipping type checks.")
-    else:
-        if cfg.typechecker == "mypy":
-            code = _run_check_stage(
-                venv_dir,
-                "mypy",
-                typecheck_target,
-                root,
-                "mypy",
-            )
-            if code != 0:
-                raise typer.Exit(code=code)
-        elif cfg.typechecker == "pyright":
-            code = _run_check_stage(
-                venv_dir,
-                "pyright",
-                typecheck_target,
-                root,
-                "pyright",
-            )
-            if code != 0:
-                raise typer.Exit(code=code)
-        else:
-            typer.echo(
-                f"Unknown typechecker: {cfg.typechecker} (expected mypy or pyright)"
-            )
-            raise typer.Exit(code=2)
-
-    # 3) Tests + coverage
-    if cfg.run_tests and not fast and not no_tests:
-        cov_args = [
-            "--cov=.",
-            "--cov-report=term-missing",
-            f"--cov-fail-under={cfg.coverage_min}",
-        ]
-        if cfg.coverage_branch:
-            cov_args.insert(1, "--cov-branch")
-        code = _run_check_stage(
-            venv_dir,
-            "pytest",
-            [*cov_args],
-            root,
-            "pytest",
-        )
-        if code != 0:
-            raise typer.Exit(code=code)
-    elif no_tests:
-        typer.echo("Skipping tests (--no-tests).")
-    elif fast:
-        typer.echo("Skipping tests (--fast).")
-
-    _echo_with_fallback("✅ devr check passed", "devr check passed")
+    code = run_check(
+        project_root(),
+        changed=changed,
+        staged=staged,
+        fast=fast,
+        no_tests=no_tests,
+        fix=fix,
+        all_files=all_files,
+        no_daemon=no_daemon,
+        run=run_module,
+        echo=_echo_with_fallback,
+    )
+    if code != 0:
+        raise typer.Exit(code=code)
 
 
 @app.command()
 def fix() -> None:
     """Apply configured lint fixes and formatting in the active project venv."""
-    root = project_root()
-    cfg = load_config(root)
-    _warn_if_venv_path_outside_root(root, cfg.venv_path)
+    root, cfg = _load_project()
     venv_dir = find_venv(root, cfg.venv_path)
     if venv_dir is None:
         typer.echo("No venv found. Run: devr init")
@@ -609,6 +491,139 @@ def fix() -> None:
     _echo_with_fallback("✅ devr fix complete", "devr fix complete")
 
 
+def _installed_distributions_digest(venv_dir: Path) -> str:
+    """Hash the names of installed ``*.dist-info`` directories (name + version)."""
+    digest = hashlib.blake2b(digest_size=16)
+    patterns = (
+        "lib/python*/site-packages/*.dist-info",
+        "Lib/site-packages/*.dist-info",
+    )
+    for name in sorted(
+        path.name for pattern in patterns for path in venv_dir.glob(pattern)
+    ):
+        digest.update(name.encode("utf-8", "surrogateescape") + b"\0")
+    return digest.hexdigest()
+
+
+def _pip_audit_cache_key(root: Path, venv_dir: Path) -> str:
+    """Fingerprint the dependency declarations and the venv's installed packages."""
+    digest = hashlib.blake2b(digest_size=16)
+    for name in ("pyproject.toml", "requirements.txt"):
+        try:
+            digest.update((root / name).read_bytes())
+        except OSError:
+            pass
+        digest.update(b"\0")
+    digest.update(_installed_distributions_digest(venv_dir).encode("ascii"))
+    return digest.hexdigest()
+
+
+def _bandit_option_values(args: list[str], *flags: str) -> list[str]:
+    """Return the values passed to any of ``flags`` in a bandit argument list."""
+    return [value for flag, value in zip(args, args[1:]) if flag in flags]
+
+
+def _bandit_cache_key(root: Path, venv_dir: Path, args: list[str]) -> str | None:
+    """Fingerprint the scanned sources and bandit's configuration.
+
+    Sources are the HEAD tree plus uncommitted and gitignored Python files;
+    configuration is the contents of ``pyproject.toml``, ``.bandit`` and any
+    ``-c``/``--ini`` file in ``args``. Returns ``None`` outside a git work
+    tree, where no cheap fingerprint exists.
+    """
+    tree = _run_git(root, ["rev-parse", "HEAD^{tree}"])
+    entries = _git_status(root)
+    excludes = ",".join(_bandit_option_values(args, "-x", "--exclude")).split(",")
+    ignored = _run_git(
+        root,
+        [
+            "ls-files",
+            "-z",
+            "--others",
+            "--ignored",
+            "--exclude-standard",
+            "--",
+            ".",
+            *(f":(exclude){path}" for path in excludes if path),
+        ],
+    )
+    if tree is None or entries is None or ignored is None:
+        return None
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(tree.stdout.strip())
+    digest.update("\0".join(args).encode("utf-8", "surrogateescape"))
+    digest.update(_installed_distributions_digest(venv_dir).encode("ascii"))
+    for name in (
+        "pyproject.toml",
+        ".bandit",
+        *_bandit_option_values(args, "-c", "--configfile", "--ini"),
+    ):
+        try:
+            digest.update((root / name).read_bytes())
+        except OSError:
+            pass
+        digest.update(b"\0")
+
+    ignored_entries = [
+        ("!!", os.fsdecode(path)) for path in ignored.stdout.split(b"\0") if path
+    ]
+    for status, path in sorted([*entries, *ignored_entries]):
+        if not _filter_py([path]):
+            continue
+        try:
+            stat = (root / path).stat()
+            fingerprint = f"{status}:{path}:{stat.st_mtime_ns}:{stat.st_size}"
+        except OSError:
+            fingerprint = f"{status}:{path}:missing"
+        digest.update(fingerprint.encode("utf-8", "surrogateescape") + b"\0")
+    return digest.hexdigest()
+
+
+def _load_security_cache(venv_dir: Path) -> dict[str, Any]:
+    """Load cached clean security results, or an empty cache when unreadable."""
+    import json  # Deferred: only the security cache needs it.
+
+    try:
+        cache = json.loads(
+            (venv_dir / _SECURITY_CACHE_FILE).read_text(encoding="utf-8")
+        )
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_security_cache(venv_dir: Path, cache: dict[str, Any]) -> None:
+    """Atomically persist cached clean security results inside the venv."""
+    import json  # Deferred: only the security cache needs it.
+
+    cache_path = venv_dir / _SECURITY_CACHE_FILE
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(cache), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _security_cache_hit(
+    cache: dict[str, Any] | None,
+    label: str,
+    key: str | None,
+    ttl_seconds: float | None = None,
+) -> bool:
+    """Return whether ``cache`` holds a clean result for ``label`` under ``key``."""
+    entry = cache.get(label) if cache is not None else None
+    checked_at = entry.get("checked_at") if isinstance(entry, dict) else None
+    return (
+        key is not None
+        and isinstance(entry, dict)
+        and entry.get("key") == key
+        and isinstance(checked_at, (int, float))
+        and (ttl_seconds is None or time.time() - checked_at < ttl_seconds)
+    )
+
+
 @app.command()
 def security(
     fail_fast: bool = typer.Option(
@@ -616,11 +631,14 @@ def security(
         "--fail-fast",
         help="Exit after the first failing security check.",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Always run every scanner, ignoring cached clean results.",
+    ),
 ) -> None:
     """Run dependency and static-analysis security checks in the project venv."""
-    root = project_root()
-    cfg = load_config(root)
-    _warn_if_venv_path_outside_root(root, cfg.venv_path)
+    root, cfg = _load_project()
     venv_dir = find_venv(root, cfg.venv_path)
     if venv_dir is None:
         typer.echo("No venv found. Run: devr init")
@@ -628,26 +646,55 @@ def security(
 
     typer.echo(f"Using venv: {venv_dir}")
 
-    pip_audit_code = _run_with_summary(venv_dir, "pip_audit", [], root)
-    if pip_audit_code != 0 and fail_fast:
-        typer.echo("Security checks failed: pip-audit")
-        raise typer.Exit(code=1)
-
-    bandit_code = _run_with_summary(
-        venv_dir,
-        "bandit",
-        ["-r", ".", "-x", _bandit_excludes(root, cfg.venv_path, venv_dir)],
-        root,
-    )
-    if bandit_code != 0 and fail_fast:
-        typer.echo("Security checks failed: bandit")
-        raise typer.Exit(code=1)
+    cache = None if no_cache else _load_security_cache(venv_dir)
+
+    bandit_args = ["-r", ".", "-x", _bandit_excludes(root, cfg.venv_path, venv_dir)]
+    scans: list[tuple[str, str, list[str], str | None]] = []
+    for label, module, args, key, ttl in (
+        (
+            "pip-audit",
+            "pip_audit",
+            [],
+            None if cache is None else _pip_audit_cache_key(root, venv_dir),
+            _PIP_AUDIT_CACHE_TTL_SECONDS,
+        ),
+        (
+            "bandit",
+            "bandit",
+            bandit_args,
+            None if cache is None else _bandit_cache_key(root, venv_dir, bandit_args),
+            None,
+        ),
+    ):
+        if _security_cache_hit(cache, label, key, ttl):
+            typer.echo(f"{label}: no changes since the last clean run; skipping.")
+        else:
+            scans.append((label, module, args, key))
+
+    if fail_fast or len(scans) < 2:
+        codes: list[int] = []
+        for label, module, args, _key in scans:
+            codes.append(_run_with_summary(venv_dir, module, args, root))
+            if codes[-1] != 0:
+                break
+    else:
+        # pip-audit waits on the network and bandit on the CPU, so overlap them.
+        codes = _run_concurrently(
+            venv_dir,
+            [(label, module, args) for label, module, args, _key in scans],
+            root,
+            run=run_module,
+            echo=typer.echo,
+        )
 
     failed_checks: list[str] = []
-    if pip_audit_code != 0:
-        failed_checks.append("pip-audit")
-    if bandit_code != 0:
-        failed_checks.append("bandit")
+    for (label, _module, _args, key), code in zip(scans, codes):
+        if code != 0:
+            failed_checks.append(label)
+        elif cache is not None and key is not None:
+            cache[label] = {"key": key, "checked_at": time.time()}
+    if cache is not None and len(failed_checks) < len(codes):
+        _save_security_cache(venv_dir, cache)
     if failed_checks:
         typer.echo(f"Security checks failed: {', '.join(failed_checks)}")
         raise typer.Exit(code=1)
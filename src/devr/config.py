@@ -2,16 +2,15 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+import re
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
-try:
-    import tomllib  # py311+  # type: ignore
-except ImportError:  # pragma: no cover
-    import tomli as tomllib  # type: ignore[import-not-found,no-redef]
-
-TOMLDecodeError = getattr(tomllib, "TOMLDecodeError", ValueError)
+_CONFIG_CACHE: dict[tuple[str, int, int], tuple[DevrConfig, str | None]] = {}
 
 
 @dataclass(frozen=True)
@@ -24,6 +23,22 @@ class DevrConfig:
     coverage_min: int = 85
     coverage_branch: bool = True
     run_tests: bool = True
+    changed_only: bool = False
+    coverage_targets: tuple[str, ...] = ()
+    parallel_tests: bool = True
+    mypy_daemon: bool = False
+
+
+_BOOL_STRINGS = {
+    "1": True,
+    "true": True,
+    "yes": True,
+    "on": True,
+    "0": False,
+    "false": False,
+    "no": False,
+    "off": False,
+}
 
 
 def _parse_bool(value: Any, default: bool) -> bool:
@@ -31,12 +46,7 @@ def _parse_bool(value: Any, default: bool) -> bool:
     if isinstance(value, bool):
         return value
     if isinstance(value, str):
-        normalized = value.strip().lower()
-        if normalized in {"1", "true", "yes", "on"}:
-            return True
-        if normalized in {"0", "false", "no", "off"}:
-            return False
-        return default
+        return _BOOL_STRINGS.get(value.strip().lower(), default)
     if isinstance(value, int):
         if value in {0, 1}:
             return bool(value)
@@ -88,26 +98,97 @@ def _parse_venv_path(value: Any, default: str) -> str:
     return default
 
 
+def _parse_str_tuple(value: Any, default: tuple[str, ...]) -> tuple[str, ...]:
+    """Parse a string or list of non-blank strings, falling back when invalid."""
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, list) or not value:
+        return default
+    parsed = tuple(item.strip() for item in value if isinstance(item, str))
+    if len(parsed) != len(value) or not all(parsed):
+        return default
+    return parsed
+
+
+def _project_package(data: dict[str, Any]) -> str | None:
+    """Return the import package name derived from ``[project].name``, if any."""
+    project = data.get("project", {})
+    name = project.get("name") if isinstance(project, dict) else None
+    if not isinstance(name, str) or not name.strip():
+        return None
+    return re.sub(r"[-.]+", "_", name.strip()).lower()
+
+
+def _detect_coverage_targets(project_root: Path, package: str) -> tuple[str, ...]:
+    """Return the directory of ``package`` under ``project_root``, if it exists."""
+    for candidate in (f"src/{package}", package):
+        if (project_root / candidate / "__init__.py").is_file():
+            return (candidate,)
+    return ()
+
+
+@lru_cache(maxsize=None)
+def _tomllib() -> ModuleType:
+    """Import the TOML parser on first use; most invocations never parse TOML."""
+    try:
+        import tomllib  # py311+  # type: ignore
+    except ImportError:  # pragma: no cover
+        import tomli as tomllib  # type: ignore[import-not-found,no-redef]
+    return tomllib
+
+
 def load_config(project_root: Path) -> DevrConfig:
-    """Load ``[tool.devr]`` from ``pyproject.toml`` and return a validated config object."""
+    """Load ``[tool.devr]`` from ``pyproject.toml`` and return a validated config object.
+
+    Results are memoized on the file's absolute path, size, and modification time, so
+    repeated loads in one process skip the TOML parse until the file changes.
+    Coverage targets are still detected on every load, because the package
+    directory can appear or move without touching ``pyproject.toml``.
+    """
     pyproject = project_root / "pyproject.toml"
-    if not pyproject.exists():
+    path = os.path.abspath(pyproject)
+    try:
+        stat = os.stat(path)
+    except OSError:
         return DevrConfig()
 
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is None:
+        cached = _CONFIG_CACHE[key] = _read_config(pyproject)
+    cfg, package = cached
+    if package is None:
+        return cfg
+    return replace(
+        cfg, coverage_targets=_detect_coverage_targets(project_root, package)
+    )
+
+
+def _read_config(pyproject: Path) -> tuple[DevrConfig, str | None]:
+    """Parse ``pyproject`` into a validated config object.
+
+    Also returns the project's package name when ``coverage_targets`` must be
+    detected from the filesystem, or ``None`` when they are configured.
+    """
+    toml = _tomllib()
     data: dict[str, Any]
     try:
         with pyproject.open("rb") as f:
-            data = tomllib.load(f)
-    except TOMLDecodeError:
-        return DevrConfig()
+            data = toml.load(f)
+    except getattr(toml, "TOMLDecodeError", ValueError):
+        return DevrConfig(), None
 
     tool = data.get("tool", {})
     devr = tool.get("devr", {}) if isinstance(tool, dict) else {}
     if not isinstance(devr, dict):
-        return DevrConfig()
+        # Treat a malformed table as absent so coverage targets are still detected.
+        devr = {}
 
     base = DevrConfig()
-    return DevrConfig(
+    coverage_targets = _parse_str_tuple(
+        devr.get("coverage_targets"), base.coverage_targets
+    )
+    cfg = DevrConfig(
         venv_path=_parse_venv_path(devr.get("venv_path"), base.venv_path),
         formatter=_parse_choice(
             devr.get("formatter"), base.formatter, allowed={"ruff", "black"}
@@ -120,4 +201,9 @@ def load_config(project_root: Path) -> DevrConfig:
         ),
         coverage_branch=_parse_bool(devr.get("coverage_branch"), base.coverage_branch),
         run_tests=_parse_bool(devr.get("run_tests"), base.run_tests),
+        changed_only=_parse_bool(devr.get("changed_only"), base.changed_only),
+        coverage_targets=coverage_targets,
+        parallel_tests=_parse_bool(devr.get("parallel_tests"), base.parallel_tests),
+        mypy_daemon=_parse_bool(devr.get("mypy_daemon"), base.mypy_daemon),
     )
+    return cfg, None if coverage_targets else _project_package(data)
@@ -0,0 +1,90 @@
+"""Lightweight ``devr check`` entry point for pre-commit hooks.
+
+This module deliberately avoids importing Typer (and therefore ``devr.cli``)
+so hooks that run on every commit skip the CLI framework's import and
+dispatch overhead. It accepts the same flags as ``devr check``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+from .checks import project_root, run_check
+from .venv import run_module
+
+
+def _echo(message: str = "", nl: bool = True) -> None:
+    """Write ``message`` to stdout and flush before tools write to the same stream."""
+    text = f"{message}\n" if nl else message
+    try:
+        sys.stdout.write(text)
+    except UnicodeEncodeError:
+        sys.stdout.write(text.encode("ascii", "replace").decode("ascii"))
+    sys.stdout.flush()
+
+
+def _parser() -> argparse.ArgumentParser:
+    """Build an argument parser mirroring the ``devr check`` options."""
+    parser = argparse.ArgumentParser(
+        prog="devr-fastcheck",
+        description="Run devr check without loading the full CLI.",
+    )
+    parser.add_argument(
+        "--fix",
+        action="store_true",
+        help="Apply safe autofixes (ruff check --fix) and formatting.",
+    )
+    parser.add_argument(
+        "--staged",
+        action="store_true",
+        help="Use staged files (git index) for changed-files mode.",
+    )
+    parser.add_argument(
+        "--changed",
+        action="store_true",
+        help="Run on changed files only (paired with --staged recommended).",
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Skip slow steps (defaults to skipping tests).",
+    )
+    parser.add_argument(
+        "--no-tests",
+        action="store_true",
+        help="Skip running tests regardless of config settings.",
+    )
+    parser.add_argument(
+        "--all",
+        dest="all_files",
+        action="store_true",
+        help="Check the full tree, ignoring --changed and changed_only scoping.",
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Run plain mypy even when mypy_daemon is enabled.",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the ``devr check`` gate and return its exit code."""
+    opts = _parser().parse_args(argv)
+    return run_check(
+        project_root(),
+        changed=opts.changed,
+        staged=opts.staged,
+        fast=opts.fast,
+        no_tests=opts.no_tests,
+        fix=opts.fix,
+        all_files=opts.all_files,
+        no_daemon=opts.no_daemon,
+        run=run_module,
+        echo=_echo,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import re
-import shutil
 import subprocess
 import sys
 import tempfile
+from importlib import metadata
 from pathlib import Path
 
 if sys.version_info >= (3, 11):
@@ -17,6 +17,13 @@ else:  # pragma: no cover - exercised on older runtimes
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 
+_IS_WINDOWS = sys.platform.startswith("win")
+
+_HEADING_RE = re.compile(r"^\s*## \[(.+?)\]", re.MULTILINE)
+_UNRELEASED_RE = re.compile(
+    r"^## \[Unreleased\]\s*(.*?)(?=^## \[|\Z)", re.MULTILINE | re.DOTALL
+)
+
 
 class ReleasePreflightError(RuntimeError):
     """Raised when a release preflight check fails."""
@@ -24,7 +31,8 @@ class ReleasePreflightError(RuntimeError):
 
 def project_version(pyproject_path: Path) -> str:
     """Return the ``[project].version`` from ``pyproject.toml``."""
-    data = tomllib.loads(pyproject_path.read_text(encoding="utf-8"))
+    with pyproject_path.open("rb") as f:
+        data = tomllib.load(f)
     version = data.get("project", {}).get("version")
     if not isinstance(version, str) or not version.strip():
         raise ReleasePreflightError(
@@ -35,19 +43,18 @@ def project_version(pyproject_path: Path) -> str:
 
 def changelog_versions(changelog_path: Path) -> list[str]:
     """Return version labels from markdown changelog headings."""
-    versions: list[str] = []
-    pattern = re.compile(r"^## \[(.+?)\]")
-    for line in changelog_path.read_text(encoding="utf-8").splitlines():
-        match = pattern.match(line.strip())
-        if match:
-            versions.append(match.group(1))
-    return versions
+    return _versions_in(changelog_path.read_text(encoding="utf-8"))
+
+
+def _versions_in(changelog_text: str) -> list[str]:
+    """Return version labels from the headings in ``changelog_text``."""
+    return _HEADING_RE.findall(changelog_text)
 
 
 def validate_changelog(changelog_path: Path, version: str) -> None:
     """Validate changelog has expected release structure for ``version``."""
     changelog_text = changelog_path.read_text(encoding="utf-8")
-    versions = changelog_versions(changelog_path)
+    versions = _versions_in(changelog_text)
     if not versions or versions[0] != "Unreleased":
         raise ReleasePreflightError(
             "CHANGELOG.md must have '## [Unreleased]' as the first section"
@@ -58,11 +65,7 @@ def validate_changelog(changelog_path: Path, version: str) -> None:
             "Move completed entries from Unreleased into that release section before tagging."
         )
 
-    unreleased_match = re.search(
-        r"^## \[Unreleased\]\s*(.*?)(?=^## \[|\Z)",
-        changelog_text,
-        flags=re.MULTILINE | re.DOTALL,
-    )
+    unreleased_match = _UNRELEASED_RE.search(changelog_text)
     if unreleased_match and unreleased_match.group(1).strip():
         raise ReleasePreflightError(
             "CHANGELOG.md has unreleased entries. Move completed entries from "
@@ -70,11 +73,25 @@ def validate_changelog(changelog_path: Path, version: str) -> None:
         )
 
 
-def run_checked(cmd: list[str], cwd: Path) -> None:
-    """Run command and fail with a clear message on non-zero exit."""
+def run_checked(cmd: list[str], cwd: Path, *, quiet: bool = False) -> None:
+    """Run command and fail with a clear message on non-zero exit.
+
+    ``quiet`` discards stdout and only shows stderr when the command fails.
+    """
     print(f"$ {' '.join(cmd)}")
-    completed = subprocess.run(cmd, cwd=cwd, check=False)
+    if quiet:
+        completed = subprocess.run(
+            cmd,
+            cwd=cwd,
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+    else:
+        completed = subprocess.run(cmd, cwd=cwd, check=False)
     if completed.returncode != 0:
+        if quiet and completed.stderr:
+            print(completed.stderr.decode(errors="replace"), end="", file=sys.stderr)
         raise ReleasePreflightError(
             f"Command failed with exit code {completed.returncode}: {' '.join(cmd)}"
         )
@@ -88,35 +105,45 @@ def artifact_path(dist_dir: Path, suffix: str) -> Path:
     return matches[0]
 
 
+def _make_venv(tmp_dir: Path, repo_root: Path) -> Path:
+    """Create a throwaway venv under ``tmp_dir`` and return its Python executable."""
+    venv_dir = tmp_dir / ".venv"
+    run_checked([sys.executable, "-m", "venv", str(venv_dir)], cwd=repo_root)
+    return venv_dir / ("Scripts/python.exe" if _IS_WINDOWS else "bin/python")
+
+
+def _install_and_check(
+    python_bin: Path, artifact: Path, repo_root: Path, *, reinstall: bool = False
+) -> None:
+    """Install ``artifact`` with ``python_bin`` and run version entrypoint checks.
+
+    The first install also upgrades pip in the same resolver run. ``reinstall``
+    replaces a previously installed devr in place, keeping its dependencies.
+    """
+    install_args = (
+        ["--force-reinstall", "--no-deps", str(artifact)]
+        if reinstall
+        else ["--upgrade", "pip", str(artifact)]
+    )
+    run_checked(
+        [str(python_bin), "-m", "pip", "install", *install_args],
+        cwd=repo_root,
+        quiet=True,
+    )
+    run_checked([str(python_bin), "-m", "devr", "--version"], cwd=repo_root)
+    run_checked(
+        [str(python_bin), "-m", "pip", "show", "devr"], cwd=repo_root, quiet=True
+    )
+    scripts_dir = python_bin.parent
+    devr_bin = scripts_dir / ("devr.exe" if _IS_WINDOWS else "devr")
+    run_checked([str(devr_bin), "--version"], cwd=repo_root)
+
+
 def smoke_test_artifact(artifact: Path, repo_root: Path) -> None:
     """Install an artifact in a temporary venv and run version entrypoint checks."""
     with tempfile.TemporaryDirectory(prefix="devr-release-") as tmp:
-        venv_dir = Path(tmp) / ".venv"
-        python_bin = venv_dir / (
-            "Scripts/python.exe" if sys.platform.startswith("win") else "bin/python"
-        )
-        run_checked([sys.executable, "-m", "venv", str(venv_dir)], cwd=repo_root)
-        run_checked(
-            [str(python_bin), "-m", "pip", "install", "--upgrade", "pip"], cwd=repo_root
-        )
-        run_checked(
-            [
-                str(python_bin),
-                "-m",
-                "pip",
-                "install",
-                "--force-reinstall",
-                str(artifact),
-            ],
-            cwd=repo_root,
-        )
-        run_checked([str(python_bin), "-m", "devr", "--version"], cwd=repo_root)
-        run_checked([str(python_bin), "-m", "pip", "show", "devr"], cwd=repo_root)
-        scripts_dir = python_bin.parent
-        devr_bin = scripts_dir / (
-            "devr.exe" if sys.platform.startswith("win") else "devr"
-        )
-        run_checked([str(devr_bin), "--version"], cwd=repo_root)
+        python_bin = _make_venv(Path(tmp), repo_root)
+        _install_and_check(python_bin, artifact, repo_root)
 
 
 def main() -> int:
@@ -131,18 +158,29 @@ def main() -> int:
     validate_changelog(changelog_path, version)
     print("Changelog/version check passed.")
 
-    if dist_dir.exists():
-        shutil.rmtree(dist_dir)
-    run_checked([sys.executable, "-m", "build", "--version"], cwd=repo_root)
+    # Only stale artifacts can confuse artifact_path(); drop those rather than
+    # walking and deleting the whole directory.
+    for pattern in ("*.whl", "*.tar.gz"):
+        for stale in dist_dir.glob(pattern):
+            stale.unlink()
+    try:
+        print(f"build {metadata.version('build')}")
+    except metadata.PackageNotFoundError:
+        raise ReleasePreflightError(
+            "The 'build' package is not installed; run: python -m pip install build"
+        ) from None
     run_checked([sys.executable, "-m", "build"], cwd=repo_root)
 
     wheel = artifact_path(dist_dir, ".whl")
     sdist = artifact_path(dist_dir, ".tar.gz")
 
-    print(f"Smoke testing wheel artifact: {wheel.name}")
-    smoke_test_artifact(wheel, repo_root)
-    print(f"Smoke testing sdist artifact: {sdist.name}")
-    smoke_test_artifact(sdist, repo_root)
+    # Both artifacts share one venv; the sdist replaces the wheel's install.
+    with tempfile.TemporaryDirectory(prefix="devr-release-") as tmp:
+        python_bin = _make_venv(Path(tmp), repo_root)
+        print(f"Smoke testing wheel artifact: {wheel.name}")
+        _install_and_check(python_bin, wheel, repo_root)
+        print(f"Smoke testing sdist artifact: {sdist.name}")
+        _install_and_check(python_bin, sdist, repo_root, reinstall=True)
 
     print("Release preflight checks completed successfully.")
     return 0
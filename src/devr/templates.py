@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-DEFAULT_TOOLCHAIN = [
+DEFAULT_TOOLCHAIN = (
     "ruff>=0.6",
     "pytest>=8",
     "pytest-cov>=5",
@@ -12,7 +12,14 @@ DEFAULT_TOOLCHAIN = [
     "pip-audit>=2.7",
     "bandit>=1.7",
     "black>=24.8",
-]
+)
+
+# Packaging tools at or above these versions are not re-upgraded by ``devr init``.
+BOOTSTRAP_MIN_VERSIONS = {
+    "pip": "24.0",
+    "setuptools": "69.0",
+    "wheel": "0.42",
+}
 
 PRECOMMIT_LOCAL_HOOK_YAML = """\
 repos:
@@ -20,7 +27,7 @@ repos:
     hooks:
       - id: devr-check
         name: devr check (staged)
-        entry: devr check --staged --changed
+        entry: devr-fastcheck --staged --changed
         language: system
         pass_filenames: false
 """
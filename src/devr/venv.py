@@ -6,6 +6,7 @@ import os
 import subprocess
 import sys
 from pathlib import Path
+from typing import IO
 
 
 def is_inside_venv() -> bool:
@@ -13,25 +14,64 @@ def is_inside_venv() -> bool:
     return sys.prefix != getattr(sys, "base_prefix", sys.prefix)
 
 
+_VENV_PYTHON_CACHE: dict[tuple[str, str], Path] = {}
+
+
 def venv_python(venv_dir: Path) -> Path:
-    """Return the platform-specific Python executable path for a virtual environment."""
+    """Return the platform-specific Python executable path for a virtual environment.
+
+    Once either interpreter layout exists the choice is memoized per venv, so
+    repeated tool launches skip the existence probes. Missing venvs are not
+    cached because ``devr init`` may create them later in the same process.
+    """
+    key = (os.name, str(venv_dir))
+    cached = _VENV_PYTHON_CACHE.get(key)
+    if cached is not None:
+        return cached
+
     windows_python = venv_dir / "Scripts" / "python.exe"
     posix_python = venv_dir / "bin" / "python"
 
     preferred = windows_python if os.name == "nt" else posix_python
     alternate = posix_python if os.name == "nt" else windows_python
 
-    if preferred.exists() or not alternate.exists():
+    if preferred.exists():
+        _VENV_PYTHON_CACHE[key] = preferred
         return preferred
-    return alternate
+    if alternate.exists():
+        _VENV_PYTHON_CACHE[key] = alternate
+        return alternate
+    return preferred
+
+
+def _top_level_entries(project_root: Path) -> set[str] | None:
+    """Return the casefolded names under ``project_root``, or ``None`` if unreadable.
+
+    Names are casefolded so a lookup never rules out a path that a
+    case-insensitive filesystem (macOS, Windows) would still resolve.
+    """
+    try:
+        with os.scandir(project_root) as it:
+            return {entry.name.casefold() for entry in it}
+    except OSError:
+        return None
 
 
 def find_venv(project_root: Path, configured: str | None) -> Path | None:
     """Locate an existing virtual environment, preferring configured and active venv paths."""
-    if configured:
-        p = (project_root / configured).resolve()
+    # One directory listing rules out absent candidates before any deeper stat.
+    entries = _top_level_entries(project_root)
+
+    def _may_exist(name: str) -> bool:
+        path = Path(name)
+        if entries is None or path.is_absolute() or not path.parts:
+            return True
+        return path.parts[0] == ".." or path.parts[0].casefold() in entries
+
+    if configured and _may_exist(configured):
+        p = project_root / configured
         if venv_python(p).exists():
-            return p
+            return p.resolve()
 
     # If user is already running inside a venv, use it.
     # (Useful when devs activate venv manually.)
@@ -41,9 +81,11 @@ def find_venv(project_root: Path, configured: str | None) -> Path | None:
             return active
 
     for name in (".venv", "venv", "env"):
-        p = (project_root / name).resolve()
+        if not _may_exist(name):
+            continue
+        p = project_root / name
         if venv_python(p).exists():
-            return p
+            return p.resolve()
 
     return None
 
@@ -57,12 +99,103 @@ def create_venv(
     subprocess.check_call([py, "-m", "venv", str(venv_dir)])
 
 
-def run_py(venv_dir: Path, args: list[str], cwd: Path) -> int:
-    """Run Python inside ``venv_dir`` with ``args`` from ``cwd`` and return its exit code."""
+def venv_script(venv_dir: Path, name: str) -> Path:
+    """Return the console-script path for ``name`` next to the venv's Python executable."""
     py = venv_python(venv_dir)
-    return subprocess.call([py.as_posix(), *args], cwd=str(cwd))
+    return py.parent / (f"{name}.exe" if py.suffix == ".exe" else name)
 
 
-def run_module(venv_dir: Path, module: str, args: list[str], cwd: Path) -> int:
-    """Run ``python -m <module>`` inside ``venv_dir`` and return its exit code."""
-    return run_py(venv_dir, ["-m", module, *args], cwd=cwd)
+_VERSIONS_SCRIPT = """\
+import sys
+from importlib import metadata
+
+for name in sys.argv[1:]:
+    try:
+        print(metadata.version(name))
+    except metadata.PackageNotFoundError:
+        print()
+"""
+
+
+def venv_package_versions(venv_dir: Path, names: list[str]) -> dict[str, str] | None:
+    """Return installed versions of ``names`` inside ``venv_dir`` (``""`` when missing).
+
+    Returns ``None`` when the venv's Python cannot be queried.
+    """
+    py = venv_python(venv_dir)
+    try:
+        proc = subprocess.run(
+            [py.as_posix(), "-c", _VERSIONS_SCRIPT, *names],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    lines = proc.stdout.splitlines()
+    if proc.returncode != 0 or len(lines) != len(names):
+        return None
+    return dict(zip(names, (line.strip() for line in lines)))
+
+
+def _call(cmd: list[str], cwd: Path, output: IO[bytes] | None) -> int:
+    """Run ``cmd`` from ``cwd`` and return its exit code, optionally capturing output."""
+    return subprocess.call(
+        cmd,
+        cwd=str(cwd),
+        stdout=output,
+        stderr=subprocess.STDOUT if output is not None else None,
+    )
+
+
+def run_py(
+    venv_dir: Path, args: list[str], cwd: Path, output: IO[bytes] | None = None
+) -> int:
+    """Run Python inside ``venv_dir`` with ``args`` from ``cwd`` and return its exit code.
+
+    When ``output`` is given, stdout and stderr are both redirected into it.
+    """
+    py = venv_python(venv_dir)
+    return _call([py.as_posix(), *args], cwd, output)
+
+
+def uv_pip_install(venv_dir: Path, uv: str, args: list[str], cwd: Path) -> int:
+    """Run ``uv pip install <args>`` against the venv's Python and return its exit code."""
+    py = venv_python(venv_dir)
+    return _call([uv, "pip", "install", "--python", py.as_posix(), *args], cwd, None)
+
+
+# Console scripts that can run in place of ``python -m <module>``, skipping
+# an interpreter hop (ruff) or the ``runpy`` module lookup. pip keeps using
+# ``python -m pip`` so it can upgrade itself, and pytest keeps ``-m`` because
+# that puts the project root on ``sys.path``.
+_CONSOLE_SCRIPTS = {
+    "ruff": "ruff",
+    "black": "black",
+    "mypy": "mypy",
+    "mypy.dmypy": "dmypy",
+    "pyright": "pyright",
+    "bandit": "bandit",
+    "pip_audit": "pip-audit",
+    "pre_commit": "pre-commit",
+}
+
+
+def run_module(
+    venv_dir: Path,
+    module: str,
+    args: list[str],
+    cwd: Path,
+    output: IO[bytes] | None = None,
+) -> int:
+    """Run ``python -m <module>`` inside ``venv_dir`` and return its exit code.
+
+    Tools with a known console script are executed directly when it is
+    installed; otherwise the module is launched through the venv's Python.
+    """
+    script_name = _CONSOLE_SCRIPTS.get(module)
+    if script_name is not None:
+        script = venv_script(venv_dir, script_name)
+        if script.exists():
+            return _call([str(script), *args], cwd, output)
+    return run_py(venv_dir, ["-m", module, *args], cwd=cwd, output=output)
@@ -2,11 +2,35 @@
 
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+
+@pytest.fixture(autouse=True)
+def _pip_without_uv(monkeypatch):
+    """Keep installs on the pip code path even when ``uv`` is on ``PATH``."""
+    monkeypatch.setenv("DEVR_NO_UV", "1")
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _isolated_home(tmp_path_factory):
+    """Point ``HOME`` at a scratch dir and ignore user git config.
+
+    Keeps tests independent of the developer's dotfiles and lets
+    ``pytest -n auto`` workers run without sharing any per-user state.
+    """
+    home = tmp_path_factory.mktemp("home")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("HOME", str(home))
+        mp.setenv("USERPROFILE", str(home))
+        mp.setenv("GIT_CONFIG_GLOBAL", os.devnull)
+        yield home
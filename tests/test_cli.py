@@ -1,18 +1,38 @@
 """CLI behavior tests for devr commands."""
 
+from __future__ import annotations
+
+import io
 import os
 import subprocess
 import sys
-from pathlib import Path
-from types import SimpleNamespace
-
+import threading
+import time
 from importlib.metadata import PackageNotFoundError
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
-from typer.testing import CliRunner
+import pytest
 from click.exceptions import Exit
-
+from typer.testing import CliRunner, Result
+
+from devr.checks import (
+    _changed_files,
+    _existing_files,
+    _filter_py,
+    _is_git_repo,
+    _project_root_for,
+    _staged_files,
+    _xdist_available,
+    project_root,
+)
 from devr.cli import (
+    _bandit_cache_key,
+    _bandit_excludes,
+    _devr_version,
     _echo_with_fallback,
+    _toolchain_digest,
+    _warn_if_venv_path_outside_root,
     app,
     ensure_toolchain,
     install_precommit_hook,
@@ -20,10 +40,106 @@ from devr.cli import (
     write_precommit,
 )
 from devr.config import DevrConfig
-from devr.templates import PRECOMMIT_LOCAL_HOOK_YAML
+from devr.templates import (
+    BOOTSTRAP_MIN_VERSIONS,
+    DEFAULT_TOOLCHAIN,
+    PRECOMMIT_LOCAL_HOOK_YAML,
+)
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
 
 runner = CliRunner()
 
+_DEFAULT_BANDIT_EXCLUDES = (
+    ".venv,venv,env,.git,__pycache__,.mypy_cache,.pytest_cache,.ruff_cache,.tox,.nox,"
+    "build,dist"
+)
+
+
+@pytest.fixture
+def venv_path(monkeypatch, tmp_path: Path) -> Path:
+    """Point the CLI at ``tmp_path`` as project root with a ``.venv`` inside it.
+
+    pytest's ``tmp_path`` is already resolved, so no ``resolve()`` is needed.
+    """
+    path = tmp_path / ".venv"
+    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
+    monkeypatch.setattr("devr.cli.find_venv", lambda *_: path)
+    monkeypatch.setattr("devr.checks.find_venv", lambda *_: path)
+    return path
+
+
+# Session-scoped roots come from tmp_path_factory, which gives every xdist
+# worker its own numbered base directory. Share them only while tests treat
+# them as read-only; anything that writes into a project root must use a
+# function-scoped tmp_path instead.
+@pytest.fixture(scope="session")
+def pyproject_only_dir(tmp_path_factory) -> Path:
+    """A read-only project root containing just a minimal ``pyproject.toml``."""
+    root = tmp_path_factory.mktemp("pyproject-only")
+    (root / "pyproject.toml").write_text("[project]\nname='x'\n", encoding="utf-8")
+    return root
+
+
+@pytest.fixture(scope="session")
+def requirements_only_dir(tmp_path_factory) -> Path:
+    """A read-only project root containing just a ``requirements.txt``."""
+    root = tmp_path_factory.mktemp("requirements-only")
+    (root / "requirements.txt").write_text("pytest\n", encoding="utf-8")
+    return root
+
+
+def _record_run_module(
+    monkeypatch, codes: dict[str, int] | None = None
+) -> list[tuple[str, list[str]]]:
+    """Patch ``devr.cli.run_module`` to record calls and return ``codes[module]``."""
+    calls: list[tuple[str, list[str]]] = []
+
+    def _run_module(_venv, module: str, args: list[str], **_kwargs) -> int:
+        calls.append((module, args))
+        return (codes or {}).get(module, 0)
+
+    monkeypatch.setattr("devr.cli.run_module", _run_module)
+    return calls
+
+
+def _invoke_cli(
+    monkeypatch, config: DevrConfig, args: list[str]
+) -> tuple[Result, list[tuple[str, list[str]]]]:
+    """Invoke the CLI with ``config`` loaded and return the result and tool calls."""
+    monkeypatch.setattr("devr.cli.load_config", lambda _: config)
+    monkeypatch.setattr("devr.checks.load_config", lambda _: config)
+    calls = _record_run_module(monkeypatch)
+    return runner.invoke(app, args, catch_exceptions=False), calls
+
+
+class _GitResult(NamedTuple):
+    """Minimal ``CompletedProcess`` stand-in returned by ``_run_git`` fakes."""
+
+    returncode: int
+    stdout: bytes | str
+
+
+class _FakeGitProcess:
+    """Minimal ``subprocess.Popen`` stand-in that streams canned git output."""
+
+    def __init__(self, stdout: bytes, returncode: int = 0) -> None:
+        self.stdout = io.BytesIO(stdout)
+        self.returncode = returncode
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc_info) -> None:
+        self.stdout.close()
+
+    def kill(self) -> None:
+        pass
+
+    def wait(self) -> int:
+        return self.returncode
+
 
 def test_module_entrypoint_supports_version_flag() -> None:
     proc = subprocess.run(
@@ -39,21 +155,61 @@ def test_module_entrypoint_supports_version_flag() -> None:
     assert proc.stdout.startswith("devr ")
 
 
-def test_version_flag_prints_version(monkeypatch) -> None:
-    monkeypatch.setattr("devr.cli.version", lambda _: "1.2.3")
+@pytest.fixture
+def fresh_devr_version():
+    """Clear the memoized devr version around a test."""
+    _devr_version.cache_clear()
+    yield
+    _devr_version.cache_clear()
+
 
-    result = runner.invoke(app, ["--version"])
+def test_version_flag_prints_version(monkeypatch, fresh_devr_version) -> None:
+    monkeypatch.setattr("importlib.metadata.version", lambda _: "1.2.3")
+
+    result = runner.invoke(app, ["--version"], catch_exceptions=False)
 
     assert result.exit_code == 0
     assert "devr 1.2.3" in result.output
 
 
+def test_devr_version_is_memoized(monkeypatch, fresh_devr_version) -> None:
+    calls: list[str] = []
+
+    def _version(name: str) -> str:
+        calls.append(name)
+        return "1.2.3"
+
+    monkeypatch.setattr("importlib.metadata.version", _version)
+
+    assert _devr_version() == "1.2.3"
+    assert _devr_version() == "1.2.3"
+    assert calls == ["devr"]
+
+
+def test_cli_import_defers_importlib_metadata() -> None:
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, devr.cli; print('importlib.metadata' in sys.modules)",
+        ],
+        cwd=str(Path(__file__).resolve().parents[1]),
+        capture_output=True,
+        text=True,
+        check=False,
+        env={**os.environ, "PYTHONPATH": "src"},
+    )
+
+    assert proc.returncode == 0
+    assert proc.stdout.strip() == "False"
+
+
 def test_echo_with_fallback_uses_plaintext_when_unicode_encoding_fails(
     monkeypatch,
 ) -> None:
     output: list[str] = []
 
-    def _echo(value: str) -> None:
+    def _echo(value: str, **_kwargs) -> None:
         if value.startswith("✅"):
             raise UnicodeEncodeError(
                 "charmap", value, 0, 1, "character maps to <undefined>"
@@ -67,29 +223,25 @@ def test_echo_with_fallback_uses_plaintext_when_unicode_encoding_fails(
     assert output == ["devr check passed"]
 
 
-def test_check_prints_selected_venv(monkeypatch, tmp_path: Path) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
-
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
-    monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(run_tests=False))
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
+def test_check_prints_selected_venv(monkeypatch, venv_path: Path) -> None:
+    monkeypatch.setattr(
+        "devr.checks.load_config", lambda _: DevrConfig(run_tests=False)
+    )
     monkeypatch.setattr("devr.cli.run_module", lambda *_, **__: 0)
 
-    result = runner.invoke(app, ["check", "--fast"])
+    result = runner.invoke(app, ["check", "--fast"], catch_exceptions=False)
 
     assert result.exit_code == 0
     assert f"Using venv: {venv_path}" in result.output
 
 
-def test_check_prints_stage_and_command_summaries(monkeypatch, tmp_path: Path) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
-
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
-    monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(run_tests=False))
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
+def test_check_prints_stage_and_command_summaries(monkeypatch, venv_path: Path) -> None:
+    monkeypatch.setattr(
+        "devr.checks.load_config", lambda _: DevrConfig(run_tests=False)
+    )
     monkeypatch.setattr("devr.cli.run_module", lambda *_, **__: 0)
 
-    result = runner.invoke(app, ["check", "--fast"])
+    result = runner.invoke(app, ["check", "--fast"], catch_exceptions=False)
 
     assert result.exit_code == 0
     assert "Stage: ruff check" in result.output
@@ -100,139 +252,252 @@ def test_check_prints_stage_and_command_summaries(monkeypatch, tmp_path: Path) -
     assert "Running: mypy ." in result.output
 
 
-def test_check_warns_when_staged_used_without_changed(
-    monkeypatch, tmp_path: Path
+def test_check_reports_concurrent_stages_in_plan_order(
+    monkeypatch, venv_path: Path
 ) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
+    delays = {"check": 0.05, "format": 0.0}
 
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
-    monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(run_tests=False))
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
-    monkeypatch.setattr("devr.cli.run_module", lambda *_, **__: 0)
+    def _run_module(_venv, module: str, args: list[str], **kwargs) -> int:
+        time.sleep(delays.get(args[0], 0.0))
+        kwargs["output"].write(f"{module} {args[0]} output\n".encode())
+        return 3 if module == "mypy" else 0
 
-    result = runner.invoke(app, ["check", "--staged", "--fast"])
+    monkeypatch.setattr(
+        "devr.checks.load_config", lambda _: DevrConfig(run_tests=False)
+    )
+    monkeypatch.setattr("devr.cli.run_module", _run_module)
 
-    assert result.exit_code == 0
-    assert "Warning: --staged has no effect without --changed." in result.output
+    result = runner.invoke(app, ["check"], catch_exceptions=False)
 
+    assert result.exit_code == 3
+    lint = result.output.index("ruff check output")
+    fmt = result.output.index("ruff format output")
+    mypy = result.output.index("mypy . output")
+    assert result.output.index("Stage: ruff check") < lint < fmt < mypy
 
-def test_security_runs_pip_audit_and_bandit(monkeypatch, tmp_path: Path) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
-    calls: list[tuple[str, list[str]]] = []
 
-    def _run_module(_venv, module: str, args: list[str], **_kwargs) -> int:
-        calls.append((module, args))
-        return 0
+def test_check_warns_when_staged_used_without_changed(
+    monkeypatch, venv_path: Path
+) -> None:
+    monkeypatch.setattr(
+        "devr.checks.load_config", lambda _: DevrConfig(run_tests=False)
+    )
+    monkeypatch.setattr("devr.cli.run_module", lambda *_, **__: 0)
 
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
-    monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(venv_path=".venv"))
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
-    monkeypatch.setattr("devr.cli.run_module", _run_module)
+    result = runner.invoke(app, ["check", "--staged", "--fast"], catch_exceptions=False)
 
-    result = runner.invoke(app, ["security"])
+    assert result.exit_code == 0
+    assert "Warning: --staged has no effect without --changed." in result.output
+
+
+def test_security_runs_pip_audit_and_bandit(monkeypatch, venv_path: Path) -> None:
+    result, calls = _invoke_cli(
+        monkeypatch, DevrConfig(venv_path=".venv"), ["security"]
+    )
 
     assert result.exit_code == 0
-    assert calls == [
-        ("pip_audit", []),
+    assert sorted(calls) == [
         (
             "bandit",
             [
                 "-r",
                 ".",
                 "-x",
-                ".venv,venv,env,.git,__pycache__,.mypy_cache,.pytest_cache,.ruff_cache,.tox,.nox,build,dist",
+                _DEFAULT_BANDIT_EXCLUDES,
             ],
         ),
+        ("pip_audit", []),
     ]
     assert "✅ devr security passed" in result.output
 
 
-def test_security_runs_bandit_even_when_pip_audit_fails(
-    monkeypatch, tmp_path: Path
+def test_security_skips_scanners_with_cached_clean_results(
+    monkeypatch, tmp_path: Path, venv_path: Path
 ) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
+    venv_path.mkdir()
+    (tmp_path / "pyproject.toml").write_text("[project]\nname='x'\n", encoding="utf-8")
     calls: list[str] = []
 
     def _run_module(_venv, module: str, _args: list[str], **_kwargs) -> int:
         calls.append(module)
-        return 1 if module == "pip_audit" else 0
+        return 0
 
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
     monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(venv_path=".venv"))
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
     monkeypatch.setattr("devr.cli.run_module", _run_module)
+    monkeypatch.setattr("devr.cli._bandit_cache_key", lambda *_: "tree-1")
 
-    result = runner.invoke(app, ["security"])
+    assert runner.invoke(app, ["security"], catch_exceptions=False).exit_code == 0
+    assert sorted(calls) == ["bandit", "pip_audit"]
 
-    assert result.exit_code == 1
-    assert calls == ["pip_audit", "bandit"]
-    assert "Security checks failed: pip-audit" in result.output
+    result = runner.invoke(app, ["security"], catch_exceptions=False)
 
+    assert result.exit_code == 0
+    assert len(calls) == 2
+    assert "pip-audit: no changes since the last clean run; skipping." in result.output
+    assert "bandit: no changes since the last clean run; skipping." in result.output
 
-def test_security_fail_fast_stops_after_pip_audit_failure(
-    monkeypatch, tmp_path: Path
+    # Dependency and source changes invalidate their own scanner only.
+    (tmp_path / "pyproject.toml").write_text("[project]\nname='y'\n", encoding="utf-8")
+    assert runner.invoke(app, ["security"], catch_exceptions=False).exit_code == 0
+    assert calls[2:] == ["pip_audit"]
+
+    monkeypatch.setattr("devr.cli._bandit_cache_key", lambda *_: "tree-2")
+    assert runner.invoke(app, ["security"], catch_exceptions=False).exit_code == 0
+    assert calls[3:] == ["bandit"]
+
+    assert (
+        runner.invoke(app, ["security", "--no-cache"], catch_exceptions=False).exit_code
+        == 0
+    )
+    assert sorted(calls[4:]) == ["bandit", "pip_audit"]
+
+
+def test_security_does_not_cache_failures_or_expired_audits(
+    monkeypatch, venv_path: Path
 ) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
+    venv_path.mkdir()
     calls: list[str] = []
+    codes = {"pip_audit": 0, "bandit": 1}
 
     def _run_module(_venv, module: str, _args: list[str], **_kwargs) -> int:
         calls.append(module)
-        return 1 if module == "pip_audit" else 0
+        return codes[module]
 
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
     monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(venv_path=".venv"))
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
     monkeypatch.setattr("devr.cli.run_module", _run_module)
+    monkeypatch.setattr("devr.cli._bandit_cache_key", lambda *_: "tree")
+
+    assert runner.invoke(app, ["security"], catch_exceptions=False).exit_code == 1
+    assert runner.invoke(app, ["security"], catch_exceptions=False).exit_code == 1
+    assert sorted(calls[:2]) == ["bandit", "pip_audit"]
+    assert calls[2:] == ["bandit"]
+
+    now = time.time()
+    monkeypatch.setattr("devr.cli.time.time", lambda: now + 2 * 24 * 60 * 60)
+    assert runner.invoke(app, ["security"], catch_exceptions=False).exit_code == 1
+    assert sorted(calls[3:]) == ["bandit", "pip_audit"]
+
+
+def test_bandit_cache_key_tracks_head_and_uncommitted_python_files(
+    monkeypatch, tmp_path: Path
+) -> None:
+    (tmp_path / "a.py").write_text("x = 1\n", encoding="utf-8")
+    tree = {"sha": b"tree-a\n"}
+    monkeypatch.setattr(
+        "devr.cli._run_git",
+        lambda *_: _GitResult(returncode=0, stdout=tree["sha"]),
+    )
+    monkeypatch.setattr("devr.cli._git_status", lambda *_: [(" M", "a.py")])
+    args = ["-r", "."]
+
+    first = _bandit_cache_key(tmp_path, tmp_path / ".venv", args)
+    assert first is not None
+    assert _bandit_cache_key(tmp_path, tmp_path / ".venv", args) == first
+
+    (tmp_path / "a.py").write_text("x = 22\n", encoding="utf-8")
+    second = _bandit_cache_key(tmp_path, tmp_path / ".venv", args)
+    assert second != first
+
+    tree["sha"] = b"tree-b\n"
+    assert _bandit_cache_key(tmp_path, tmp_path / ".venv", args) != second
+
+    monkeypatch.setattr("devr.cli._run_git", lambda *_: None)
+    assert _bandit_cache_key(tmp_path, tmp_path / ".venv", args) is None
+
+
+def test_bandit_cache_key_tracks_config_and_ignored_python_files(
+    monkeypatch, tmp_path: Path
+) -> None:
+    (tmp_path / "pyproject.toml").write_text("[tool.bandit]\n", encoding="utf-8")
+    (tmp_path / "generated.py").write_text("x = 1\n", encoding="utf-8")
+    git_calls: list[list[str]] = []
+
+    def _run_git(_root: Path, args: list[str]) -> _GitResult:
+        git_calls.append(args)
+        if args[0] == "ls-files":
+            return _GitResult(returncode=0, stdout=b"generated.py\0notes.txt\0")
+        return _GitResult(returncode=0, stdout=b"tree\n")
+
+    monkeypatch.setattr("devr.cli._run_git", _run_git)
+    monkeypatch.setattr("devr.cli._git_status", lambda *_: [])
+    args = ["-r", ".", "-x", ".venv,build", "-c", "bandit.yaml"]
+
+    first = _bandit_cache_key(tmp_path, tmp_path / ".venv", args)
+    assert git_calls[-1][-2:] == [":(exclude).venv", ":(exclude)build"]
+
+    (tmp_path / "pyproject.toml").write_text(
+        "[tool.bandit]\nskips = ['B101']\n", encoding="utf-8"
+    )
+    second = _bandit_cache_key(tmp_path, tmp_path / ".venv", args)
+    assert second != first
+
+    (tmp_path / "bandit.yaml").write_text("skips: [B101]\n", encoding="utf-8")
+    third = _bandit_cache_key(tmp_path, tmp_path / ".venv", args)
+    assert third != second
 
-    result = runner.invoke(app, ["security", "--fail-fast"])
+    (tmp_path / "generated.py").write_text("x = 22\n", encoding="utf-8")
+    assert _bandit_cache_key(tmp_path, tmp_path / ".venv", args) != third
+
+
+def test_security_runs_bandit_even_when_pip_audit_fails(
+    monkeypatch, venv_path: Path
+) -> None:
+    calls = _record_run_module(monkeypatch, {"pip_audit": 1})
+    monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(venv_path=".venv"))
+
+    result = runner.invoke(app, ["security"], catch_exceptions=False)
 
     assert result.exit_code == 1
-    assert calls == ["pip_audit"]
+    assert sorted(module for module, _ in calls) == ["bandit", "pip_audit"]
     assert "Security checks failed: pip-audit" in result.output
 
 
-def test_security_reports_multiple_failures(monkeypatch, tmp_path: Path) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
+def test_security_fail_fast_stops_after_pip_audit_failure(
+    monkeypatch, venv_path: Path
+) -> None:
+    calls = _record_run_module(monkeypatch, {"pip_audit": 1})
+    monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(venv_path=".venv"))
 
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
+    result = runner.invoke(app, ["security", "--fail-fast"], catch_exceptions=False)
+
+    assert result.exit_code == 1
+    assert [module for module, _ in calls] == ["pip_audit"]
+    assert "Security checks failed: pip-audit" in result.output
+
+
+def test_security_reports_multiple_failures(monkeypatch, venv_path: Path) -> None:
     monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(venv_path=".venv"))
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
     monkeypatch.setattr("devr.cli.run_module", lambda *_args, **_kwargs: 1)
 
-    result = runner.invoke(app, ["security"])
+    result = runner.invoke(app, ["security"], catch_exceptions=False)
 
     assert result.exit_code == 1
     assert "Security checks failed: pip-audit, bandit" in result.output
 
 
-def test_security_fail_fast_reports_bandit_failure(monkeypatch, tmp_path: Path) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
-
-    def _run_module(_venv, module: str, _args: list[str], **_kwargs) -> int:
-        return 1 if module == "bandit" else 0
-
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
+def test_security_fail_fast_reports_bandit_failure(
+    monkeypatch, venv_path: Path
+) -> None:
+    _record_run_module(monkeypatch, {"bandit": 1})
     monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(venv_path=".venv"))
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
-    monkeypatch.setattr("devr.cli.run_module", _run_module)
 
-    result = runner.invoke(app, ["security", "--fail-fast"])
+    result = runner.invoke(app, ["security", "--fail-fast"], catch_exceptions=False)
 
     assert result.exit_code == 1
     assert "Security checks failed: bandit" in result.output
 
 
 def test_doctor_reports_detected_venv(monkeypatch, tmp_path: Path) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
+    venv_path = tmp_path / ".venv"
     venv_python_path = venv_path / "bin" / "python"
     venv_python_path.parent.mkdir(parents=True)
-    venv_python_path.write_text("", encoding="utf-8")
+    venv_python_path.touch()
 
     monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
     monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(venv_path=".venv"))
-    monkeypatch.setattr("devr.cli._run_git", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr("devr.checks._run_git", lambda *_args, **_kwargs: None)
 
-    result = runner.invoke(app, ["doctor"])
+    result = runner.invoke(app, ["doctor"], catch_exceptions=False)
 
     assert result.exit_code == 0
     assert "devr doctor" in result.output
@@ -246,9 +511,9 @@ def test_doctor_reports_missing_venv_with_hint(monkeypatch, tmp_path: Path) -> N
     monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
     monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(venv_path=".venv"))
     monkeypatch.setattr("devr.cli.is_inside_venv", lambda: False)
-    monkeypatch.setattr("devr.cli._run_git", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr("devr.checks._run_git", lambda *_args, **_kwargs: None)
 
-    result = runner.invoke(app, ["doctor"])
+    result = runner.invoke(app, ["doctor"], catch_exceptions=False)
 
     assert result.exit_code == 0
     assert "Resolved venv: none" in result.output
@@ -256,19 +521,12 @@ def test_doctor_reports_missing_venv_with_hint(monkeypatch, tmp_path: Path) -> N
 
 
 def test_bandit_excludes_include_detected_relative_venv(tmp_path: Path) -> None:
-    from devr.cli import _bandit_excludes
-
     excludes = _bandit_excludes(tmp_path, ".venv", tmp_path / "custom-venv")
 
-    assert (
-        excludes
-        == ".venv,venv,env,.git,__pycache__,.mypy_cache,.pytest_cache,.ruff_cache,.tox,.nox,build,dist,custom-venv"
-    )
+    assert excludes == f"{_DEFAULT_BANDIT_EXCLUDES},custom-venv"
 
 
 def test_bandit_excludes_normalize_configured_venv_path(tmp_path: Path) -> None:
-    from devr.cli import _bandit_excludes
-
     excludes = _bandit_excludes(tmp_path, " ./custom\\venv/ ", tmp_path / "custom-venv")
 
     assert excludes.startswith("custom/venv,.venv,venv,env")
@@ -279,42 +537,43 @@ def test_security_exits_when_no_venv(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig())
     monkeypatch.setattr("devr.cli.find_venv", lambda *_: None)
 
-    result = runner.invoke(app, ["security"])
+    result = runner.invoke(app, ["security"], catch_exceptions=False)
 
     assert result.exit_code == 2
     assert "No venv found. Run: devr init" in result.output
 
 
-def test_devr_version_falls_back_when_package_not_installed(monkeypatch) -> None:
+def test_devr_version_falls_back_when_package_not_installed(
+    monkeypatch, fresh_devr_version
+) -> None:
     def _raise(_: str) -> str:
         raise PackageNotFoundError
 
-    monkeypatch.setattr("devr.cli.version", _raise)
-
-    from devr.cli import _devr_version
+    monkeypatch.setattr("importlib.metadata.version", _raise)
 
     assert _devr_version() == "0.0.0"
 
 
 def test_install_project_falls_back_to_non_editable(
-    monkeypatch, tmp_path: Path
+    monkeypatch, pyproject_only_dir: Path
 ) -> None:
-    (tmp_path / "pyproject.toml").write_text("[project]\nname='x'\n", encoding="utf-8")
     calls: list[list[str]] = []
 
     def _run_module(_venv, _module: str, args: list[str], **_kwargs) -> int:
         calls.append(args)
-        return 1 if args == ["install", "-e", "."] else 0
+        return 1 if args[-2:] == ["-e", "."] else 0
 
     monkeypatch.setattr("devr.cli.run_module", _run_module)
 
-    install_project(tmp_path / ".venv", tmp_path)
+    install_project(pyproject_only_dir / ".venv", pyproject_only_dir)
 
-    assert calls == [["install", "-e", "."], ["install", "."]]
+    quiet = ["--disable-pip-version-check", "--no-input"]
+    assert calls == [["install", *quiet, "-e", "."], ["install", *quiet, "."]]
 
 
-def test_install_project_uses_requirements_file(monkeypatch, tmp_path: Path) -> None:
-    (tmp_path / "requirements.txt").write_text("pytest\n", encoding="utf-8")
+def test_install_project_uses_requirements_file(
+    monkeypatch, requirements_only_dir: Path
+) -> None:
     calls: list[list[str]] = []
 
     def _run_module(_venv, _module: str, args: list[str], **_kwargs) -> int:
@@ -323,32 +582,36 @@ def test_install_project_uses_requirements_file(monkeypatch, tmp_path: Path) ->
 
     monkeypatch.setattr("devr.cli.run_module", _run_module)
 
-    install_project(tmp_path / ".venv", tmp_path)
+    install_project(requirements_only_dir / ".venv", requirements_only_dir)
 
-    assert calls == [["install", "-r", "requirements.txt"]]
+    assert calls == [
+        [
+            "install",
+            "--disable-pip-version-check",
+            "--no-input",
+            "-r",
+            "requirements.txt",
+        ]
+    ]
 
 
 def test_install_project_warns_when_requirements_install_fails(
-    monkeypatch, tmp_path: Path, capsys
+    monkeypatch, requirements_only_dir: Path, capsys
 ) -> None:
-    (tmp_path / "requirements.txt").write_text("pytest\n", encoding="utf-8")
-
     monkeypatch.setattr("devr.cli.run_module", lambda *_args, **_kwargs: 1)
 
-    install_project(tmp_path / ".venv", tmp_path)
+    install_project(requirements_only_dir / ".venv", requirements_only_dir)
 
     out = capsys.readouterr().out
     assert "Warning: requirements install failed" in out
 
 
 def test_install_project_warns_when_both_install_attempts_fail(
-    monkeypatch, tmp_path: Path, capsys
+    monkeypatch, pyproject_only_dir: Path, capsys
 ) -> None:
-    (tmp_path / "pyproject.toml").write_text("[project]\nname='x'\n", encoding="utf-8")
-
     monkeypatch.setattr("devr.cli.run_module", lambda *_args, **_kwargs: 1)
 
-    install_project(tmp_path / ".venv", tmp_path)
+    install_project(pyproject_only_dir / ".venv", pyproject_only_dir)
 
     out = capsys.readouterr().out
     assert "Warning: project install failed" in out
@@ -387,27 +650,238 @@ def test_ensure_toolchain_exits_when_bootstrap_install_fails(
 ) -> None:
     monkeypatch.setattr("devr.cli.run_module", lambda *_args, **_kwargs: 1)
 
-    try:
+    with pytest.raises(Exit) as exc_info:
         ensure_toolchain(tmp_path / ".venv", tmp_path)
-    except Exit as exc:
-        assert exc.exit_code == 1
-    else:
-        raise AssertionError("Expected ensure_toolchain to exit on failure")
+
+    assert exc_info.value.exit_code == 1
+
+
+def test_ensure_toolchain_skips_bootstrap_upgrade_when_current(
+    monkeypatch, tmp_path: Path
+) -> None:
+    venv_dir = tmp_path / ".venv"
+    venv_dir.mkdir()
+    calls: list[list[str]] = []
+
+    def _run_module(_venv, _module: str, args: list[str], **_kwargs) -> int:
+        calls.append(args)
+        return 0
+
+    monkeypatch.setattr("devr.cli.run_module", _run_module)
+    monkeypatch.setattr(
+        "devr.cli.venv_package_versions",
+        lambda *_: {"pip": "25.1", "setuptools": "80.0.0", "wheel": "0.45.1"},
+    )
+    monkeypatch.delenv("DEVR_REFRESH_TOOLCHAIN", raising=False)
+
+    ensure_toolchain(venv_dir, tmp_path)
+
+    assert calls == [
+        ["install", "--disable-pip-version-check", "--no-input", *DEFAULT_TOOLCHAIN]
+    ]
+    assert (venv_dir / ".devr-toolchain.stamp").exists()
+
+
+def test_ensure_toolchain_reinstalls_missing_tool_despite_fresh_stamp(
+    monkeypatch, tmp_path: Path
+) -> None:
+    venv_dir = tmp_path / ".venv"
+    venv_dir.mkdir()
+    (venv_dir / ".devr-toolchain.stamp").write_text(
+        _toolchain_digest(), encoding="utf-8"
+    )
+    calls: list[list[str]] = []
+
+    def _run_module(_venv, _module: str, args: list[str], **_kwargs) -> int:
+        calls.append(args)
+        return 0
+
+    installed = {"pip": "25.1", "setuptools": "80.0.0", "wheel": "0.45.1"}
+    monkeypatch.setattr("devr.cli.run_module", _run_module)
+    monkeypatch.setattr(
+        "devr.cli.venv_package_versions",
+        lambda _venv, names: {n: installed.get(n, "") for n in names},
+    )
+    monkeypatch.delenv("DEVR_REFRESH_TOOLCHAIN", raising=False)
+
+    # Only the packaging tools are installed, so the stamp must not skip.
+    ensure_toolchain(venv_dir, tmp_path)
+
+    assert calls == [
+        ["install", "--disable-pip-version-check", "--no-input", *DEFAULT_TOOLCHAIN]
+    ]
+
+
+def test_ensure_toolchain_upgrades_outdated_or_refreshed_bootstrap(
+    monkeypatch, tmp_path: Path
+) -> None:
+    venv_dir = tmp_path / ".venv"
+    venv_dir.mkdir()
+    calls: list[list[str]] = []
+
+    def _run_module(_venv, _module: str, args: list[str], **_kwargs) -> int:
+        calls.append(args)
+        return 0
+
+    monkeypatch.setattr("devr.cli.run_module", _run_module)
+    bootstrap_versions = {"pip": "23.0", "setuptools": "", "wheel": "0.45.1"}
+    monkeypatch.setattr(
+        "devr.cli.venv_package_versions",
+        lambda _venv, names: {n: bootstrap_versions.get(n, "1.0") for n in names},
+    )
+    monkeypatch.delenv("DEVR_REFRESH_TOOLCHAIN", raising=False)
+
+    ensure_toolchain(venv_dir, tmp_path)
+
+    quiet = ["--disable-pip-version-check", "--no-input"]
+    floors = [f"{name}>={floor}" for name, floor in BOOTSTRAP_MIN_VERSIONS.items()]
+    assert calls == [["install", *quiet, *floors, *DEFAULT_TOOLCHAIN]]
+
+    # A fresh stamp for the same toolchain skips the install entirely.
+    calls.clear()
+    ensure_toolchain(venv_dir, tmp_path)
+    assert calls == []
+
+    # A stamp written for a different toolchain does not.
+    (venv_dir / ".devr-toolchain.stamp").write_text("stale", encoding="utf-8")
+    ensure_toolchain(venv_dir, tmp_path)
+    assert calls == [["install", *quiet, *floors, *DEFAULT_TOOLCHAIN]]
+
+    calls.clear()
+    monkeypatch.setenv("DEVR_REFRESH_TOOLCHAIN", "1")
+    ensure_toolchain(venv_dir, tmp_path)
+    assert calls == [
+        ["install", *quiet, "-U", "pip", "setuptools", "wheel", *DEFAULT_TOOLCHAIN]
+    ]
+
+
+def test_ensure_toolchain_and_install_project_prefer_uv(
+    monkeypatch, tmp_path: Path
+) -> None:
+    venv_dir = tmp_path / ".venv"
+    venv_dir.mkdir()
+    (tmp_path / "requirements.txt").write_text("pytest\n", encoding="utf-8")
+    calls: list[list[str]] = []
+
+    def _uv_pip_install(_venv, uv: str, args: list[str], **_kwargs) -> int:
+        calls.append([uv, *args])
+        return 0
+
+    def _run_module(*_args, **_kwargs) -> int:
+        raise AssertionError("pip must not run when uv is available")
+
+    monkeypatch.delenv("DEVR_NO_UV", raising=False)
+    monkeypatch.delenv("DEVR_REFRESH_TOOLCHAIN", raising=False)
+    monkeypatch.setattr("devr.cli.shutil.which", lambda _name: "/usr/bin/uv")
+    monkeypatch.setattr("devr.cli.uv_pip_install", _uv_pip_install)
+    monkeypatch.setattr("devr.cli.run_module", _run_module)
+    monkeypatch.setattr("devr.cli.venv_package_versions", lambda *_: None)
+
+    ensure_toolchain(venv_dir, tmp_path)
+    install_project(venv_dir, tmp_path)
+
+    floors = [f"{name}>={floor}" for name, floor in BOOTSTRAP_MIN_VERSIONS.items()]
+    assert calls == [
+        ["/usr/bin/uv", *floors, *DEFAULT_TOOLCHAIN],
+        ["/usr/bin/uv", "-r", "requirements.txt"],
+    ]
+
+
+def test_ensure_toolchain_retries_packaging_tools_separately(
+    monkeypatch, tmp_path: Path
+) -> None:
+    calls: list[list[str]] = []
+
+    def _run_module(_venv, _module: str, args: list[str], **_kwargs) -> int:
+        calls.append(args)
+        return 1 if len(calls) == 1 else 0
+
+    monkeypatch.setattr("devr.cli.run_module", _run_module)
+    monkeypatch.setattr("devr.cli.venv_package_versions", lambda *_: None)
+    monkeypatch.delenv("DEVR_REFRESH_TOOLCHAIN", raising=False)
+
+    ensure_toolchain(tmp_path / ".venv", tmp_path)
+
+    quiet = ["--disable-pip-version-check", "--no-input"]
+    floors = [f"{name}>={floor}" for name, floor in BOOTSTRAP_MIN_VERSIONS.items()]
+    assert calls == [
+        ["install", *quiet, *floors, *DEFAULT_TOOLCHAIN],
+        ["install", *quiet, *floors],
+        ["install", *quiet, *DEFAULT_TOOLCHAIN],
+    ]
 
 
 def test_install_precommit_hook_exits_on_failure(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setattr(
         "devr.cli._run_git",
-        lambda *_args, **_kwargs: SimpleNamespace(returncode=0, stdout="true\n"),
+        lambda *_args, **_kwargs: _GitResult(returncode=0, stdout="true\n"),
     )
     monkeypatch.setattr("devr.cli.run_module", lambda *_args, **_kwargs: 3)
 
-    try:
+    with pytest.raises(Exit) as exc_info:
         install_precommit_hook(tmp_path / ".venv", tmp_path)
-    except Exit as exc:
-        assert exc.exit_code == 3
-    else:
-        raise AssertionError("Expected install_precommit_hook to exit on failure")
+
+    assert exc_info.value.exit_code == 3
+
+
+def _write_precommit_hook(root: Path, install_python: Path) -> None:
+    hook = root / ".git" / "hooks" / "pre-commit"
+    hook.parent.mkdir(parents=True)
+    hook.write_text(
+        "#!/usr/bin/env bash\n"
+        "# File generated by pre-commit: https://pre-commit.com\n"
+        "# start templated\n"
+        f"INSTALL_PYTHON={install_python}\n"
+        "ARGS=(hook-impl --config=.pre-commit-config.yaml --hook-type=pre-commit)\n"
+        "# end templated\n",
+        encoding="utf-8",
+    )
+
+
+def test_install_precommit_hook_skips_when_hook_is_current(
+    monkeypatch, tmp_path: Path, capsys
+) -> None:
+    venv_dir = tmp_path / ".venv"
+    python = venv_dir / "bin" / "python3.12"
+    python.parent.mkdir(parents=True)
+    python.touch()
+    _write_precommit_hook(tmp_path, python)
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("pre-commit install should be skipped")
+
+    monkeypatch.setattr("devr.cli.venv_python", lambda venv: venv / "bin" / "python")
+    monkeypatch.setattr("devr.cli._run_git", _fail)
+    monkeypatch.setattr("devr.cli.run_module", _fail)
+
+    install_precommit_hook(venv_dir, tmp_path)
+
+    assert "pre-commit hook is already installed" in capsys.readouterr().out
+
+
+def test_install_precommit_hook_reinstalls_hook_from_another_venv(
+    monkeypatch, tmp_path: Path
+) -> None:
+    other_python = tmp_path / "other" / "bin" / "python"
+    other_python.parent.mkdir(parents=True)
+    other_python.touch()
+    _write_precommit_hook(tmp_path, other_python)
+    calls: list[str] = []
+
+    def _run_module(_venv, module: str, _args: list[str], **_kwargs) -> int:
+        calls.append(module)
+        return 0
+
+    monkeypatch.setattr("devr.cli.venv_python", lambda venv: venv / "bin" / "python")
+    monkeypatch.setattr(
+        "devr.cli._run_git",
+        lambda *_args, **_kwargs: _GitResult(returncode=0, stdout=b"true\n"),
+    )
+    monkeypatch.setattr("devr.cli.run_module", _run_module)
+
+    install_precommit_hook(tmp_path / ".venv", tmp_path)
+
+    assert calls == ["pre_commit"]
 
 
 def test_install_precommit_hook_skips_outside_git_repo(
@@ -432,356 +906,499 @@ def test_init_creates_venv_when_missing(monkeypatch, tmp_path: Path) -> None:
         "devr.cli.create_venv",
         lambda _root, venv_dir, python_exe=None: created.append((venv_dir, python_exe)),
     )
-    py = tmp_path / ".venv" / "bin" / "python"
-    py.parent.mkdir(parents=True)
-    py.write_text("", encoding="utf-8")
+    venv_dir = tmp_path / ".venv"
+    py_dir = venv_dir / "bin"
+    py_dir.mkdir(parents=True)
+    py = py_dir / "python"
+    py.touch()
     monkeypatch.setattr("devr.cli.venv_python", lambda _: py)
     monkeypatch.setattr("devr.cli.ensure_toolchain", lambda *_: None)
     monkeypatch.setattr("devr.cli.install_project", lambda *_: None)
     monkeypatch.setattr("devr.cli.write_precommit", lambda *_: None)
     monkeypatch.setattr("devr.cli.install_precommit_hook", lambda *_: None)
 
-    result = runner.invoke(app, ["init", "--python", "python3.11"])
+    result = runner.invoke(
+        app, ["init", "--python", "python3.11"], catch_exceptions=False
+    )
 
     assert result.exit_code == 0
-    assert created == [((tmp_path / ".venv").resolve(), "python3.11")]
-
+    assert created == [(venv_dir, "python3.11")]
 
-def test_init_exits_when_venv_python_missing(monkeypatch, tmp_path: Path) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
 
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
+def test_init_exits_when_venv_python_missing(
+    monkeypatch, tmp_path: Path, venv_path: Path
+) -> None:
     monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig())
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
     monkeypatch.setattr("devr.cli.venv_python", lambda _: tmp_path / "missing-python")
 
-    result = runner.invoke(app, ["init"])
+    result = runner.invoke(app, ["init"], catch_exceptions=False)
 
     assert result.exit_code == 2
 
 
-def test_check_changed_staged_scopes_targets(monkeypatch, tmp_path: Path) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
-    calls: list[tuple[str, list[str]]] = []
+def test_check_changed_staged_scopes_targets(
+    monkeypatch, tmp_path: Path, venv_path: Path
+) -> None:
     (tmp_path / "a.py").write_text("print('a')\n", encoding="utf-8")
     (tmp_path / "c.pyi").write_text("def f() -> None: ...\n", encoding="utf-8")
 
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
-    monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(run_tests=False))
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
-    monkeypatch.setattr("devr.cli._staged_files", lambda _: ["a.py", "b.txt", "c.pyi"])
-
-    def _run_module(_venv, module: str, args: list[str], **_kwargs) -> int:
-        calls.append((module, args))
-        return 0
-
-    monkeypatch.setattr("devr.cli.run_module", _run_module)
+    monkeypatch.setattr(
+        "devr.checks._staged_files", lambda *_: ["a.py", "b.txt", "c.pyi"]
+    )
 
-    result = runner.invoke(app, ["check", "--changed", "--staged"])
+    result, calls = _invoke_cli(
+        monkeypatch, DevrConfig(run_tests=False), ["check", "--changed", "--staged"]
+    )
 
     assert result.exit_code == 0
-    assert calls[0] == ("ruff", ["check", "a.py", "c.pyi"])
-    assert calls[1] == ("ruff", ["format", "--check", "a.py", "c.pyi"])
+    assert ("ruff", ["check", "a.py", "c.pyi"]) in calls
+    assert ("ruff", ["format", "--check", "a.py", "c.pyi"]) in calls
 
 
 def test_check_changed_uses_worktree_files_without_staged(
-    monkeypatch, tmp_path: Path
+    monkeypatch, tmp_path: Path, venv_path: Path
 ) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
-    calls: list[tuple[str, list[str]]] = []
     (tmp_path / "x.py").write_text("print('x')\n", encoding="utf-8")
 
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
-    monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(run_tests=False))
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
-    monkeypatch.setattr("devr.cli._changed_files", lambda *_: ["x.py", "notes.md"])
+    monkeypatch.setattr("devr.checks._changed_files", lambda *_: ["x.py", "notes.md"])
 
-    def _run_module(_venv, module: str, args: list[str], **_kwargs) -> int:
-        calls.append((module, args))
-        return 0
+    result, calls = _invoke_cli(
+        monkeypatch, DevrConfig(run_tests=False), ["check", "--changed"]
+    )
 
-    monkeypatch.setattr("devr.cli.run_module", _run_module)
+    assert result.exit_code == 0
+    assert ("ruff", ["check", "x.py"]) in calls
+    assert ("ruff", ["format", "--check", "x.py"]) in calls
 
-    result = runner.invoke(app, ["check", "--changed"])
+
+def test_check_changed_skips_lint_when_no_python_files(
+    monkeypatch, venv_path: Path
+) -> None:
+    monkeypatch.setattr("devr.checks._changed_files", lambda *_: ["README.md"])
+
+    result, calls = _invoke_cli(
+        monkeypatch, DevrConfig(run_tests=False), ["check", "--changed", "--fast"]
+    )
 
     assert result.exit_code == 0
-    assert calls[0] == ("ruff", ["check", "x.py"])
-    assert calls[1] == ("ruff", ["format", "--check", "x.py"])
+    assert calls == []
+    assert (
+        "No changed Python files detected; "
+        "skipping lint/format, type checks, and tests." in result.output
+    )
 
 
-def test_check_changed_skips_lint_when_no_python_files(
+def test_check_changed_skips_config_and_venv_when_no_python_files(
     monkeypatch, tmp_path: Path
 ) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
-    calls: list[tuple[str, list[str]]] = []
+    def _unexpected(*_args):
+        raise AssertionError("config and venv lookup should be skipped")
 
     monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
-    monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(run_tests=False))
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
-    monkeypatch.setattr("devr.cli._changed_files", lambda *_: ["README.md"])
+    monkeypatch.setattr("devr.checks.load_config", _unexpected)
+    monkeypatch.setattr("devr.checks.find_venv", _unexpected)
+    monkeypatch.setattr("devr.checks._staged_files", lambda *_: ["docs/index.md"])
 
-    def _run_module(_venv, module: str, args: list[str], **_kwargs) -> int:
-        calls.append((module, args))
-        return 0
+    result = runner.invoke(
+        app, ["check", "--staged", "--changed"], catch_exceptions=False
+    )
 
-    monkeypatch.setattr("devr.cli.run_module", _run_module)
+    assert result.exit_code == 0
+    assert "No changed Python files detected" in result.output
+
+
+def test_check_changed_skips_pytest_when_no_python_files(
+    monkeypatch, venv_path: Path
+) -> None:
+    monkeypatch.setattr("devr.checks._changed_files", lambda *_: ["README.md"])
 
-    result = runner.invoke(app, ["check", "--changed", "--fast"])
+    result, calls = _invoke_cli(
+        monkeypatch,
+        DevrConfig(run_tests=True, coverage_branch=False, coverage_min=85),
+        ["check", "--changed"],
+    )
 
     assert result.exit_code == 0
     assert calls == []
-    assert "No changed Python files detected; skipping lint/format." in result.output
-    assert "No changed Python files detected; skipping type checks." in result.output
+    assert "devr check passed" not in result.output
 
 
-def test_check_changed_runs_pytest_when_no_python_files(
-    monkeypatch, tmp_path: Path
+def test_check_no_tests_skips_pytest(monkeypatch, venv_path: Path) -> None:
+    result, calls = _invoke_cli(
+        monkeypatch, DevrConfig(run_tests=True), ["check", "--no-tests"]
+    )
+
+    assert result.exit_code == 0
+    assert (
+        "pytest",
+        ["--cov=.", "--cov-branch", "--cov-report=term-missing", "--cov-fail-under=85"],
+    ) not in calls
+    assert "Skipping tests (--no-tests)." in result.output
+
+
+def test_check_fast_skips_pytest(monkeypatch, venv_path: Path) -> None:
+    result, calls = _invoke_cli(
+        monkeypatch, DevrConfig(run_tests=True), ["check", "--fast"]
+    )
+
+    assert result.exit_code == 0
+    assert (
+        "pytest",
+        ["--cov=.", "--cov-branch", "--cov-report=term-missing", "--cov-fail-under=85"],
+    ) not in calls
+    assert "Skipping tests (--fast)." in result.output
+
+
+@pytest.mark.parametrize(
+    ("typechecker", "expected"),
+    [
+        ("mypy", ("mypy", ["--follow-imports=silent", "typed.py"])),
+        ("pyright", ("pyright", ["typed.py"])),
+    ],
+)
+def test_check_changed_scopes_typecheck_targets(
+    monkeypatch,
+    tmp_path: Path,
+    venv_path: Path,
+    typechecker: str,
+    expected: tuple[str, list[str]],
 ) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
-    calls: list[tuple[str, list[str]]] = []
+    (tmp_path / "typed.py").write_text("value: int = 1\n", encoding="utf-8")
 
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
     monkeypatch.setattr(
-        "devr.cli.load_config",
-        lambda _: DevrConfig(run_tests=True, coverage_branch=False, coverage_min=85),
+        "devr.checks._changed_files", lambda *_: ["typed.py", "README.md"]
     )
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
-    monkeypatch.setattr("devr.cli._changed_files", lambda *_: ["README.md"])
 
-    def _run_module(_venv, module: str, args: list[str], **_kwargs) -> int:
-        calls.append((module, args))
-        return 0
+    result, calls = _invoke_cli(
+        monkeypatch,
+        DevrConfig(typechecker=typechecker, run_tests=False),
+        ["check", "--changed", "--fast"],
+    )
 
-    monkeypatch.setattr("devr.cli.run_module", _run_module)
+    assert result.exit_code == 0
+    assert expected in calls
 
-    result = runner.invoke(app, ["check", "--changed"])
+
+def test_check_changed_only_config_scopes_to_changed_files(
+    monkeypatch, tmp_path: Path, venv_path: Path
+) -> None:
+    (tmp_path / "edited.py").write_text("value = 1\n", encoding="utf-8")
+
+    monkeypatch.setattr("devr.checks._changed_files", lambda *_: ["edited.py", "a.md"])
+    monkeypatch.delenv("DEVR_FULL", raising=False)
+
+    result, calls = _invoke_cli(
+        monkeypatch, DevrConfig(changed_only=True, run_tests=False), ["check"]
+    )
 
     assert result.exit_code == 0
-    assert calls == [
-        (
-            "pytest",
-            ["--cov=.", "--cov-report=term-missing", "--cov-fail-under=85"],
-        )
+    assert "Scoping checks to 1 changed Python file(s)" in result.output
+    assert sorted(calls) == [
+        ("mypy", ["--follow-imports=silent", "edited.py"]),
+        ("ruff", ["check", "edited.py"]),
+        ("ruff", ["format", "--check", "edited.py"]),
     ]
 
 
-def test_check_no_tests_skips_pytest(monkeypatch, tmp_path: Path) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
-    calls: list[tuple[str, list[str]]] = []
+def test_check_changed_passes_sorted_unique_files_to_every_stage(
+    monkeypatch, tmp_path: Path, venv_path: Path
+) -> None:
+    for name in ("b.py", "a.py"):
+        (tmp_path / name).write_text("value = 1\n", encoding="utf-8")
 
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
-    monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(run_tests=True))
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
+    monkeypatch.setattr(
+        "devr.checks._changed_files", lambda *_: ["b.py", "deleted.py", "a.py", "b.py"]
+    )
 
-    def _run_module(_venv, module: str, args: list[str], **_kwargs) -> int:
-        calls.append((module, args))
-        return 0
+    result, calls = _invoke_cli(
+        monkeypatch, DevrConfig(run_tests=False), ["check", "--changed"]
+    )
+
+    assert result.exit_code == 0
+    assert sorted(calls) == [
+        ("mypy", ["--follow-imports=silent", "a.py", "b.py"]),
+        ("ruff", ["check", "a.py", "b.py"]),
+        ("ruff", ["format", "--check", "a.py", "b.py"]),
+    ]
 
-    monkeypatch.setattr("devr.cli.run_module", _run_module)
 
-    result = runner.invoke(app, ["check", "--no-tests"])
+def test_check_changed_only_config_runs_full_tree_without_changes(
+    monkeypatch, venv_path: Path
+) -> None:
+    monkeypatch.setattr("devr.checks._changed_files", lambda *_: [])
+    monkeypatch.delenv("DEVR_FULL", raising=False)
+
+    result, calls = _invoke_cli(
+        monkeypatch, DevrConfig(changed_only=True, run_tests=False), ["check"]
+    )
 
     assert result.exit_code == 0
-    assert (
-        "pytest",
-        ["--cov=.", "--cov-branch", "--cov-report=term-missing", "--cov-fail-under=85"],
-    ) not in calls
-    assert "Skipping tests (--no-tests)." in result.output
+    assert ("ruff", ["check", "."]) in calls
+    assert ("mypy", ["."]) in calls
 
 
-def test_check_fast_skips_pytest(monkeypatch, tmp_path: Path) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
-    calls: list[tuple[str, list[str]]] = []
+def test_check_all_flag_and_devr_full_env_disable_scoping(
+    monkeypatch, venv_path: Path
+) -> None:
+    calls = _record_run_module(monkeypatch)
+
+    monkeypatch.setattr(
+        "devr.checks.load_config",
+        lambda _: DevrConfig(changed_only=True, run_tests=False),
+    )
+
+    def _changed_files(*_args):
+        raise AssertionError("full-tree runs must not query git")
+
+    monkeypatch.setattr("devr.checks._changed_files", _changed_files)
+
+    result = runner.invoke(app, ["check", "--all", "--changed"], catch_exceptions=False)
+
+    assert result.exit_code == 0
+    assert "Warning: --changed is ignored" in result.output
+    assert ("ruff", ["check", "."]) in calls
+
+    calls.clear()
+    monkeypatch.setenv("DEVR_FULL", "1")
+
+    result = runner.invoke(app, ["check"], catch_exceptions=False)
+
+    assert result.exit_code == 0
+    assert ("mypy", ["."]) in calls
 
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
-    monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(run_tests=True))
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
 
-    def _run_module(_venv, module: str, args: list[str], **_kwargs) -> int:
-        calls.append((module, args))
-        return 0
+def test_check_uses_mypy_daemon_for_full_tree_runs(
+    monkeypatch, venv_path: Path
+) -> None:
+    bin_dir = venv_path / ("Scripts" if os.name == "nt" else "bin")
+    bin_dir.mkdir(parents=True)
+    (bin_dir / ("dmypy.exe" if os.name == "nt" else "dmypy")).touch()
+    calls = _record_run_module(monkeypatch)
 
-    monkeypatch.setattr("devr.cli.run_module", _run_module)
+    monkeypatch.setattr(
+        "devr.checks.load_config",
+        lambda _: DevrConfig(run_tests=False, mypy_daemon=True),
+    )
 
-    result = runner.invoke(app, ["check", "--fast"])
+    result = runner.invoke(app, ["check"], catch_exceptions=False)
 
     assert result.exit_code == 0
-    assert (
-        "pytest",
-        ["--cov=.", "--cov-branch", "--cov-report=term-missing", "--cov-fail-under=85"],
-    ) not in calls
-    assert "Skipping tests (--fast)." in result.output
+    status_file = str(venv_path / ".devr-dmypy.json")
+    assert calls[-1] == (
+        "mypy.dmypy",
+        ["--status-file", status_file, "run", "--", "."],
+    )
 
+    calls.clear()
+    result = runner.invoke(app, ["check", "--no-daemon"], catch_exceptions=False)
 
-def test_check_changed_scopes_typecheck_targets(monkeypatch, tmp_path: Path) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
-    calls: list[tuple[str, list[str]]] = []
-    (tmp_path / "typed.py").write_text("value: int = 1\n", encoding="utf-8")
+    assert result.exit_code == 0
+    assert calls[-1] == ("mypy", ["."])
 
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
-    monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(run_tests=False))
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
-    monkeypatch.setattr("devr.cli._changed_files", lambda *_: ["typed.py", "README.md"])
 
-    def _run_module(_venv, module: str, args: list[str], **_kwargs) -> int:
-        calls.append((module, args))
-        return 0
+def test_check_keeps_plain_mypy_unless_daemon_is_enabled(
+    monkeypatch, venv_path: Path
+) -> None:
+    bin_dir = venv_path / ("Scripts" if os.name == "nt" else "bin")
+    bin_dir.mkdir(parents=True)
+    (bin_dir / ("dmypy.exe" if os.name == "nt" else "dmypy")).touch()
+    calls = _record_run_module(monkeypatch)
 
-    monkeypatch.setattr("devr.cli.run_module", _run_module)
+    monkeypatch.setattr(
+        "devr.checks.load_config", lambda _: DevrConfig(run_tests=False)
+    )
 
-    result = runner.invoke(app, ["check", "--changed", "--fast"])
+    result = runner.invoke(app, ["check"], catch_exceptions=False)
 
     assert result.exit_code == 0
-    assert calls[-1] == ("mypy", ["typed.py"])
+    assert calls[-1] == ("mypy", ["."])
 
 
-def test_check_changed_scopes_pyright_targets(monkeypatch, tmp_path: Path) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
-    calls: list[tuple[str, list[str]]] = []
-    (tmp_path / "typed.py").write_text("value: int = 1\n", encoding="utf-8")
+@pytest.mark.parametrize(
+    ("config_name", "config_text"),
+    [
+        ("pyproject.toml", '[tool.mypy]\nfollow_imports = "silent"\n'),
+        ("mypy.ini", "[mypy]\nfollow_imports = silent\n"),
+        ("setup.cfg", "[mypy]\nfollow_imports = silent\n"),
+    ],
+)
+def test_check_skips_mypy_daemon_when_imports_are_silenced(
+    monkeypatch, tmp_path: Path, venv_path: Path, config_name: str, config_text: str
+) -> None:
+    bin_dir = venv_path / ("Scripts" if os.name == "nt" else "bin")
+    bin_dir.mkdir(parents=True)
+    (bin_dir / ("dmypy.exe" if os.name == "nt" else "dmypy")).touch()
+    (tmp_path / config_name).write_text(config_text, encoding="utf-8")
+    calls = _record_run_module(monkeypatch)
 
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
     monkeypatch.setattr(
-        "devr.cli.load_config",
-        lambda _: DevrConfig(typechecker="pyright", run_tests=False),
+        "devr.checks.load_config",
+        lambda _: DevrConfig(run_tests=False, mypy_daemon=True),
     )
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
-    monkeypatch.setattr("devr.cli._changed_files", lambda *_: ["typed.py"])
 
-    def _run_module(_venv, module: str, args: list[str], **_kwargs) -> int:
-        calls.append((module, args))
-        return 0
+    result = runner.invoke(app, ["check"], catch_exceptions=False)
+
+    assert result.exit_code == 0
+    assert calls[-1] == ("mypy", ["."])
 
-    monkeypatch.setattr("devr.cli.run_module", _run_module)
 
-    result = runner.invoke(app, ["check", "--changed", "--fast"])
+def test_check_black_formatter_paths(monkeypatch, venv_path: Path) -> None:
+    result, calls = _invoke_cli(
+        monkeypatch,
+        DevrConfig(formatter="black", typechecker="pyright", run_tests=False),
+        ["check"],
+    )
 
     assert result.exit_code == 0
-    assert calls[-1] == ("pyright", ["typed.py"])
+    assert ("ruff", ["check", "."]) in calls
+    assert ("black", ["-q", "--check", "."]) in calls
 
 
-def test_check_black_formatter_paths(monkeypatch, tmp_path: Path) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
-    calls: list[tuple[str, list[str]]] = []
+@pytest.mark.parametrize(
+    ("config", "message"),
+    [
+        (DevrConfig(formatter="unknown", run_tests=False), "Unknown formatter"),
+        (DevrConfig(typechecker="odd", run_tests=False), "Unknown typechecker"),
+    ],
+)
+def test_check_exits_for_unknown_tool(
+    monkeypatch, venv_path: Path, config: DevrConfig, message: str
+) -> None:
+    monkeypatch.setattr("devr.checks.load_config", lambda _: config)
+    monkeypatch.setattr("devr.cli.run_module", lambda *_args, **_kwargs: 0)
 
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
-    monkeypatch.setattr(
-        "devr.cli.load_config",
-        lambda _: DevrConfig(formatter="black", typechecker="pyright", run_tests=False),
-    )
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
+    result = runner.invoke(app, ["check"], catch_exceptions=False)
 
-    def _run_module(_venv, module: str, args: list[str], **_kwargs) -> int:
-        calls.append((module, args))
-        return 0
+    assert result.exit_code == 2
+    assert message in result.output
 
-    monkeypatch.setattr("devr.cli.run_module", _run_module)
 
-    result = runner.invoke(app, ["check"])
+def test_check_runs_pytest_with_branch_coverage(monkeypatch, venv_path: Path) -> None:
+    result, calls = _invoke_cli(
+        monkeypatch, DevrConfig(coverage_branch=True, coverage_min=85), ["check"]
+    )
 
     assert result.exit_code == 0
-    assert calls[0] == ("ruff", ["check", "."])
-    assert calls[1] == ("black", ["-q", "--check", "."])
+    assert calls[-1] == (
+        "pytest",
+        ["--cov=.", "--cov-branch", "--cov-report=term-missing", "--cov-fail-under=85"],
+    )
 
 
-def test_check_exits_for_unknown_formatter(monkeypatch, tmp_path: Path) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
+def test_check_runs_pytest_in_parallel_when_xdist_is_installed(
+    monkeypatch, venv_path: Path
+) -> None:
+    calls = _record_run_module(monkeypatch)
+    config = DevrConfig(coverage_branch=False, coverage_min=85)
 
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
+    monkeypatch.setattr("devr.checks.load_config", lambda _: config)
     monkeypatch.setattr(
-        "devr.cli.load_config",
-        lambda _: DevrConfig(formatter="unknown", run_tests=False),
+        "devr.checks.venv_package_versions",
+        lambda _venv, names: {name: "3.6.1" for name in names},
     )
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
 
-    result = runner.invoke(app, ["check"])
+    result = runner.invoke(app, ["check"], catch_exceptions=False)
 
-    assert result.exit_code == 2
-    assert "Unknown formatter" in result.output
+    assert result.exit_code == 0
+    assert calls[-1] == (
+        "pytest",
+        ["-n", "auto", "--cov=.", "--cov-report=term-missing", "--cov-fail-under=85"],
+    )
 
+    config = DevrConfig(coverage_branch=False, coverage_min=85, parallel_tests=False)
+    result = runner.invoke(app, ["check"], catch_exceptions=False)
 
-def test_check_exits_for_unknown_typechecker(monkeypatch, tmp_path: Path) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
+    assert result.exit_code == 0
+    assert calls[-1][1][:2] == ["--cov=.", "--cov-report=term-missing"]
 
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
-    monkeypatch.setattr(
-        "devr.cli.load_config",
-        lambda _: DevrConfig(typechecker="odd", run_tests=False),
-    )
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
-    monkeypatch.setattr("devr.cli.run_module", lambda *_args, **_kwargs: 0)
 
-    result = runner.invoke(app, ["check"])
+def test_xdist_probe_is_cached_until_site_packages_changes(
+    monkeypatch, tmp_path: Path
+) -> None:
+    venv_dir = tmp_path / ".venv"
+    site_packages = venv_dir / "lib" / "python3.11" / "site-packages"
+    site_packages.mkdir(parents=True)
+    (venv_dir / "bin").mkdir()
+    (venv_dir / "bin" / "python").touch()
+    probes: list[list[str]] = []
 
-    assert result.exit_code == 2
-    assert "Unknown typechecker" in result.output
+    def _versions(_venv: Path, names: list[str]) -> dict[str, str]:
+        probes.append(names)
+        return {name: "3.6.1" for name in names}
 
+    monkeypatch.setattr("devr.checks.venv_package_versions", _versions)
 
-def test_check_runs_pytest_with_branch_coverage(monkeypatch, tmp_path: Path) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
-    calls: list[tuple[str, list[str]]] = []
+    assert _xdist_available(venv_dir, DevrConfig()) is True
+    assert _xdist_available(venv_dir, DevrConfig()) is True
+    assert len(probes) == 1
 
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
-    monkeypatch.setattr(
-        "devr.cli.load_config",
-        lambda _: DevrConfig(coverage_branch=True, coverage_min=85),
-    )
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
+    # Installing or removing packages touches site-packages.
+    stat = site_packages.stat()
+    os.utime(site_packages, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert _xdist_available(venv_dir, DevrConfig()) is True
+    assert len(probes) == 2
 
-    def _run_module(_venv, module: str, args: list[str], **_kwargs) -> int:
-        calls.append((module, args))
-        return 0
 
-    monkeypatch.setattr("devr.cli.run_module", _run_module)
+def test_check_scopes_coverage_to_configured_or_src_targets(
+    monkeypatch, tmp_path: Path, venv_path: Path
+) -> None:
+    calls = _record_run_module(monkeypatch)
+    config = DevrConfig(coverage_branch=False, coverage_targets=("pkg", "tools"))
+
+    monkeypatch.setattr("devr.checks.load_config", lambda _: config)
 
-    result = runner.invoke(app, ["check"])
+    result = runner.invoke(app, ["check"], catch_exceptions=False)
 
     assert result.exit_code == 0
     assert calls[-1] == (
         "pytest",
-        ["--cov=.", "--cov-branch", "--cov-report=term-missing", "--cov-fail-under=85"],
+        [
+            "--cov=pkg",
+            "--cov=tools",
+            "--cov-report=term-missing",
+            "--cov-fail-under=85",
+        ],
+    )
+
+    (tmp_path / "src").mkdir()
+    config = DevrConfig()
+
+    result = runner.invoke(app, ["check"], catch_exceptions=False)
+
+    assert result.exit_code == 0
+    assert calls[-1] == (
+        "pytest",
+        [
+            "--cov=src",
+            "--cov-branch",
+            "--cov-report=term-missing",
+            "--cov-fail-under=85",
+        ],
     )
 
 
 def test_check_exits_when_no_venv(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
-    monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig())
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: None)
+    monkeypatch.setattr("devr.checks.load_config", lambda _: DevrConfig())
+    monkeypatch.setattr("devr.checks.find_venv", lambda *_: None)
 
-    result = runner.invoke(app, ["check"])
+    result = runner.invoke(app, ["check"], catch_exceptions=False)
 
     assert result.exit_code == 2
     assert "No venv found. Run: devr init" in result.output
 
 
-def test_fix_exits_for_unknown_formatter(monkeypatch, tmp_path: Path) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
-
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
+def test_fix_exits_for_unknown_formatter(monkeypatch, venv_path: Path) -> None:
     monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(formatter="weird"))
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
 
-    result = runner.invoke(app, ["fix"])
+    result = runner.invoke(app, ["fix"], catch_exceptions=False)
 
     assert result.exit_code == 2
     assert "Unknown formatter" in result.output
 
 
-def test_fix_runs_ruff_commands(monkeypatch, tmp_path: Path) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
-    calls: list[tuple[str, list[str]]] = []
-
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
-    monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(formatter="ruff"))
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
-
-    def _run_module(_venv, module: str, args: list[str], **_kwargs) -> int:
-        calls.append((module, args))
-        return 0
-
-    monkeypatch.setattr("devr.cli.run_module", _run_module)
-
-    result = runner.invoke(app, ["fix"])
+def test_fix_runs_ruff_commands(monkeypatch, venv_path: Path) -> None:
+    result, calls = _invoke_cli(monkeypatch, DevrConfig(formatter="ruff"), ["fix"])
 
     assert result.exit_code == 0
     assert calls == [
@@ -795,44 +1412,95 @@ def test_fix_exits_when_no_venv(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig())
     monkeypatch.setattr("devr.cli.find_venv", lambda *_: None)
 
-    result = runner.invoke(app, ["fix"])
+    result = runner.invoke(app, ["fix"], catch_exceptions=False)
 
     assert result.exit_code == 2
 
 
 def test_staged_files_returns_empty_on_git_failure(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setattr(
-        "devr.cli.subprocess.run",
-        lambda *args, **kwargs: SimpleNamespace(returncode=1, stdout=""),
+        "devr.checks.subprocess.Popen",
+        lambda *args, **kwargs: _FakeGitProcess(b"", returncode=1),
     )
 
-    from devr.cli import _staged_files
-
     assert _staged_files(tmp_path) == []
 
 
 def test_staged_files_collects_paths(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setattr(
-        "devr.cli.subprocess.run",
-        lambda *args, **kwargs: SimpleNamespace(
-            returncode=0, stdout="a.py\n\n b.pyi \n"
+        "devr.checks.subprocess.Popen",
+        lambda *args, **kwargs: _FakeGitProcess(
+            b"M  a.py\0A  b.pyi\0 M unstaged.py\0?? new.py\0"
         ),
     )
 
-    from devr.cli import _staged_files
-
     assert _staged_files(tmp_path) == ["a.py", "b.pyi"]
 
 
+def test_staged_files_are_cached_until_index_or_head_changes(
+    monkeypatch, tmp_path: Path
+) -> None:
+    git_dir = tmp_path / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+    (git_dir / "refs" / "heads" / "main").write_text("abc\n", encoding="utf-8")
+    (git_dir / "index").write_bytes(b"index-v1")
+    calls: list[list[str]] = []
+
+    def _popen(args: list[str], **_kwargs):
+        calls.append(args)
+        return _FakeGitProcess(f"A  file{len(calls)}.py\0".encode())
+
+    monkeypatch.setattr("devr.checks.subprocess.Popen", _popen)
+
+    assert _staged_files(tmp_path) == ["file1.py"]
+    assert _staged_files(tmp_path) == ["file1.py"]
+    assert len(calls) == 1
+
+    (git_dir / "index").write_bytes(b"index-v2-longer")
+    assert _staged_files(tmp_path) == ["file2.py"]
+
+    (git_dir / "refs" / "heads" / "main").write_text("def\n", encoding="utf-8")
+    assert _staged_files(tmp_path) == ["file3.py"]
+    assert _staged_files(tmp_path) == ["file3.py"]
+    assert len(calls) == 3
+
+
+def test_staged_files_cache_ignores_corrupt_cache_file(
+    monkeypatch, tmp_path: Path
+) -> None:
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    (git_dir / "HEAD").write_text("0123abcd\n", encoding="utf-8")
+    (git_dir / "index").write_bytes(b"index")
+    (git_dir / "devr-cache.json").write_text("{not json", encoding="utf-8")
+    monkeypatch.setattr(
+        "devr.checks.subprocess.Popen",
+        lambda *_args, **_kwargs: _FakeGitProcess(b"M  a.py\0"),
+    )
+
+    assert _staged_files(tmp_path) == ["a.py"]
+    assert "a.py" in (git_dir / "devr-cache.json").read_text(encoding="utf-8")
+
+
+def test_staged_files_decode_non_utf8_paths_with_fsdecode(
+    monkeypatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(
+        "devr.checks.subprocess.Popen",
+        lambda *_args, **_kwargs: _FakeGitProcess(b"M  caf\xe9.py\0"),
+    )
+
+    assert _staged_files(tmp_path) == [os.fsdecode(b"caf\xe9.py")]
+
+
 def test_staged_files_returns_empty_when_git_is_unavailable(
     monkeypatch, tmp_path: Path
 ) -> None:
     def _raise(*_args, **_kwargs):
         raise FileNotFoundError
 
-    monkeypatch.setattr("devr.cli.subprocess.run", _raise)
-
-    from devr.cli import _staged_files
+    monkeypatch.setattr("devr.checks.subprocess.Popen", _raise)
 
     assert _staged_files(tmp_path) == []
 
@@ -842,11 +1510,9 @@ def test_is_git_repo_uses_cache(monkeypatch, tmp_path: Path) -> None:
 
     def _run_git(_root: Path, args: list[str]):
         calls.append(args)
-        return SimpleNamespace(returncode=0, stdout="true\n")
-
-    monkeypatch.setattr("devr.cli._run_git", _run_git)
+        return _GitResult(returncode=0, stdout="true\n")
 
-    from devr.cli import _is_git_repo
+    monkeypatch.setattr("devr.checks._run_git", _run_git)
 
     cache: dict[str, bool] = {}
     assert _is_git_repo(tmp_path, cache) is True
@@ -854,59 +1520,69 @@ def test_is_git_repo_uses_cache(monkeypatch, tmp_path: Path) -> None:
     assert calls == [["rev-parse", "--is-inside-work-tree"]]
 
 
+def test_is_git_repo_skips_git_when_dot_git_exists(monkeypatch, tmp_path: Path) -> None:
+    (tmp_path / ".git").mkdir()
+
+    def _run_git(*_args):
+        raise AssertionError("git should not be spawned")
+
+    monkeypatch.setattr("devr.checks._run_git", _run_git)
+
+    assert _is_git_repo(tmp_path) is True
+
+
 def test_check_changed_reuses_cached_git_repo_detection(
-    monkeypatch, tmp_path: Path
+    monkeypatch, tmp_path: Path, venv_path: Path
 ) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
     calls: list[list[str]] = []
 
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
-    monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(run_tests=False))
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
+    monkeypatch.setattr(
+        "devr.checks.load_config", lambda _: DevrConfig(run_tests=False)
+    )
     monkeypatch.setattr("devr.cli.run_module", lambda *_args, **_kwargs: 0)
 
     def _run_git(_root: Path, args: list[str]):
-        calls.append(args)
+        calls.append(["git", *args])
         return None
 
-    monkeypatch.setattr("devr.cli._run_git", _run_git)
+    def _popen(args: list[str], **_kwargs):
+        calls.append(args)
+        return _FakeGitProcess(b"", returncode=128)
 
-    result = runner.invoke(app, ["check", "--changed", "--fast"])
+    monkeypatch.setattr("devr.checks._run_git", _run_git)
+    monkeypatch.setattr("devr.checks.subprocess.Popen", _popen)
+
+    result = runner.invoke(
+        app, ["check", "--changed", "--fast"], catch_exceptions=False
+    )
 
     assert result.exit_code == 0
     assert calls == [
-        ["diff", "--name-only", "HEAD"],
-        ["diff", "--name-only"],
-        ["diff", "--name-only", "--cached"],
-        ["rev-parse", "--is-inside-work-tree"],
+        ["git", "status", "--porcelain=v1", "-z", "--untracked-files=all"],
+        ["git", "rev-parse", "--is-inside-work-tree"],
     ]
 
 
 def test_changed_files_collects_tracked_and_untracked(
     monkeypatch, tmp_path: Path
 ) -> None:
-    responses = [
-        SimpleNamespace(returncode=0, stdout="a.py\na.py\nsub/b.py\n"),
-        SimpleNamespace(returncode=0, stdout="new.py\n"),
-    ]
-    monkeypatch.setattr(
-        "devr.cli.subprocess.run", lambda *args, **kwargs: responses.pop(0)
-    )
+    calls: list[list[str]] = []
+
+    def _popen(args: list[str], **_kwargs):
+        calls.append(args)
+        return _FakeGitProcess(b" M a.py\0MM sub/b.py\0?? new.py\0")
 
-    from devr.cli import _changed_files
+    monkeypatch.setattr("devr.checks.subprocess.Popen", _popen)
 
     assert _changed_files(tmp_path) == ["a.py", "sub/b.py", "new.py"]
+    assert calls == [["git", "status", "--porcelain=v1", "-z", "--untracked-files=all"]]
 
 
 def test_filter_py_includes_only_python_files() -> None:
-    from devr.cli import _filter_py
-
     assert _filter_py(["a.py", "b.pyi", "README.md"]) == ["a.py", "b.pyi"]
 
 
 def test_existing_files_filters_missing_paths(tmp_path: Path) -> None:
-    from devr.cli import _existing_files
-
     keep = tmp_path / "keep.py"
     keep.write_text("print('ok')\n", encoding="utf-8")
 
@@ -914,8 +1590,6 @@ def test_existing_files_filters_missing_paths(tmp_path: Path) -> None:
 
 
 def test_existing_files_skips_paths_outside_project_root(tmp_path: Path) -> None:
-    from devr.cli import _existing_files
-
     outside = tmp_path.parent / "outside.py"
     outside.write_text("print('outside')\n", encoding="utf-8")
     inside = tmp_path / "inside.py"
@@ -927,118 +1601,133 @@ def test_existing_files_skips_paths_outside_project_root(tmp_path: Path) -> None
 def test_existing_files_skips_directories_named_like_python_files(
     tmp_path: Path,
 ) -> None:
-    from devr.cli import _existing_files
-
     pseudo_file_dir = tmp_path / "pkg.py"
     pseudo_file_dir.mkdir()
 
     assert _existing_files(tmp_path, ["pkg.py"]) == []
 
 
-def test_check_changed_skips_deleted_python_files(monkeypatch, tmp_path: Path) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
-    calls: list[tuple[str, list[str]]] = []
+@pytest.mark.skipif(os.name == "nt", reason="symlinks need extra privileges on Windows")
+def test_existing_files_resolves_symlinks_for_containment(tmp_path: Path) -> None:
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "real.py").write_text("x = 1\n", encoding="utf-8")
+    outside = tmp_path / "outside.py"
+    outside.write_text("x = 2\n", encoding="utf-8")
+    (root / "inner.py").symlink_to(root / "real.py")
+    (root / "escape.py").symlink_to(outside)
+
+    files = ["real.py", "inner.py", "escape.py", str(root / "real.py")]
+    assert _existing_files(root, files) == [
+        "real.py",
+        "inner.py",
+        str(root / "real.py"),
+    ]
 
-    (tmp_path / "live.py").write_text("print('ok')\n", encoding="utf-8")
 
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
-    monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(run_tests=False))
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
-    monkeypatch.setattr("devr.cli._changed_files", lambda *_: ["deleted.py", "live.py"])
+def test_existing_files_rejects_paths_through_symlinked_directories(
+    tmp_path: Path,
+) -> None:
+    root = tmp_path / "root"
+    (root / "pkg").mkdir(parents=True)
+    (root / "pkg" / "mod.py").touch()
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "mod.py").touch()
+    (root / "linkdir").symlink_to(outside, target_is_directory=True)
+    (root / "alias").symlink_to(root / "pkg", target_is_directory=True)
 
-    def _run_module(_venv, module: str, args: list[str], **_kwargs) -> int:
-        calls.append((module, args))
-        return 0
+    files = ["linkdir/mod.py", "alias/mod.py", "pkg/mod.py"]
+    assert _existing_files(root, files) == ["alias/mod.py", "pkg/mod.py"]
 
-    monkeypatch.setattr("devr.cli.run_module", _run_module)
 
-    result = runner.invoke(app, ["check", "--changed", "--fast"])
+def test_check_changed_skips_deleted_python_files(
+    monkeypatch, tmp_path: Path, venv_path: Path
+) -> None:
+    (tmp_path / "live.py").write_text("print('ok')\n", encoding="utf-8")
+
+    monkeypatch.setattr(
+        "devr.checks._changed_files", lambda *_: ["deleted.py", "live.py"]
+    )
+
+    result, calls = _invoke_cli(
+        monkeypatch, DevrConfig(run_tests=False), ["check", "--changed", "--fast"]
+    )
 
     assert result.exit_code == 0
-    assert calls[0] == ("ruff", ["check", "live.py"])
-    assert calls[1] == ("ruff", ["format", "--check", "live.py"])
+    assert ("ruff", ["check", "live.py"]) in calls
+    assert ("ruff", ["format", "--check", "live.py"]) in calls
+    assert ("ruff", ["check", "deleted.py", "live.py"]) not in calls
 
 
-def test_check_fix_exits_when_ruff_fix_fails(monkeypatch, tmp_path: Path) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
+def test_check_fix_exits_when_ruff_fix_fails(monkeypatch, venv_path: Path) -> None:
+    monkeypatch.setattr(
+        "devr.checks.load_config", lambda _: DevrConfig(run_tests=False)
+    )
 
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
-    monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(run_tests=False))
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
+    codes = {("ruff", ("check", "--fix", ".")): 1}
 
     def _run_module(_venv, module: str, args: list[str], **_kwargs) -> int:
-        if module == "ruff" and args == ["check", "--fix", "."]:
-            return 1
-        return 0
+        return codes.get((module, tuple(args)), 0)
 
     monkeypatch.setattr("devr.cli.run_module", _run_module)
 
-    result = runner.invoke(app, ["check", "--fix", "--fast"])
+    result = runner.invoke(app, ["check", "--fix", "--fast"], catch_exceptions=False)
 
     assert result.exit_code == 1
 
 
-def test_check_fix_changed_scopes_ruff_targets(monkeypatch, tmp_path: Path) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
-    calls: list[tuple[str, list[str]]] = []
+def test_check_fix_changed_scopes_ruff_targets(
+    monkeypatch, tmp_path: Path, venv_path: Path
+) -> None:
+    calls = _record_run_module(monkeypatch)
     (tmp_path / "a.py").write_text("print('a')\n", encoding="utf-8")
     (tmp_path / "b.pyi").write_text("def f() -> None: ...\n", encoding="utf-8")
 
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
-    monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(run_tests=False))
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
     monkeypatch.setattr(
-        "devr.cli._staged_files", lambda _: ["a.py", "notes.md", "b.pyi"]
+        "devr.checks.load_config", lambda _: DevrConfig(run_tests=False)
+    )
+    monkeypatch.setattr(
+        "devr.checks._staged_files", lambda *_: ["a.py", "notes.md", "b.pyi"]
     )
 
-    def _run_module(_venv, module: str, args: list[str], **_kwargs) -> int:
-        calls.append((module, args))
-        return 0
-
-    monkeypatch.setattr("devr.cli.run_module", _run_module)
-
-    result = runner.invoke(app, ["check", "--fix", "--changed", "--staged", "--fast"])
+    result = runner.invoke(
+        app,
+        ["check", "--fix", "--changed", "--staged", "--fast"],
+        catch_exceptions=False,
+    )
 
     assert result.exit_code == 0
     assert calls[0] == ("ruff", ["check", "--fix", "a.py", "b.pyi"])
     assert calls[1] == ("ruff", ["format", "a.py", "b.pyi"])
 
 
-def test_fix_exits_when_black_format_fails(monkeypatch, tmp_path: Path) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
-
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
+def test_fix_exits_when_black_format_fails(monkeypatch, venv_path: Path) -> None:
     monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(formatter="black"))
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
+
+    codes = {("black", (".",)): 2}
 
     def _run_module(_venv, module: str, args: list[str], **_kwargs) -> int:
-        if module == "black" and args == ["."]:
-            return 2
-        return 0
+        return codes.get((module, tuple(args)), 0)
 
     monkeypatch.setattr("devr.cli.run_module", _run_module)
 
-    result = runner.invoke(app, ["fix"])
+    result = runner.invoke(app, ["fix"], catch_exceptions=False)
 
     assert result.exit_code == 2
 
 
-def test_changed_files_falls_back_when_head_missing(
+def test_changed_files_includes_staged_entries_without_head(
     monkeypatch, tmp_path: Path
 ) -> None:
-    responses = [
-        SimpleNamespace(returncode=1, stdout=""),
-        SimpleNamespace(returncode=0, stdout="tracked.py\n"),
-        SimpleNamespace(returncode=0, stdout="staged.py\n"),
-        SimpleNamespace(returncode=0, stdout="new.py\n"),
-    ]
     monkeypatch.setattr(
-        "devr.cli.subprocess.run", lambda *args, **kwargs: responses.pop(0)
+        "devr.checks.subprocess.Popen",
+        lambda *args, **kwargs: _FakeGitProcess(
+            b"A  staged.py\0AM tracked.py\0?? new.py\0"
+        ),
     )
 
-    from devr.cli import _changed_files
-
-    assert _changed_files(tmp_path) == ["tracked.py", "staged.py", "new.py"]
+    assert _changed_files(tmp_path) == ["staged.py", "tracked.py", "new.py"]
 
 
 def test_changed_files_returns_empty_when_git_is_unavailable(
@@ -1047,27 +1736,48 @@ def test_changed_files_returns_empty_when_git_is_unavailable(
     def _raise(*_args, **_kwargs):
         raise FileNotFoundError
 
-    monkeypatch.setattr("devr.cli.subprocess.run", _raise)
-
-    from devr.cli import _changed_files
+    monkeypatch.setattr("devr.checks.subprocess.Popen", _raise)
 
     assert _changed_files(tmp_path) == []
 
 
-def test_changed_files_keeps_tracked_when_untracked_lookup_fails(
+def test_changed_files_uses_new_path_for_renames(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(
+        "devr.checks.subprocess.Popen",
+        lambda *args, **kwargs: _FakeGitProcess(b"R  new.py\0old.py\0 M other.py\0"),
+    )
+
+    assert _changed_files(tmp_path) == ["new.py", "other.py"]
+    assert _staged_files(tmp_path) == ["new.py"]
+
+
+def test_git_status_parses_records_split_across_read_chunks(
     monkeypatch, tmp_path: Path
 ) -> None:
-    responses = [
-        SimpleNamespace(returncode=0, stdout="tracked.py\n"),
-        SimpleNamespace(returncode=1, stdout=""),
-    ]
     monkeypatch.setattr(
-        "devr.cli.subprocess.run", lambda *args, **kwargs: responses.pop(0)
+        "devr.checks.subprocess.Popen",
+        lambda *_args, **_kwargs: _FakeGitProcess(
+            b"M  pkg/first.py\0R  new.py\0old.py\0?? tail.py"
+        ),
     )
+    monkeypatch.setattr("devr.checks._GIT_READ_SIZE", 3)
+
+    assert _changed_files(tmp_path) == ["pkg/first.py", "new.py", "tail.py"]
+
+
+def test_git_status_is_reused_through_cache(monkeypatch, tmp_path: Path) -> None:
+    calls: list[list[str]] = []
 
-    from devr.cli import _changed_files
+    def _popen(args: list[str], **_kwargs):
+        calls.append(args)
+        return _FakeGitProcess(b"M  a.py\0?? b.py\0")
+
+    monkeypatch.setattr("devr.checks.subprocess.Popen", _popen)
 
-    assert _changed_files(tmp_path) == ["tracked.py"]
+    cache: dict = {}
+    assert _staged_files(tmp_path, cache) == ["a.py"]
+    assert _changed_files(tmp_path, cache) == ["a.py", "b.py"]
+    assert len(calls) == 1
 
 
 def test_project_root_prefers_nearest_pyproject(monkeypatch, tmp_path: Path) -> None:
@@ -1080,10 +1790,29 @@ def test_project_root_prefers_nearest_pyproject(monkeypatch, tmp_path: Path) ->
 
     monkeypatch.chdir(nested)
 
-    from devr.cli import project_root
+    assert project_root() == project.resolve()
+
+
+def test_project_root_is_memoized_per_working_directory(
+    monkeypatch, tmp_path: Path
+) -> None:
+    project = tmp_path / "project"
+    nested = project / "pkg"
+    nested.mkdir(parents=True)
+    (project / "pyproject.toml").write_text(
+        "[project]\nname='demo'\n", encoding="utf-8"
+    )
+
+    monkeypatch.chdir(nested)
+    assert project_root() == project.resolve()
 
+    # A marker added later is only seen once the memo is cleared.
+    (nested / "pyproject.toml").write_text("[project]\nname='pkg'\n", encoding="utf-8")
     assert project_root() == project.resolve()
 
+    _project_root_for.cache_clear()
+    assert project_root() == nested.resolve()
+
 
 def test_project_root_falls_back_to_cwd_when_no_markers(
     monkeypatch, tmp_path: Path
@@ -1093,18 +1822,19 @@ def test_project_root_falls_back_to_cwd_when_no_markers(
 
     monkeypatch.chdir(plain)
 
-    from devr.cli import project_root
-
     assert project_root() == plain.resolve()
 
 
 def test_staged_files_returns_empty_on_git_timeout(monkeypatch, tmp_path: Path) -> None:
-    def _raise(*_args, **_kwargs):
-        raise subprocess.TimeoutExpired(cmd="git", timeout=10)
+    real_popen = subprocess.Popen
 
-    monkeypatch.setattr("devr.cli.subprocess.run", _raise)
+    def _slow_git(_args: list[str], **kwargs):
+        return real_popen(
+            [sys.executable, "-c", "import time; time.sleep(30)"], **kwargs
+        )
 
-    from devr.cli import _staged_files
+    monkeypatch.setattr("devr.checks.subprocess.Popen", _slow_git)
+    monkeypatch.setattr("devr.checks._GIT_TIMEOUT_SECONDS", 0.2)
 
     assert _staged_files(tmp_path) == []
 
@@ -1115,29 +1845,27 @@ def test_changed_files_returns_empty_on_git_timeout(
     def _raise(*_args, **_kwargs):
         raise subprocess.TimeoutExpired(cmd="git", timeout=10)
 
-    monkeypatch.setattr("devr.cli.subprocess.run", _raise)
-
-    from devr.cli import _changed_files
+    monkeypatch.setattr("devr.checks.subprocess.Popen", _raise)
 
     assert _changed_files(tmp_path) == []
 
 
 def test_check_changed_warns_when_git_state_unavailable(
-    monkeypatch, tmp_path: Path
+    monkeypatch, venv_path: Path
 ) -> None:
-    venv_path = (tmp_path / ".venv").resolve()
-
-    monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
-    monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(run_tests=False))
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: venv_path)
-    monkeypatch.setattr("devr.cli._changed_files", lambda *_: [])
     monkeypatch.setattr(
-        "devr.cli._run_git",
+        "devr.checks.load_config", lambda _: DevrConfig(run_tests=False)
+    )
+    monkeypatch.setattr("devr.checks._changed_files", lambda *_: [])
+    monkeypatch.setattr(
+        "devr.checks._run_git",
         lambda _root, _args: None,
     )
     monkeypatch.setattr("devr.cli.run_module", lambda *_args, **_kwargs: 0)
 
-    result = runner.invoke(app, ["check", "--changed", "--fast"])
+    result = runner.invoke(
+        app, ["check", "--changed", "--fast"], catch_exceptions=False
+    )
 
     assert result.exit_code == 0
     assert (
@@ -1147,11 +1875,27 @@ def test_check_changed_warns_when_git_state_unavailable(
 
 
 def test_warn_if_venv_path_outside_root_ignores_in_project_path(tmp_path: Path) -> None:
-    from devr.cli import _warn_if_venv_path_outside_root
-
     _warn_if_venv_path_outside_root(tmp_path, ".venv")
 
 
+def test_venv_path_outside_root_warning_is_resolved_once(
+    monkeypatch, tmp_path: Path, capsys
+) -> None:
+    resolutions: list[str] = []
+
+    def _resolve(root: Path, configured: str) -> Path:
+        resolutions.append(configured)
+        return tmp_path.parent / "shared-venv"
+
+    monkeypatch.setattr("devr.checks._resolve_configured_venv_path", _resolve)
+
+    _warn_if_venv_path_outside_root(tmp_path, "../shared-venv")
+    _warn_if_venv_path_outside_root(tmp_path, "../shared-venv")
+
+    assert resolutions == ["../shared-venv"]
+    assert capsys.readouterr().out.count("resolves outside project root") == 2
+
+
 def test_check_warns_when_configured_venv_path_is_outside_root(
     monkeypatch, tmp_path: Path
 ) -> None:
@@ -1159,16 +1903,38 @@ def test_check_warns_when_configured_venv_path_is_outside_root(
 
     monkeypatch.setattr("devr.cli.project_root", lambda: tmp_path)
     monkeypatch.setattr(
-        "devr.cli.load_config",
+        "devr.checks.load_config",
         lambda _: DevrConfig(venv_path="../shared-venv", run_tests=False),
     )
-    monkeypatch.setattr("devr.cli.find_venv", lambda *_: outside_venv)
+    monkeypatch.setattr("devr.checks.find_venv", lambda *_: outside_venv)
     monkeypatch.setattr("devr.cli.run_module", lambda *_args, **_kwargs: 0)
 
-    result = runner.invoke(app, ["check", "--fast"])
+    result = runner.invoke(app, ["check", "--fast"], catch_exceptions=False)
 
     assert result.exit_code == 0
     assert (
         "Warning: configured venv_path '../shared-venv' resolves outside"
         in result.output
     )
+
+
+def test_security_runs_scanners_concurrently_and_replays_output_in_order(
+    monkeypatch, venv_path: Path
+) -> None:
+    both_started = threading.Barrier(2, timeout=5)
+
+    def _run_module(_venv, module: str, _args: list[str], **kwargs) -> int:
+        both_started.wait()
+        kwargs["output"].write(f"{module} output\n".encode())
+        return 0
+
+    monkeypatch.setattr("devr.cli.load_config", lambda _: DevrConfig(venv_path=".venv"))
+    monkeypatch.setattr("devr.cli.run_module", _run_module)
+
+    result = runner.invoke(app, ["security", "--no-cache"], catch_exceptions=False)
+
+    assert result.exit_code == 0
+    assert result.output.index("pip_audit output") < result.output.index(
+        "Stage: bandit"
+    )
+    assert result.output.index("Stage: bandit") < result.output.index("bandit output")
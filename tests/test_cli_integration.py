@@ -2,51 +2,110 @@
 
 from __future__ import annotations
 
+import os
+import shutil
 import subprocess
+import sys
 from pathlib import Path
 
+import pytest
+
 from typer.testing import CliRunner
 
 from devr.cli import app
-from devr.templates import DEFAULT_TOOLCHAIN
+from devr.templates import BOOTSTRAP_MIN_VERSIONS, DEFAULT_TOOLCHAIN
 
 runner = CliRunner()
 
 
+# Commit identity via the environment so repo setup needs no ``git config``
+# calls, with user and system config ignored so local settings cannot leak in.
+_GIT_ENV = {
+    **os.environ,
+    "GIT_AUTHOR_NAME": "devr-tests",
+    "GIT_AUTHOR_EMAIL": "devr@example.com",
+    "GIT_COMMITTER_NAME": "devr-tests",
+    "GIT_COMMITTER_EMAIL": "devr@example.com",
+    "GIT_CONFIG_GLOBAL": os.devnull,
+    "GIT_CONFIG_SYSTEM": os.devnull,
+}
+
+
 def _git(repo: Path, *args: str) -> None:
-    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True)
+    subprocess.run(
+        ["git", *args],
+        cwd=repo,
+        env=_GIT_ENV,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
 
 
-def _init_git_repo(repo: Path) -> None:
-    _git(repo, "init")
-    _git(repo, "config", "user.email", "devr@example.com")
-    _git(repo, "config", "user.name", "devr-tests")
+@pytest.fixture(scope="session")
+def _git_template(tmp_path_factory) -> Path:
+    """Initialise one empty repository whose ``.git`` each test copies."""
+    template = tmp_path_factory.mktemp("git-template")
+    _git(template, "init", "-q", "--initial-branch=main")
+    return template / ".git"
+
+
+@pytest.fixture
+def repo(tmp_path: Path, _git_template: Path) -> Path:
+    """Return ``tmp_path`` as a fresh, empty git repository."""
+    shutil.copytree(_git_template, tmp_path / ".git")
+    return tmp_path
 
 
 def _fake_venv_python(repo: Path) -> Path:
     py = repo / ".venv" / "bin" / "python"
     py.parent.mkdir(parents=True, exist_ok=True)
-    py.write_text("", encoding="utf-8")
+    py.touch()
     return py
 
 
 def test_check_changed_in_temp_git_repo_scopes_python_targets(
-    monkeypatch, tmp_path: Path
+    monkeypatch, repo: Path
 ) -> None:
-    _init_git_repo(tmp_path)
-    _fake_venv_python(tmp_path)
-
-    tracked_py = tmp_path / "tracked.py"
-    tracked_py.write_text("value = 1\n", encoding="utf-8")
-    (tmp_path / "notes.md").write_text("initial\n", encoding="utf-8")
-    _git(tmp_path, "add", "tracked.py", "notes.md")
-    _git(tmp_path, "commit", "-m", "initial")
-
-    tracked_py.write_text("value = 2\n", encoding="utf-8")
-    (tmp_path / "new_module.pyi").write_text(
-        "def run() -> None: ...\n", encoding="utf-8"
+    _fake_venv_python(repo)
+
+    tracked_py = repo / "tracked.py"
+    tracked_py.write_bytes(b"value = 1\n")
+    (repo / "notes.md").write_bytes(b"initial\n")
+    _git(repo, "add", "tracked.py", "notes.md")
+    _git(repo, "commit", "-q", "-m", "initial")
+
+    tracked_py.write_bytes(b"value = 2\n")
+    (repo / "new_module.pyi").write_bytes(b"def run() -> None: ...\n")
+    (repo / "todo.txt").write_bytes(b"todo\n")
+
+    calls: list[tuple[str, list[str]]] = []
+
+    def _run_module(_venv, module: str, args: list[str], **_kwargs) -> int:
+        calls.append((module, args))
+        return 0
+
+    monkeypatch.chdir(repo)
+    monkeypatch.setattr("devr.cli.run_module", _run_module)
+
+    result = runner.invoke(
+        app, ["check", "--changed", "--fast"], catch_exceptions=False
     )
-    (tmp_path / "todo.txt").write_text("todo\n", encoding="utf-8")
+
+    assert result.exit_code == 0
+    assert sorted(calls) == [
+        ("mypy", ["--follow-imports=silent", "new_module.pyi", "tracked.py"]),
+        ("ruff", ["check", "new_module.pyi", "tracked.py"]),
+        ("ruff", ["format", "--check", "new_module.pyi", "tracked.py"]),
+    ]
+
+
+def test_check_staged_changed_in_repo_without_commits(monkeypatch, repo: Path) -> None:
+    _fake_venv_python(repo)
+
+    (repo / "staged.py").write_bytes(b"value = 1\n")
+    (repo / "unstaged.py").write_bytes(b"value = 2\n")
+    _git(repo, "add", "staged.py")
 
     calls: list[tuple[str, list[str]]] = []
 
@@ -54,50 +113,114 @@ def test_check_changed_in_temp_git_repo_scopes_python_targets(
         calls.append((module, args))
         return 0
 
-    monkeypatch.chdir(tmp_path)
+    monkeypatch.chdir(repo)
     monkeypatch.setattr("devr.cli.run_module", _run_module)
 
-    result = runner.invoke(app, ["check", "--changed", "--fast"])
+    result = runner.invoke(
+        app, ["check", "--staged", "--changed", "--fast"], catch_exceptions=False
+    )
 
     assert result.exit_code == 0
-    assert calls == [
-        ("ruff", ["check", "tracked.py", "new_module.pyi"]),
-        ("ruff", ["format", "--check", "tracked.py", "new_module.pyi"]),
-        ("mypy", ["tracked.py", "new_module.pyi"]),
+    assert ("ruff", ["check", "staged.py"]) in calls
+    assert ("mypy", ["--follow-imports=silent", "staged.py"]) in calls
+
+
+def test_check_changed_in_temp_git_repo_uses_renamed_paths(
+    monkeypatch, repo: Path
+) -> None:
+    _fake_venv_python(repo)
+
+    (repo / "old_name.py").write_bytes(b"value = 1\n")
+    _git(repo, "add", "old_name.py")
+    _git(repo, "commit", "-q", "-m", "initial")
+    _git(repo, "mv", "old_name.py", "new_name.py")
+
+    calls: list[tuple[str, list[str]]] = []
+
+    def _run_module(_venv, module: str, args: list[str], **_kwargs) -> int:
+        calls.append((module, args))
+        return 0
+
+    monkeypatch.chdir(repo)
+    monkeypatch.setattr("devr.cli.run_module", _run_module)
+
+    result = runner.invoke(
+        app, ["check", "--staged", "--changed", "--fast"], catch_exceptions=False
+    )
+
+    assert result.exit_code == 0
+    assert sorted(calls) == [
+        ("mypy", ["--follow-imports=silent", "new_name.py"]),
+        ("ruff", ["check", "new_name.py"]),
+        ("ruff", ["format", "--check", "new_name.py"]),
     ]
 
 
-def test_init_in_temp_git_repo_writes_precommit_and_installs_hook(
-    monkeypatch, tmp_path: Path
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="needs byte-transparent filenames"
+)
+def test_check_changed_in_temp_git_repo_keeps_non_utf8_filenames(
+    monkeypatch, repo: Path
 ) -> None:
-    _init_git_repo(tmp_path)
-    (tmp_path / "pyproject.toml").write_text(
-        "[project]\nname='sample'\n", encoding="utf-8"
+    _fake_venv_python(repo)
+
+    raw_name = b"caf\xe9.py"
+    with open(os.path.join(os.fsencode(repo), raw_name), "wb") as handle:
+        handle.write(b"value = 1\n")
+
+    calls: list[tuple[str, list[str]]] = []
+
+    def _run_module(_venv, module: str, args: list[str], **_kwargs) -> int:
+        calls.append((module, args))
+        return 0
+
+    monkeypatch.chdir(repo)
+    monkeypatch.setattr("devr.cli.run_module", _run_module)
+
+    result = runner.invoke(
+        app, ["check", "--changed", "--fast"], catch_exceptions=False
     )
 
+    assert result.exit_code == 0
+    assert ("ruff", ["check", os.fsdecode(raw_name)]) in calls
+
+
+def test_init_in_temp_git_repo_writes_precommit_and_installs_hook(
+    monkeypatch, repo: Path
+) -> None:
+    (repo / "pyproject.toml").write_bytes(b"[project]\nname='sample'\n")
+
     calls: list[tuple[str, list[str]]] = []
 
     def _create_venv(_root: Path, venv_dir: Path, python_exe=None) -> None:
         del python_exe
         py = venv_dir / "bin" / "python"
         py.parent.mkdir(parents=True, exist_ok=True)
-        py.write_text("", encoding="utf-8")
+        py.touch()
 
     def _run_module(_venv, module: str, args: list[str], **_kwargs) -> int:
         calls.append((module, args))
         return 0
 
-    monkeypatch.chdir(tmp_path)
+    monkeypatch.chdir(repo)
     monkeypatch.setattr("devr.cli.create_venv", _create_venv)
     monkeypatch.setattr("devr.cli.run_module", _run_module)
 
-    result = runner.invoke(app, ["init"])
+    result = runner.invoke(app, ["init"], catch_exceptions=False)
 
     assert result.exit_code == 0
-    assert (tmp_path / ".pre-commit-config.yaml").exists()
+    assert (repo / ".pre-commit-config.yaml").exists()
     assert calls == [
-        ("pip", ["install", "-U", "pip", "setuptools", "wheel"]),
-        ("pip", ["install", *DEFAULT_TOOLCHAIN]),
-        ("pip", ["install", "-e", "."]),
+        (
+            "pip",
+            [
+                "install",
+                "--disable-pip-version-check",
+                "--no-input",
+                *(f"{name}>={floor}" for name, floor in BOOTSTRAP_MIN_VERSIONS.items()),
+                *DEFAULT_TOOLCHAIN,
+            ],
+        ),
+        ("pip", ["install", "--disable-pip-version-check", "--no-input", "-e", "."]),
         ("pre_commit", ["install"]),
     ]
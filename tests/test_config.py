@@ -1,9 +1,15 @@
 """Configuration parsing tests for devr."""
 
+import subprocess
+import sys
 from pathlib import Path
 
+import pytest
+
 from devr.config import DevrConfig, load_config
 
+_DEFAULTS = DevrConfig()
+
 
 def _write_pyproject(tmp_path: Path, content: str) -> None:
     (tmp_path / "pyproject.toml").write_text(content, encoding="utf-8")
@@ -11,7 +17,7 @@ def _write_pyproject(tmp_path: Path, content: str) -> None:
 
 def test_load_config_defaults_when_missing() -> None:
     cfg = load_config(Path("/tmp/non-existent-config-root"))
-    assert cfg == DevrConfig()
+    assert cfg == _DEFAULTS
 
 
 def test_load_config_parses_string_booleans_and_ints(tmp_path: Path) -> None:
@@ -32,115 +38,226 @@ run_tests = "true"
     assert cfg.run_tests is True
 
 
-def test_load_config_invalid_values_fall_back_to_defaults(tmp_path: Path) -> None:
+def test_load_config_parses_changed_only(tmp_path: Path) -> None:
     _write_pyproject(
         tmp_path,
         """
 [tool.devr]
+changed_only = "yes"
+""",
+    )
+
+    cfg = load_config(tmp_path)
+
+    assert cfg.changed_only is True
+    assert _DEFAULTS.changed_only is False
+
+
+def test_load_config_parses_parallel_tests(tmp_path: Path) -> None:
+    _write_pyproject(
+        tmp_path,
+        """
+[tool.devr]
+parallel_tests = "off"
+""",
+    )
+
+    cfg = load_config(tmp_path)
+
+    assert cfg.parallel_tests is False
+    assert _DEFAULTS.parallel_tests is True
+
+
+@pytest.mark.parametrize(
+    ("content", "fields"),
+    [
+        pytest.param(
+            """
+[tool.devr]
 formatter = "flake8"
 typechecker = "pyre"
 coverage_min = -10
 coverage_branch = "not-a-bool"
 run_tests = "not-a-bool"
 """,
-    )
+            (
+                "formatter",
+                "typechecker",
+                "coverage_min",
+                "coverage_branch",
+                "run_tests",
+            ),
+            id="invalid-values",
+        ),
+        pytest.param(
+            "[tool.devr]\ncoverage_branch = 2\nrun_tests = -1\n",
+            ("coverage_branch", "run_tests"),
+            id="non-binary-integer-booleans",
+        ),
+        pytest.param(
+            "[tool.devr]\ncoverage_min = true\n",
+            ("coverage_min",),
+            id="boolean-for-integer",
+        ),
+        pytest.param(
+            "[tool.devr]\ncoverage_min = 85.5\n",
+            ("coverage_min",),
+            id="float-for-integer",
+        ),
+        pytest.param(
+            '[tool.devr]\nvenv_path = "  "\n',
+            ("venv_path",),
+            id="blank-venv-path",
+        ),
+    ],
+)
+def test_load_config_invalid_values_fall_back_to_defaults(
+    tmp_path: Path, content: str, fields: tuple[str, ...]
+) -> None:
+    _write_pyproject(tmp_path, content)
 
     cfg = load_config(tmp_path)
-    defaults = DevrConfig()
 
-    assert cfg.formatter == defaults.formatter
-    assert cfg.typechecker == defaults.typechecker
-    assert cfg.coverage_min == defaults.coverage_min
-    assert cfg.coverage_branch == defaults.coverage_branch
-    assert cfg.run_tests == defaults.run_tests
+    for field in fields:
+        assert getattr(cfg, field) == getattr(_DEFAULTS, field), field
 
 
-def test_load_config_rejects_non_binary_integer_booleans(tmp_path: Path) -> None:
+def test_load_config_normalizes_string_values(tmp_path: Path) -> None:
     _write_pyproject(
         tmp_path,
         """
 [tool.devr]
-coverage_branch = 2
-run_tests = -1
+venv_path = "  custom-venv  "
+formatter = "RuFf"
+typechecker = " PyRiGhT "
 """,
     )
 
     cfg = load_config(tmp_path)
-    defaults = DevrConfig()
 
-    assert cfg.coverage_branch == defaults.coverage_branch
-    assert cfg.run_tests == defaults.run_tests
+    assert cfg.venv_path == "custom-venv"
+    assert cfg.formatter == "ruff"
+    assert cfg.typechecker == "pyright"
 
 
-def test_load_config_rejects_boolean_for_integer_fields(tmp_path: Path) -> None:
+def test_load_config_invalid_toml_falls_back_to_defaults(tmp_path: Path) -> None:
     _write_pyproject(
         tmp_path,
         """
-[tool.devr]
-coverage_min = true
+[tool.devr
+invalid = true
 """,
     )
 
     cfg = load_config(tmp_path)
 
-    assert cfg.coverage_min == DevrConfig().coverage_min
+    assert cfg == _DEFAULTS
 
 
-def test_load_config_rejects_float_for_integer_fields(tmp_path: Path) -> None:
+def test_load_config_detects_coverage_target_from_project_name(tmp_path: Path) -> None:
+    (tmp_path / "src" / "my_pkg").mkdir(parents=True)
+    (tmp_path / "src" / "my_pkg" / "__init__.py").touch()
     _write_pyproject(
         tmp_path,
         """
-[tool.devr]
-coverage_min = 85.5
+[project]
+name = "My-Pkg"
 """,
     )
 
-    cfg = load_config(tmp_path)
-
-    assert cfg.coverage_min == DevrConfig().coverage_min
+    assert load_config(tmp_path).coverage_targets == ("src/my_pkg",)
 
 
-def test_load_config_normalizes_string_values(tmp_path: Path) -> None:
+def test_load_config_non_table_devr_still_detects_coverage_target(
+    tmp_path: Path,
+) -> None:
+    (tmp_path / "my_pkg").mkdir()
+    (tmp_path / "my_pkg" / "__init__.py").touch()
     _write_pyproject(
         tmp_path,
         """
-[tool.devr]
-venv_path = "  custom-venv  "
-formatter = "RuFf"
-typechecker = " PyRiGhT "
+[project]
+name = "my-pkg"
+
+[tool]
+devr = "not-a-table"
 """,
     )
 
     cfg = load_config(tmp_path)
 
-    assert cfg.venv_path == "custom-venv"
-    assert cfg.formatter == "ruff"
-    assert cfg.typechecker == "pyright"
+    assert cfg == DevrConfig(coverage_targets=("my_pkg",))
 
 
-def test_load_config_invalid_venv_path_falls_back_to_default(tmp_path: Path) -> None:
+def test_load_config_parses_coverage_targets(tmp_path: Path) -> None:
     _write_pyproject(
         tmp_path,
         """
 [tool.devr]
-venv_path = "  "
+coverage_targets = ["app", " lib "]
 """,
     )
 
-    cfg = load_config(tmp_path)
-
-    assert cfg.venv_path == DevrConfig().venv_path
+    assert load_config(tmp_path).coverage_targets == ("app", "lib")
 
-
-def test_load_config_invalid_toml_falls_back_to_defaults(tmp_path: Path) -> None:
     _write_pyproject(
         tmp_path,
         """
-[tool.devr
-invalid = true
+[tool.devr]
+coverage_targets = ["app", 3]
 """,
     )
 
-    cfg = load_config(tmp_path)
+    assert load_config(tmp_path).coverage_targets == ()
+
+
+def test_load_config_reuses_parse_until_pyproject_changes(
+    monkeypatch, tmp_path: Path
+) -> None:
+    _write_pyproject(tmp_path, "[tool.devr]\ncoverage_min = 70\n")
+    parses: list[Path] = []
+    from devr.config import _read_config as read_config
+
+    def _counting_read(pyproject: Path):
+        parses.append(pyproject)
+        return read_config(pyproject)
+
+    monkeypatch.setattr("devr.config._read_config", _counting_read)
+
+    assert load_config(tmp_path).coverage_min == 70
+    assert load_config(tmp_path).coverage_min == 70
+    assert len(parses) == 1
+
+    _write_pyproject(tmp_path, "[tool.devr]\ncoverage_min = 100\n")
+
+    assert load_config(tmp_path).coverage_min == 100
+    assert len(parses) == 2
+
+
+def test_load_config_detects_coverage_targets_created_after_first_load(
+    tmp_path: Path,
+) -> None:
+    _write_pyproject(tmp_path, '[project]\nname = "my-pkg"\n')
+
+    assert load_config(tmp_path).coverage_targets == ()
+
+    package = tmp_path / "src" / "my_pkg"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("", encoding="utf-8")
+
+    assert load_config(tmp_path).coverage_targets == ("src/my_pkg",)
+
+
+def test_importing_config_does_not_import_toml_parser() -> None:
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, devr.config; print('tomllib' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
 
-    assert cfg == DevrConfig()
+    assert proc.stdout.strip() == "False"
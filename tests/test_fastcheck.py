@@ -0,0 +1,135 @@
+"""Behavior tests for the Typer-free devr-fastcheck entry point."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from devr.config import DevrConfig
+from devr.fastcheck import main
+
+
+def _patch_run_module(monkeypatch, calls: list[tuple[str, list[str]]], code: int = 0):
+    def _run_module(_venv, module: str, args: list[str], **_kwargs) -> int:
+        calls.append((module, args))
+        return code
+
+    monkeypatch.setattr("devr.fastcheck.run_module", _run_module)
+
+
+def test_fastcheck_does_not_import_typer() -> None:
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, devr.fastcheck; print('typer' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert proc.stdout.strip() == "False"
+
+
+def test_fastcheck_runs_same_stages_as_check(
+    monkeypatch, tmp_path: Path, capsys
+) -> None:
+    venv_path = tmp_path / ".venv"
+    calls: list[tuple[str, list[str]]] = []
+
+    monkeypatch.setattr("devr.fastcheck.project_root", lambda: tmp_path)
+    monkeypatch.setattr(
+        "devr.checks.load_config",
+        lambda _: DevrConfig(coverage_branch=False, coverage_min=90),
+    )
+    monkeypatch.setattr("devr.checks.find_venv", lambda *_: venv_path)
+    _patch_run_module(monkeypatch, calls)
+
+    assert main([]) == 0
+
+    assert [module for module, _ in calls] == ["ruff", "ruff", "mypy", "pytest"]
+    assert calls[-1] == (
+        "pytest",
+        ["--cov=.", "--cov-report=term-missing", "--cov-fail-under=90"],
+    )
+    assert "devr check passed" in capsys.readouterr().out
+
+
+def test_fastcheck_staged_changed_scopes_to_staged_python_files(
+    monkeypatch, tmp_path: Path
+) -> None:
+    venv_path = tmp_path / ".venv"
+    (tmp_path / "a.py").write_text("x = 1\n", encoding="utf-8")
+    calls: list[tuple[str, list[str]]] = []
+
+    monkeypatch.setattr("devr.fastcheck.project_root", lambda: tmp_path)
+    monkeypatch.setattr("devr.checks.load_config", lambda _: DevrConfig())
+    monkeypatch.setattr("devr.checks.find_venv", lambda *_: venv_path)
+    monkeypatch.setattr("devr.checks._staged_files", lambda *_: ["a.py", "b.md"])
+    _patch_run_module(monkeypatch, calls)
+
+    assert main(["--staged", "--changed", "--fast"]) == 0
+
+    assert calls == [
+        ("ruff", ["check", "a.py"]),
+        ("ruff", ["format", "--check", "a.py"]),
+        ("mypy", ["--follow-imports=silent", "a.py"]),
+    ]
+
+
+def test_fastcheck_returns_failing_stage_code(monkeypatch, tmp_path: Path) -> None:
+    venv_path = tmp_path / ".venv"
+    calls: list[tuple[str, list[str]]] = []
+
+    monkeypatch.setattr("devr.fastcheck.project_root", lambda: tmp_path)
+    monkeypatch.setattr("devr.checks.load_config", lambda _: DevrConfig())
+    monkeypatch.setattr("devr.checks.find_venv", lambda *_: venv_path)
+    _patch_run_module(monkeypatch, calls, code=3)
+
+    assert main(["--no-tests"]) == 3
+    assert "pytest" not in [module for module, _ in calls]
+
+
+def test_fastcheck_reports_missing_venv(monkeypatch, tmp_path: Path, capsys) -> None:
+    monkeypatch.setattr("devr.fastcheck.project_root", lambda: tmp_path)
+    monkeypatch.setattr("devr.checks.load_config", lambda _: DevrConfig())
+    monkeypatch.setattr("devr.checks.find_venv", lambda *_: None)
+
+    assert main([]) == 2
+    assert "No venv found. Run: devr init" in capsys.readouterr().out
+
+
+def test_fastcheck_exits_before_config_when_no_python_files_changed(
+    monkeypatch, tmp_path: Path, capsys
+) -> None:
+    def _unexpected(*_args):
+        raise AssertionError("config and venv lookup should be skipped")
+
+    monkeypatch.setattr("devr.fastcheck.project_root", lambda: tmp_path)
+    monkeypatch.setattr("devr.checks.load_config", _unexpected)
+    monkeypatch.setattr("devr.checks.find_venv", _unexpected)
+    monkeypatch.setattr("devr.checks._staged_files", lambda *_: ["docs/index.md"])
+
+    assert main(["--staged", "--changed"]) == 0
+    assert "No changed Python files detected" in capsys.readouterr().out
+
+
+def test_fastcheck_warns_when_configured_venv_path_is_outside_root(
+    monkeypatch, tmp_path: Path, capsys
+) -> None:
+    venv_path = tmp_path / ".venv"
+    calls: list[tuple[str, list[str]]] = []
+
+    monkeypatch.setattr("devr.fastcheck.project_root", lambda: tmp_path)
+    monkeypatch.setattr(
+        "devr.checks.load_config",
+        lambda _: DevrConfig(venv_path="../shared-venv", run_tests=False),
+    )
+    monkeypatch.setattr("devr.checks.find_venv", lambda *_: venv_path)
+    _patch_run_module(monkeypatch, calls)
+
+    assert main([]) == 0
+    assert (
+        "Warning: configured venv_path '../shared-venv' resolves outside project root"
+        in capsys.readouterr().out
+    )
@@ -1,11 +1,14 @@
+import sys
 from pathlib import Path
 
 import pytest
 
+from devr import release_preflight
 from devr.release_preflight import (
     ReleasePreflightError,
     changelog_versions,
     project_version,
+    run_checked,
     validate_changelog,
 )
 
@@ -64,3 +67,114 @@ def test_changelog_versions_extracts_headings(tmp_path: Path) -> None:
     )
 
     assert changelog_versions(changelog) == ["Unreleased", "0.1.0", "0.0.9"]
+
+
+def test_changelog_versions_ignores_non_heading_lines(tmp_path: Path) -> None:
+    changelog = tmp_path / "CHANGELOG.md"
+    changelog.write_text(
+        "  ## [Unreleased]\n- see ## [0.0.1] notes\n### [0.0.2]\n## [0.1.0]\n",
+        encoding="utf-8",
+    )
+
+    assert changelog_versions(changelog) == ["Unreleased", "0.1.0"]
+
+
+def test_validate_changelog_reads_file_once(monkeypatch, tmp_path: Path) -> None:
+    changelog = tmp_path / "CHANGELOG.md"
+    changelog.write_text("## [Unreleased]\n\n## [0.1.0]\n", encoding="utf-8")
+    reads: list[Path] = []
+    read_text = Path.read_text
+
+    def _read_text(self: Path, *args, **kwargs) -> str:
+        reads.append(self)
+        return read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", _read_text)
+
+    validate_changelog(changelog, "0.1.0")
+
+    assert reads == [changelog]
+
+
+def test_smoke_test_artifact_installs_pip_and_artifact_in_one_pass(
+    monkeypatch, tmp_path: Path
+) -> None:
+    commands: list[list[str]] = []
+    monkeypatch.setattr(
+        release_preflight, "run_checked", lambda cmd, cwd, **_: commands.append(cmd)
+    )
+    artifact = tmp_path / "devr-0.1.0-py3-none-any.whl"
+
+    release_preflight.smoke_test_artifact(artifact, tmp_path)
+
+    installs = [cmd for cmd in commands if cmd[1:4] == ["-m", "pip", "install"]]
+    assert len(installs) == 1
+    assert installs[0][4:] == ["--upgrade", "pip", str(artifact)]
+
+
+def test_main_smoke_tests_wheel_and_sdist_in_one_venv(
+    monkeypatch, tmp_path: Path
+) -> None:
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nversion = "0.1.0"\n', encoding="utf-8"
+    )
+    (tmp_path / "CHANGELOG.md").write_text(
+        "## [Unreleased]\n\n## [0.1.0]\n", encoding="utf-8"
+    )
+    dist = tmp_path / "dist"
+    dist.mkdir()
+    (dist / "devr-0.0.9-py3-none-any.whl").touch()
+    commands: list[list[str]] = []
+
+    def _run_checked(cmd: list[str], cwd: Path, **_kwargs) -> None:
+        commands.append(cmd)
+        if cmd[1:] == ["-m", "build"]:
+            (dist / "devr-0.1.0-py3-none-any.whl").touch()
+            (dist / "devr-0.1.0.tar.gz").touch()
+
+    monkeypatch.setattr(release_preflight, "REPO_ROOT", tmp_path)
+    monkeypatch.setattr(release_preflight, "run_checked", _run_checked)
+    monkeypatch.setattr(release_preflight.metadata, "version", lambda _: "1.2.2")
+
+    assert release_preflight.main() == 0
+
+    assert [cmd[1:] for cmd in commands if "build" in cmd] == [["-m", "build"]]
+    assert len([cmd for cmd in commands if cmd[1:3] == ["-m", "venv"]]) == 1
+    installs = [cmd[4:] for cmd in commands if cmd[1:4] == ["-m", "pip", "install"]]
+    assert installs == [
+        ["--upgrade", "pip", str(dist / "devr-0.1.0-py3-none-any.whl")],
+        ["--force-reinstall", "--no-deps", str(dist / "devr-0.1.0.tar.gz")],
+    ]
+
+
+def test_run_checked_quiet_reports_stderr_only_on_failure(
+    tmp_path: Path, capsys
+) -> None:
+    noisy = "import sys; print('chat' + 'ter'); sys.stderr.write('bo' + 'om'); sys.exit({code})"
+
+    run_checked([sys.executable, "-c", noisy.format(code=0)], tmp_path, quiet=True)
+    out, err = capsys.readouterr()
+    assert "chatter" not in out
+    assert "boom" not in err
+
+    with pytest.raises(ReleasePreflightError, match="exit code 3"):
+        run_checked([sys.executable, "-c", noisy.format(code=3)], tmp_path, quiet=True)
+    assert "boom" in capsys.readouterr().err
+
+
+def test_main_requires_build_package(monkeypatch, tmp_path: Path) -> None:
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nversion = "0.1.0"\n', encoding="utf-8"
+    )
+    (tmp_path / "CHANGELOG.md").write_text(
+        "## [Unreleased]\n\n## [0.1.0]\n", encoding="utf-8"
+    )
+
+    def _missing(name: str) -> str:
+        raise release_preflight.metadata.PackageNotFoundError(name)
+
+    monkeypatch.setattr(release_preflight, "REPO_ROOT", tmp_path)
+    monkeypatch.setattr(release_preflight.metadata, "version", _missing)
+
+    with pytest.raises(ReleasePreflightError, match="'build' package"):
+        release_preflight.main()
@@ -1,5 +1,6 @@
 """Virtual environment helper behavior tests."""
 
+import sys
 from pathlib import Path
 
 from devr import venv
@@ -34,7 +35,7 @@ def test_venv_python_windows_path(monkeypatch, tmp_path: Path) -> None:
 def test_find_venv_prefers_configured_path(tmp_path: Path) -> None:
     configured = tmp_path / "custom-venv" / "bin"
     configured.mkdir(parents=True)
-    (configured / "python").write_text("", encoding="utf-8")
+    (configured / "python").touch()
 
     resolved = venv.find_venv(tmp_path, "custom-venv")
 
@@ -46,7 +47,7 @@ def test_find_venv_uses_active_venv_when_configured_missing(
 ) -> None:
     active_bin = tmp_path / ".active-venv" / "bin"
     active_bin.mkdir(parents=True)
-    (active_bin / "python").write_text("", encoding="utf-8")
+    (active_bin / "python").touch()
 
     monkeypatch.setattr(venv, "is_inside_venv", lambda: True)
     monkeypatch.setattr(venv.sys, "prefix", str(tmp_path / ".active-venv"))
@@ -63,7 +64,7 @@ def test_find_venv_skips_missing_active_venv_and_uses_defaults(
     monkeypatch.setattr(venv.sys, "prefix", str(tmp_path / ".missing-active"))
     fallback = tmp_path / ".venv" / "bin"
     fallback.mkdir(parents=True)
-    (fallback / "python").write_text("", encoding="utf-8")
+    (fallback / "python").touch()
 
     resolved = venv.find_venv(tmp_path, "missing")
 
@@ -74,7 +75,7 @@ def test_find_venv_falls_back_to_default_names(monkeypatch, tmp_path: Path) -> N
     monkeypatch.setattr(venv, "is_inside_venv", lambda: False)
     path = tmp_path / "venv" / "bin"
     path.mkdir(parents=True)
-    (path / "python").write_text("", encoding="utf-8")
+    (path / "python").touch()
 
     resolved = venv.find_venv(tmp_path, None)
 
@@ -87,6 +88,45 @@ def test_find_venv_returns_none_when_not_found(monkeypatch, tmp_path: Path) -> N
     assert venv.find_venv(tmp_path, None) is None
 
 
+def test_find_venv_skips_probes_for_absent_top_level_names(
+    monkeypatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(venv, "is_inside_venv", lambda: False)
+    (tmp_path / "src").mkdir()
+    probed: list[Path] = []
+
+    def _venv_python(venv_dir: Path) -> Path:
+        probed.append(venv_dir)
+        return venv_dir / "bin" / "python"
+
+    monkeypatch.setattr(venv, "venv_python", _venv_python)
+
+    assert venv.find_venv(tmp_path, "tools/venv") is None
+    assert venv.find_venv(tmp_path, "../shared-venv") is None
+
+    assert probed == [tmp_path / "../shared-venv"]
+
+
+def test_find_venv_probes_names_that_differ_only_in_case(
+    monkeypatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(venv, "is_inside_venv", lambda: False)
+    on_disk = tmp_path / ".venv" / "bin" / "python"
+    on_disk.parent.mkdir(parents=True)
+    on_disk.touch()
+    probed: list[Path] = []
+
+    # Stand in for a case-insensitive filesystem: every spelling finds ".venv".
+    def _venv_python(venv_dir: Path) -> Path:
+        probed.append(venv_dir)
+        return on_disk
+
+    monkeypatch.setattr(venv, "venv_python", _venv_python)
+
+    assert venv.find_venv(tmp_path, ".Venv") == (tmp_path / ".Venv").resolve()
+    assert probed == [tmp_path / ".Venv"]
+
+
 def test_create_venv_uses_configured_python(monkeypatch, tmp_path: Path) -> None:
     calls: list[list[str]] = []
 
@@ -125,7 +165,7 @@ def test_run_py_calls_subprocess_with_venv_python(monkeypatch, tmp_path: Path) -
 
     monkeypatch.setattr(venv, "venv_python", lambda _: Path("/tmp/python"))
 
-    def _call(args: list[str], cwd: str) -> int:
+    def _call(args: list[str], cwd: str, **_kwargs) -> int:
         calls.append((args, cwd))
         return 7
 
@@ -137,10 +177,29 @@ def test_run_py_calls_subprocess_with_venv_python(monkeypatch, tmp_path: Path) -
     assert calls == [(["/tmp/python", "-V"], str(tmp_path))]
 
 
+def test_run_py_redirects_output_when_requested(monkeypatch, tmp_path: Path) -> None:
+    calls: list[dict] = []
+    output = tmp_path / "out.log"
+
+    monkeypatch.setattr(venv, "venv_python", lambda _: Path("/tmp/python"))
+
+    def _call(_args: list[str], **kwargs) -> int:
+        calls.append(kwargs)
+        return 0
+
+    monkeypatch.setattr(venv.subprocess, "call", _call)
+
+    with output.open("wb") as handle:
+        venv.run_py(tmp_path / ".venv", ["-V"], cwd=tmp_path, output=handle)
+
+    assert calls[0]["stdout"] is handle
+    assert calls[0]["stderr"] == venv.subprocess.STDOUT
+
+
 def test_run_module_wraps_run_py(monkeypatch, tmp_path: Path) -> None:
     calls: list[tuple[Path, list[str], Path]] = []
 
-    def _run_py(venv_dir: Path, args: list[str], cwd: Path) -> int:
+    def _run_py(venv_dir: Path, args: list[str], cwd: Path, **_kwargs) -> int:
         calls.append((venv_dir, args, cwd))
         return 0
 
@@ -150,3 +209,94 @@ def test_run_module_wraps_run_py(monkeypatch, tmp_path: Path) -> None:
 
     assert code == 0
     assert calls == [(tmp_path / ".venv", ["-m", "ruff", "check", "."], tmp_path)]
+
+
+def test_venv_script_uses_python_directory(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(venv.os, "name", "posix")
+    assert venv.venv_script(tmp_path, "ruff") == tmp_path / "bin" / "ruff"
+
+    monkeypatch.setattr(venv.os, "name", "nt")
+    assert venv.venv_script(tmp_path, "ruff") == tmp_path / "Scripts" / "ruff.exe"
+
+
+def test_run_module_executes_native_ruff_binary(monkeypatch, tmp_path: Path) -> None:
+    calls: list[list[str]] = []
+    ruff_bin = tmp_path / ".venv" / "bin" / "ruff"
+    ruff_bin.parent.mkdir(parents=True)
+    ruff_bin.touch()
+
+    monkeypatch.setattr(venv.os, "name", "posix")
+
+    def _call(args: list[str], **_kwargs) -> int:
+        calls.append(args)
+        return 0
+
+    monkeypatch.setattr(venv.subprocess, "call", _call)
+
+    code = venv.run_module(tmp_path / ".venv", "ruff", ["check", "."], cwd=tmp_path)
+
+    assert code == 0
+    assert calls == [[str(ruff_bin), "check", "."]]
+
+
+def test_run_module_maps_modules_to_console_script_names(
+    monkeypatch, tmp_path: Path
+) -> None:
+    calls: list[list[str]] = []
+    bin_dir = tmp_path / ".venv" / "bin"
+    bin_dir.mkdir(parents=True)
+    for name in ("pip-audit", "pytest", "pip"):
+        (bin_dir / name).touch()
+
+    monkeypatch.setattr(venv.os, "name", "posix")
+
+    def _call(args: list[str], **_kwargs) -> int:
+        calls.append(args)
+        return 0
+
+    monkeypatch.setattr(venv.subprocess, "call", _call)
+
+    venv.run_module(tmp_path / ".venv", "pip_audit", [], cwd=tmp_path)
+    venv.run_module(tmp_path / ".venv", "pytest", ["-q"], cwd=tmp_path)
+    venv.run_module(tmp_path / ".venv", "pip", ["--version"], cwd=tmp_path)
+    venv.run_module(tmp_path / ".venv", "bandit", ["-r", "."], cwd=tmp_path)
+
+    python = (bin_dir / "python").as_posix()
+    assert calls == [
+        [str(bin_dir / "pip-audit")],
+        [python, "-m", "pytest", "-q"],
+        [python, "-m", "pip", "--version"],
+        [python, "-m", "bandit", "-r", "."],
+    ]
+
+
+def test_venv_package_versions_reports_installed_and_missing(
+    monkeypatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(venv, "venv_python", lambda _venv: Path(sys.executable))
+
+    versions = venv.venv_package_versions(tmp_path, ["pip", "devr-not-installed"])
+
+    assert versions is not None
+    assert versions["pip"]
+    assert versions["devr-not-installed"] == ""
+
+
+def test_venv_package_versions_returns_none_without_python(tmp_path: Path) -> None:
+    assert venv.venv_package_versions(tmp_path / "missing", ["pip"]) is None
+
+
+def test_venv_python_memoizes_existing_interpreter(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(venv.os, "name", "posix")
+    assert venv.venv_python(tmp_path) == tmp_path / "bin" / "python"
+
+    # A missing venv is not cached, so a later-created layout is picked up.
+    scripts = tmp_path / "Scripts"
+    scripts.mkdir()
+    (scripts / "python.exe").touch()
+    assert venv.venv_python(tmp_path) == scripts / "python.exe"
+
+    probes: list[Path] = []
+    monkeypatch.setattr(Path, "exists", lambda self: probes.append(self) or False)
+    assert venv.venv_python(tmp_path) == scripts / "python.exe"
+    assert probes == []